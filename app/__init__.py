@@ -1,8 +1,15 @@
 import os
 import sys
 
-from .initialization.installation_manager import InstallationManager
-
 execute_dir = os.path.split(os.path.realpath(sys.argv[0]))[0]
 
+
+def __getattr__(name):
+    # Deferred so that importing app submodules does not pull in the UI toolkit.
+    if name == "InstallationManager":
+        from .initialization.installation_manager import InstallationManager
+        return InstallationManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["InstallationManager", "execute_dir"]
@@ -1,5 +1,6 @@
 import asyncio
 import hashlib
+import json
 import logging
 import os
 import re
@@ -23,12 +24,15 @@ VIDEO_API_PORT = os.getenv("VIDEO_API_PORT") or 6007
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-DEFAULT_VIDEO_ROOT_DIR = Path(os.path.split(os.path.realpath(sys.argv[0]))[0]).parent.parent / "downloads"
+PROJECT_DIR = Path(os.path.split(os.path.realpath(sys.argv[0]))[0]).parent.parent
+DEFAULT_VIDEO_ROOT_DIR = PROJECT_DIR / "downloads"
+CONFIG_DIR = PROJECT_DIR / "config"
 VIDEO_DIR = Path(CUSTOM_VIDEO_ROOT_DIR or DEFAULT_VIDEO_ROOT_DIR)
 os.makedirs(VIDEO_DIR, exist_ok=True)
 
 VIDEO_META_CACHE = TTLCache(maxsize=50, ttl=300)
 CHUNK_CACHE = TTLCache(maxsize=25, ttl=60)
+STORAGE_ROOTS_CACHE = TTLCache(maxsize=1, ttl=30)
 
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -54,6 +58,39 @@ async def lifespan(_app: FastAPI):
 app = FastAPI(lifespan=lifespan)
 
 
+def load_storage_roots() -> tuple[list[Path], Path | None]:
+    """
+    The additional recording paths and the cold storage path from the recording settings. The storage page
+    names the one a file is on with ?root=<path>, which is only served when it is one of these.
+    """
+    if (roots := STORAGE_ROOTS_CACHE.get("roots")) is not None:
+        return roots
+    config = {}
+    for name in ("default_settings.json", "user_settings.json"):
+        try:
+            with open(CONFIG_DIR / name, encoding="utf-8") as file:
+                config.update(json.load(file))
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read {name}: {e}")
+    extra_save_paths = config.get("extra_save_paths") or []
+    if isinstance(extra_save_paths, str):
+        extra_save_paths = extra_save_paths.splitlines()
+    cold_save_path = (config.get("cold_save_path") or "").strip() if config.get("storage_tiering_enabled") else ""
+    extra_dirs = [Path(path.strip()) for path in extra_save_paths if path.strip()]
+    roots = extra_dirs, Path(cold_save_path) if cold_save_path else None
+    STORAGE_ROOTS_CACHE["roots"] = roots
+    return roots
+
+
+def find_video_root(root: str, extra_dirs: list[Path], cold_dir: Path | None) -> Path | None:
+    for video_dir in [*extra_dirs, *([cold_dir] if cold_dir else [])]:
+        if os.path.normpath(video_dir) == os.path.normpath(root):
+            return video_dir
+    return None
+
+
 def validate_filename(filename: str):
     if re.search(r"[\\/]", filename):
         raise HTTPException(status_code=400, detail="Invalid filename")
@@ -63,10 +100,16 @@ def validate_filename(filename: str):
 async def get_video(
         request: Request,
         filename: str = Query(...),
-        subfolder: str | None = None
+        subfolder: str | None = None,
+        root: str | None = None
 ):
 
-    cache_key = f"{filename}-{subfolder}"
+    extra_dirs, cold_dir = load_storage_roots()
+    video_dir = find_video_root(root, extra_dirs, cold_dir) if root else VIDEO_DIR
+    if video_dir is None:
+        raise HTTPException(status_code=404, detail="Video root not found")
+
+    cache_key = f"{root}-{filename}-{subfolder}"
     if meta := VIDEO_META_CACHE.get(cache_key):
         if_none_match = request.headers.get("If-None-Match")
         if_modified_since = request.headers.get("If-Modified-Since")
@@ -82,21 +125,27 @@ async def get_video(
     try:
         validate_filename(filename)
         if subfolder:
-            video_path = VIDEO_DIR / subfolder / filename
+            video_path = video_dir / subfolder / filename
         else:
-            video_path = VIDEO_DIR / filename
+            video_path = video_dir / filename
 
     except Exception as e:
         logger.exception("Invalid filename or subfolder")
         raise e
 
+    if not video_path.is_file() and cold_dir and video_dir != cold_dir:
+        # Migrated to cold storage after the storage page listed it, keeping its path below the recording path.
+        migrated_path = cold_dir / video_path.relative_to(video_dir)
+        if migrated_path.is_file():
+            video_dir, video_path = cold_dir, migrated_path
+
     if not video_path.is_file():
         logger.error(f"File not found: {video_path}")
         raise HTTPException(status_code=404, detail="Video file not found")
 
     # Prevent path traversal attacks
     try:
-        video_path.relative_to(VIDEO_DIR)
+        video_path.relative_to(video_dir)
     except ValueError:
         logger.exception(f"Path traversal attempt: {video_path}")
         raise HTTPException(status_code=400, detail="Invalid file path")
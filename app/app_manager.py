@@ -1,28 +1,39 @@
+import asyncio
+import importlib
 import os
 import time
 
 import flet as ft
 
 from . import execute_dir
+from .cluster.supervisor import EngineSupervisor
 from .core.config.config_manager import ConfigManager
 from .core.config.language_manager import LanguageManager
+from .core.metrics.profiler import start_loop_profiler
+from .core.metrics.server import start_metrics_server
+from .core.platforms.platform_handlers import preload_platform_modules
 from .core.recording.record_manager import RecordingManager
+from .core.runtime.node_sidecar import apply_node_sidecar_settings
 from .core.runtime.process_manager import AsyncProcessManager
 from .core.update.update_checker import UpdateChecker
 from .initialization.installation_manager import InstallationManager
 from .ui.components.business.recording_card import RecordingCardManager
 from .ui.components.common.show_snackbar import ShowSnackBar
 from .ui.navigation.sidebar import LeftNavigationMenu, NavigationSidebar
-from .ui.views.about_view import AboutPage
-from .ui.views.home_view import HomePage
-from .ui.views.recordings_view import RecordingsPage
 from .ui.views.settings_view import SettingsPage
-from .ui.views.storage_view import StoragePage
 from .utils import utils
 from .utils.logger import logger
 
 
 class App:
+    # Pages other than settings are imported and built on first navigation, see get_page.
+    LAZY_PAGES = {
+        "home": (".ui.views.home_view", "HomePage"),
+        "recordings": (".ui.views.recordings_view", "RecordingsPage"),
+        "storage": (".ui.views.storage_view", "StoragePage"),
+        "about": (".ui.views.about_view", "AboutPage"),
+    }
+
     def __init__(self, page: ft.Page):
         self.install_progress = None
         self.page = page
@@ -43,11 +54,7 @@ class App:
         self.settings = SettingsPage(self)
         self.language_manager = LanguageManager(self)
         self.language_code = self.settings.language_code
-        self.about = AboutPage(self)
-        self.recordings = RecordingsPage(self)
-        self.home = HomePage(self)
-        self.storage = StoragePage(self)
-        self.pages = self.initialize_pages()
+        self.pages = {"settings": self.settings}
         self.sidebar = NavigationSidebar(self)
         self.left_navigation_menu = LeftNavigationMenu(self)
 
@@ -65,6 +72,9 @@ class App:
         )
         self.snack_bar = ShowSnackBar(self)
         self.subprocess_start_up_info = utils.get_startup_info()
+        self.engine_supervisor = EngineSupervisor.from_config(self)
+        self.metrics_server = None
+        self.loop_profiler = None
         self.record_card_manager = RecordingCardManager(self)
         self.record_manager = RecordingManager(self)
         self.current_page = None
@@ -75,15 +85,34 @@ class App:
         self.page.run_task(self.install_manager.check_env)
         self.page.run_task(self.record_manager.check_free_space)
         self.page.run_task(self._check_for_updates)
-
-    def initialize_pages(self):
-        return {
-            "settings": self.settings,
-            "home": self.home,
-            "recordings": self.recordings,
-            "storage": self.storage,
-            "about": self.about,
-        }
+        self.page.run_task(self._preload_platform_modules)
+
+    def get_page(self, page_name):
+        """Return a page by name, importing and constructing it the first time it is requested."""
+        page = self.pages.get(page_name)
+        if page is None and page_name in self.LAZY_PAGES:
+            module_name, class_name = self.LAZY_PAGES[page_name]
+            started = time.perf_counter()
+            page_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            page = self.pages[page_name] = page_class(self)
+            logger.debug(f"Built {page_name} page in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return page
+
+    @property
+    def home(self):
+        return self.get_page("home")
+
+    @property
+    def recordings(self):
+        return self.get_page("recordings")
+
+    @property
+    def storage(self):
+        return self.get_page("storage")
+
+    @property
+    def about(self):
+        return self.get_page("about")
 
     async def switch_page(self, page_name):
         if self._loading_page:
@@ -93,7 +122,7 @@ class App:
 
         try:
             await self.clear_content_area()
-            if page := self.pages.get(page_name):
+            if page := self.get_page(page_name):
                 await self.settings.is_changed()
                 self.current_page = page
                 await page.load()
@@ -115,6 +144,17 @@ class App:
     def add_ffmpeg_process(self, process):
         self.process_manager.add_process(process)
 
+    @staticmethod
+    async def _preload_platform_modules():
+        """Import the platform clients in the background once the window is up."""
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(preload_platform_modules)
+        except ImportError as e:
+            logger.error(f"Failed to load platform modules: {e}")
+            return
+        logger.debug(f"Loaded platform modules in {(time.perf_counter() - started) * 1000:.0f} ms")
+
     async def _check_for_updates(self):
         """Check for updates when the application starts"""
         try:
@@ -137,6 +177,13 @@ class App:
 
     async def start_periodic_tasks(self):
         """Start all periodic tasks"""
+        self.metrics_server = await start_metrics_server(self)
+        self.loop_profiler = start_loop_profiler(self)
+        apply_node_sidecar_settings(self)
+        self.record_manager.start_retention()
+        if self.engine_supervisor:
+            await self.engine_supervisor.start()
+            return
         await self.record_manager.setup_periodic_live_check(
             int(self.record_manager.loop_time_seconds or 180)
         )
@@ -0,0 +1,15 @@
+from .coordinator import ClusterCoordinator, fetch_snapshot, print_cluster_status, run_coordinator
+from .hash_ring import ConsistentHashRing
+from .supervisor import EngineSupervisor
+from .worker import ClusterWorker, run_worker
+
+__all__ = [
+    "ClusterCoordinator",
+    "ClusterWorker",
+    "ConsistentHashRing",
+    "EngineSupervisor",
+    "fetch_snapshot",
+    "print_cluster_status",
+    "run_coordinator",
+    "run_worker",
+]
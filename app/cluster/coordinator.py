@@ -0,0 +1,410 @@
+import asyncio
+import hmac
+import json
+import os
+import signal
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .. import execute_dir
+from ..core.config.config_manager import ConfigManager
+from ..utils.logger import logger
+from .hash_ring import ConsistentHashRing
+from .protocol import (
+    HEARTBEAT_INTERVAL,
+    HEARTBEAT_TIMEOUT,
+    MAX_MESSAGE_SIZE,
+    ProtocolError,
+    close_writer,
+    open_connection,
+    read_message,
+    send_message,
+)
+
+
+@dataclass
+class ClusterNode:
+    node_id: str
+    writer: asyncio.StreamWriter
+    capacity: int = 1
+    address: str = ""
+    last_heartbeat: float = field(default_factory=time.monotonic)
+    assigned: set[str] = field(default_factory=set)
+    stats: dict = field(default_factory=dict)
+
+
+class ClusterCoordinator:
+    """
+    Owns the recording list of a cluster and assigns every recording to one worker node.
+
+    Recordings are placed by consistent hashing on ``rec_id``, so a node joining or leaving only moves the
+    recordings it gains or loses. Workers report the runtime state of their recordings, which gives the
+    coordinator the shared view served to ``--cluster-status``, and send back configuration changes, which
+    the coordinator writes to ``recordings.json``. Workers never write that file themselves.
+
+    With ``owns_config=False`` the recording list is supplied through ``set_recordings`` instead, and worker
+    reports are passed to the ``on_state`` and ``on_recordings`` callbacks, see ``EngineSupervisor``.
+    """
+
+    PERSIST_DELAY = 2.0
+    # Longer than a worker takes to stop a recorder (FFmpeg gets 15 s to exit before it is killed).
+    RELEASE_TIMEOUT = 30.0
+
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            run_path: str = execute_dir,
+            token: str | None = None,
+            owns_config: bool = True,
+            on_state: Callable[[str, dict], None] | None = None,
+            on_recordings: Callable[[str, list[dict]], None] | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.owns_config = owns_config
+        self.on_state = on_state
+        self.on_recordings = on_recordings
+        self.config_manager = ConfigManager(run_path)
+        self.recordings: dict[str, dict] = {}
+        self.states: dict[str, dict] = {}
+        self.nodes: dict[str, ClusterNode] = {}
+        self.assignment: dict[str, str] = {}
+        self.ring = ConsistentHashRing()
+        self.epoch = 0
+        self._config_mtime = 0.0
+        self._dirty_since: float | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._stop_event = asyncio.Event()
+        self._rebalance_lock = asyncio.Lock()
+        self._release_waiters: dict[tuple[str, int], asyncio.Future] = {}
+        if owns_config:
+            self.load_recordings()
+
+    def load_recordings(self):
+        recordings_data = self.config_manager.load_recordings_config()
+        self.recordings = {rec["rec_id"]: rec for rec in recordings_data if isinstance(rec, dict) and "rec_id" in rec}
+        self.states = {rec_id: state for rec_id, state in self.states.items() if rec_id in self.recordings}
+        self._config_mtime = self._get_config_mtime()
+        logger.info(f"Cluster coordinator: Loaded {len(self.recordings)} recordings")
+
+    def _get_config_mtime(self) -> float:
+        try:
+            return os.path.getmtime(self.config_manager.recordings_config_path)
+        except OSError:
+            return 0.0
+
+    async def set_recordings(self, recordings_data: list[dict]):
+        """Replace the recording list and send the new assignment to the nodes whose recordings changed."""
+        previous = self.recordings
+        self.recordings = {rec["rec_id"]: rec for rec in recordings_data}
+        self.states = {rec_id: state for rec_id, state in self.states.items() if rec_id in self.recordings}
+        changed = [rec_id for rec_id, data in self.recordings.items() if previous.get(rec_id) != data]
+        await self.rebalance(force_nodes=set(self.ring.assign(changed).values()))
+
+    async def persist_recordings(self):
+        await self.config_manager.save_recordings_config(list(self.recordings.values()))
+        self._config_mtime = self._get_config_mtime()
+        self._dirty_since = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_MESSAGE_SIZE
+        )
+        # Port 0 binds an ephemeral port, report the one actually used.
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Cluster coordinator listening on {self.host}:{self.port}")
+
+    async def serve(self):
+        await self.start()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        sweep_task = asyncio.create_task(self.sweep())
+        try:
+            await self._stop_event.wait()
+        finally:
+            sweep_task.cancel()
+            await self.shutdown()
+
+    async def shutdown(self):
+        if self._server:
+            self._server.close()
+        nodes = list(self.nodes.values())
+        # Cleared first, so the closing connections do not trigger a rebalance.
+        self.nodes.clear()
+        for node in nodes:
+            await close_writer(node.writer)
+        if self.owns_config and self._dirty_since is not None:
+            await self.persist_recordings()
+        logger.info("Cluster coordinator stopped")
+
+    def _authorized(self, message: dict) -> bool:
+        if not self.token:
+            return True
+        return hmac.compare_digest(str(message.get("token", "")), self.token)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        node = None
+        try:
+            message = await asyncio.wait_for(read_message(reader), timeout=HEARTBEAT_TIMEOUT)
+            if message is None:
+                return
+            if not self._authorized(message):
+                logger.warning(f"Cluster connection from {peer} rejected: invalid token")
+                await send_message(writer, {"type": "error", "reason": "unauthorized"})
+                return
+            if message["type"] == "snapshot":
+                await send_message(writer, self.snapshot())
+                return
+            if message["type"] != "hello" or not message.get("node_id"):
+                await send_message(writer, {"type": "error", "reason": "expected hello"})
+                return
+
+            node = await self._register_node(message, writer, peer)
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    break
+                self._handle_message(node, message)
+        except (asyncio.TimeoutError, ConnectionError, ProtocolError) as e:
+            logger.warning(f"Cluster connection from {peer} failed: {e}")
+        finally:
+            if node is not None and self.nodes.get(node.node_id) is node:
+                logger.warning(f"Cluster node disconnected: {node.node_id}")
+                await self._remove_node(node)
+            await close_writer(writer)
+
+    async def _register_node(self, message: dict, writer: asyncio.StreamWriter, peer) -> ClusterNode:
+        node_id = str(message["node_id"])
+        previous = self.nodes.get(node_id)
+        if previous is not None:
+            # A restarted worker reconnects under the same id before its old connection timed out.
+            logger.info(f"Cluster node {node_id} reconnected, replacing the previous connection")
+            await close_writer(previous.writer)
+
+        capacity = max(1, int(message.get("capacity") or 1))
+        node = ClusterNode(node_id, writer, capacity, f"{peer[0]}:{peer[1]}" if peer else "")
+        self.nodes[node_id] = node
+        self.ring.add_node(node_id, capacity)
+        await send_message(writer, {"type": "welcome", "heartbeat_interval": HEARTBEAT_INTERVAL})
+        logger.info(f"Cluster node joined: {node_id} ({node.address}, capacity {capacity})")
+        await self.rebalance(force_nodes={node_id})
+        return node
+
+    async def _remove_node(self, node: ClusterNode):
+        self.nodes.pop(node.node_id, None)
+        for (node_id, _), waiter in self._release_waiters.items():
+            if node_id == node.node_id and not waiter.done():
+                waiter.set_result(False)
+        self.ring.remove_node(node.node_id)
+        for rec_id in node.assigned:
+            state = self.states.get(rec_id)
+            if state is not None:
+                state["node_id"] = None
+        await self.rebalance()
+
+    def _handle_message(self, node: ClusterNode, message: dict):
+        node.last_heartbeat = time.monotonic()
+        message_type = message["type"]
+        if message_type == "heartbeat":
+            node.stats = message.get("stats") or {}
+        elif message_type == "assigned":
+            waiter = self._release_waiters.get((node.node_id, message.get("epoch")))
+            if waiter is not None and not waiter.done():
+                waiter.set_result(True)
+        elif message_type == "state":
+            for state in message.get("recordings") or ():
+                rec_id = state.get("rec_id")
+                # Late reports from a node that already handed the recording over are ignored.
+                if rec_id in node.assigned:
+                    self.states[rec_id] = {**state, "node_id": node.node_id, "updated_at": time.time()}
+                    if self.on_state:
+                        self.on_state(node.node_id, state)
+        elif message_type == "recordings":
+            if self.on_recordings:
+                owned = [data for data in message.get("recordings") or () if data.get("rec_id") in node.assigned]
+                self.on_recordings(node.node_id, owned)
+                return
+            changed = False
+            for data in message.get("recordings") or ():
+                rec_id = data.get("rec_id")
+                if rec_id in node.assigned and self.recordings.get(rec_id) != data:
+                    self.recordings[rec_id] = data
+                    changed = True
+            if changed and self._dirty_since is None:
+                self._dirty_since = time.monotonic()
+        else:
+            logger.debug(f"Unknown cluster message from {node.node_id}: {message_type}")
+
+    async def rebalance(self, force_nodes: set[str] | None = None):
+        """
+        Recompute the owner of every recording and send each affected node its new assignment.
+
+        Moves happen in two steps: nodes that lose recordings are first sent what they keep, and only once
+        they confirmed that their recorders stopped (or ``RELEASE_TIMEOUT`` passed) are the other nodes sent
+        their new recordings, so a moved recording is never recorded by two nodes at once.
+        """
+        async with self._rebalance_lock:
+            self.assignment = self.ring.assign(self.recordings)
+            wanted: dict[str, set[str]] = {node_id: set() for node_id in self.nodes}
+            for rec_id, node_id in self.assignment.items():
+                wanted[node_id].add(rec_id)
+
+            force_nodes = force_nodes or set()
+            changed = [
+                node for node_id, node in self.nodes.items()
+                if wanted[node_id] != node.assigned or node_id in force_nodes
+            ]
+            if not changed:
+                return
+            losing = [node for node in changed if node.assigned - wanted[node.node_id]]
+            if losing:
+                self.epoch += 1
+                for node in losing:
+                    node.assigned &= wanted[node.node_id]
+                    await self._send_assignment(node)
+                await self._wait_for_release(losing)
+
+            self.epoch += 1
+            for node in changed:
+                if node.node_id not in self.nodes:
+                    continue
+                if node in losing and node.assigned == wanted[node.node_id] and node.node_id not in force_nodes:
+                    continue
+                node.assigned = wanted[node.node_id]
+                await self._send_assignment(node)
+
+        if not self.nodes and self.recordings:
+            logger.warning(f"No cluster nodes available, {len(self.recordings)} recordings are unassigned")
+        else:
+            summary = ", ".join(f"{node_id}: {len(node.assigned)}" for node_id, node in self.nodes.items())
+            logger.info(f"Cluster assignment epoch {self.epoch}: {summary}")
+
+    async def _wait_for_release(self, nodes: list[ClusterNode]):
+        waiters = {}
+        for node in nodes:
+            waiters[node.node_id] = self._release_waiters[(node.node_id, self.epoch)] = asyncio.Future()
+        try:
+            await asyncio.wait(waiters.values(), timeout=self.RELEASE_TIMEOUT)
+        finally:
+            for node_id in waiters:
+                self._release_waiters.pop((node_id, self.epoch), None)
+        late = [node_id for node_id, waiter in waiters.items() if not waiter.done()]
+        if late:
+            logger.warning(f"Cluster nodes did not confirm releasing their recordings in time: {', '.join(late)}")
+
+    async def _send_assignment(self, node: ClusterNode):
+        recordings = [self.recordings[rec_id] for rec_id in self.recordings if rec_id in node.assigned]
+        try:
+            await send_message(node.writer, {"type": "assign", "epoch": self.epoch, "recordings": recordings})
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Failed to send assignment to {node.node_id}: {e}")
+
+    async def send_command(self, rec_id: str, message: dict) -> bool:
+        """Send a ``command`` message about a recording to the node it is assigned to."""
+        node = next((node for node in self.nodes.values() if rec_id in node.assigned), None)
+        if node is None:
+            logger.warning(f"No cluster node owns recording {rec_id}, dropping {message.get('command')}")
+            return False
+        try:
+            await send_message(node.writer, {**message, "type": "command", "rec_id": rec_id})
+            return True
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Failed to send {message.get('command')} to {node.node_id}: {e}")
+            return False
+
+    async def sweep(self):
+        """Drop nodes that stopped sending heartbeats and save or reload recordings.json as needed."""
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            try:
+                now = time.monotonic()
+                for node in list(self.nodes.values()):
+                    if now - node.last_heartbeat > HEARTBEAT_TIMEOUT:
+                        logger.warning(f"Cluster node {node.node_id} missed its heartbeats, reassigning")
+                        await self._remove_node(node)
+                        await close_writer(node.writer)
+
+                if not self.owns_config:
+                    continue
+                if self._get_config_mtime() > self._config_mtime:
+                    logger.info("recordings.json changed on disk, reloading")
+                    self.load_recordings()
+                    await self.rebalance(force_nodes=set(self.nodes))
+
+                if self._dirty_since is not None and now - self._dirty_since >= self.PERSIST_DELAY:
+                    await self.persist_recordings()
+            except Exception as e:
+                logger.error(f"Cluster sweep failed: {e}")
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        nodes = [
+            {
+                "node_id": node.node_id,
+                "address": node.address,
+                "capacity": node.capacity,
+                "assigned": len(node.assigned),
+                "heartbeat_age": round(now - node.last_heartbeat, 1),
+                "stats": node.stats,
+            }
+            for node in self.nodes.values()
+        ]
+        recordings = []
+        for rec_id, data in self.recordings.items():
+            state = self.states.get(rec_id, {})
+            recordings.append({
+                "rec_id": rec_id,
+                "url": data.get("url"),
+                "streamer_name": state.get("streamer_name") or data.get("streamer_name"),
+                "node_id": self.assignment.get(rec_id),
+                "status_info": state.get("status_info"),
+                "is_live": state.get("is_live", False),
+                "is_recording": state.get("is_recording", False),
+            })
+        return {"type": "snapshot", "epoch": self.epoch, "nodes": nodes, "recordings": recordings}
+
+
+async def _serve_coordinator(host: str, port: int, token: str | None):
+    await ClusterCoordinator(host, port, token=token).serve()
+
+
+def run_coordinator(host: str, port: int, token: str | None = None):
+    """Entry point of ``main.py --cluster-coordinator``."""
+    logger.info("Starting StreamCap cluster coordinator")
+    try:
+        asyncio.run(_serve_coordinator(host, port, token))
+    except KeyboardInterrupt:
+        logger.info("Interrupted, exiting")
+
+
+async def fetch_snapshot(host: str, port: int, token: str | None = None) -> dict:
+    """Ask a running coordinator for the nodes and the state of every recording."""
+    reader, writer = await open_connection(host, port)
+    try:
+        await send_message(writer, {"type": "snapshot", "token": token})
+        snapshot = await asyncio.wait_for(read_message(reader), timeout=HEARTBEAT_TIMEOUT)
+    finally:
+        await close_writer(writer)
+    if not snapshot or snapshot["type"] != "snapshot":
+        raise ProtocolError(f"Unexpected reply: {snapshot}")
+    return snapshot
+
+
+def print_cluster_status(host: str, port: int, token: str | None = None) -> bool:
+    """Entry point of ``main.py --cluster-status``; prints the coordinator snapshot as JSON."""
+    try:
+        snapshot = asyncio.run(fetch_snapshot(host, port, token))
+    except (OSError, asyncio.TimeoutError, ProtocolError) as e:
+        logger.error(f"Failed to query the cluster coordinator at {host}:{port}: {e}")
+        return False
+    print(json.dumps(snapshot, ensure_ascii=False, indent=2))
+    return True
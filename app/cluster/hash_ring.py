@@ -0,0 +1,62 @@
+import bisect
+import hashlib
+
+
+class ConsistentHashRing:
+    """
+    Maps recording ids to nodes so that adding or removing a node only moves the recordings of that node.
+
+    Each node is placed on the ring as ``virtual_nodes * weight`` points, a node with twice the capacity
+    receives about twice as many recordings.
+    """
+
+    DEFAULT_VIRTUAL_NODES = 64
+
+    def __init__(self, virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        self.virtual_nodes = virtual_nodes
+        self._weights: dict[str, int] = {}
+        self._points: list[int] = []
+        self._owners: list[str] = []
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    @property
+    def nodes(self) -> list[str]:
+        return sorted(self._weights)
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._weights
+
+    def add_node(self, node_id: str, weight: int = 1):
+        self._weights[node_id] = max(1, weight)
+        self._rebuild()
+
+    def remove_node(self, node_id: str):
+        if self._weights.pop(node_id, None) is not None:
+            self._rebuild()
+
+    def _rebuild(self):
+        points = sorted(
+            (self._hash(f"{node_id}#{index}"), node_id)
+            for node_id, weight in self._weights.items()
+            for index in range(self.virtual_nodes * weight)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [node_id for _, node_id in points]
+
+    def get_node(self, key: str) -> str | None:
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[index]
+
+    def assign(self, keys) -> dict[str, str]:
+        """Return the owning node of every key, or an empty mapping when the ring has no nodes."""
+        if not self._points:
+            return {}
+        return {key: self.get_node(key) for key in keys}
@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+DEFAULT_CLUSTER_HOST = "127.0.0.1"
+DEFAULT_CLUSTER_PORT = 7070
+HEARTBEAT_INTERVAL = 5.0
+HEARTBEAT_TIMEOUT = 15.0
+
+# A full assignment of a large library is sent as one line.
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+async def send_message(writer: asyncio.StreamWriter, message: dict):
+    writer.write(encode_message(message))
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader) -> dict | None:
+    """Read one JSON line, returning None once the peer has closed the connection."""
+    try:
+        line = await reader.readline()
+    except (asyncio.LimitOverrunError, ValueError) as e:
+        raise ProtocolError(f"Message too large: {e}") from e
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"Invalid message: {e}") from e
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError("Message without a type")
+    return message
+
+
+async def open_connection(host: str, port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    return await asyncio.open_connection(host, port, limit=MAX_MESSAGE_SIZE)
+
+
+async def close_writer(writer: asyncio.StreamWriter):
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
@@ -0,0 +1,222 @@
+import asyncio
+import os
+import secrets
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from .. import execute_dir
+from ..core.config.config_manager import ConfigManager
+from ..core.events.event_bus import EventBus
+from ..core.events.events import RecordingStatusChanged
+from ..core.metrics.metrics import ENGINE_WORKER_RESTARTS, ENGINE_WORKER_UP, registry
+from ..core.recording.record_manager import GlobalRecordingState
+from ..utils import utils
+from ..utils.logger import logger
+from .coordinator import ClusterCoordinator
+
+# Runtime fields reported by workers; monitor_status stays owned by the UI process.
+SHARED_STATE_FIELDS = ("streamer_name", "status_info", "display_title", "live_title", "is_live", "is_checking")
+# Fields a worker may change in the recording configuration, e.g. the streamer name found by a live check.
+WORKER_CONFIG_FIELDS = ("streamer_name", "platform", "platform_key", "last_live_at")
+
+
+class EngineSupervisor:
+    """
+    Runs the live checks and recorders in local worker processes instead of the UI process.
+
+    The supervisor embeds a ``ClusterCoordinator`` on a loopback port and starts ``engine_worker_processes``
+    cluster workers, restarting any that exit. Recordings are partitioned among the workers by the
+    coordinator; their state reports are applied to the ``Recording`` objects of this process and published
+    on the event bus, so the UI renders them as if the engine ran in-process. Configuration changes made in
+    the UI reach the workers through ``sync_recordings``, and manual starts and stops through ``send_command``.
+
+    There is one supervisor per process, shared by every web session like ``GlobalRecordingState``; it works
+    on the shared recordings and never through a session's page.
+    """
+
+    _instance = None
+
+    RESTART_DELAYS = (1, 2, 5, 10, 30)
+    STABLE_RUN_SECONDS = 60
+    STOP_TIMEOUT = 30
+
+    def __init__(self, run_path: str, workers: int):
+        self.workers = workers
+        self.token = secrets.token_hex(16)
+        self.config_manager = ConfigManager(run_path)
+        self.coordinator = ClusterCoordinator(
+            "127.0.0.1", 0, run_path, self.token, owns_config=False,
+            on_state=self.on_state, on_recordings=self.on_recordings,
+        )
+        self.processes: dict[str, asyncio.subprocess.Process] = {}
+        self.restarts: dict[str, int] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._pending_tasks: set[asyncio.Task] = set()
+        self._started = False
+        self._stopping = False
+
+    @classmethod
+    def from_config(cls, app):
+        """
+        Return the process-wide supervisor when ``engine_worker_processes`` is set, "auto" uses one worker per
+        core. Later sessions get the one the first session created.
+        """
+        if cls._instance is not None:
+            return cls._instance
+        value = str(app.settings.user_config.get("engine_worker_processes") or "0").strip().lower()
+        try:
+            workers = (os.cpu_count() or 1) if value == "auto" else int(value)
+        except ValueError:
+            logger.warning(f"Invalid engine_worker_processes value: {value}, running the engine in-process")
+            return None
+        if workers > 0:
+            cls._instance = cls(app.run_path, workers)
+        return cls._instance
+
+    async def start(self):
+        if self._started:
+            return
+        self._started = True
+        await self.coordinator.start()
+        await self.coordinator.set_recordings([recording.to_dict() for recording in GlobalRecordingState.recordings])
+        self._tasks.append(asyncio.create_task(self.coordinator.sweep()))
+        registry.add_collector(self.collect_metrics)
+        for index in range(self.workers):
+            node_id = f"local-{index}"
+            self.restarts[node_id] = 0
+            self._tasks.append(asyncio.create_task(self._keep_worker_running(node_id)))
+        logger.info(f"Engine supervisor started {self.workers} worker processes")
+
+    def worker_command(self, node_id: str) -> list[str]:
+        if getattr(sys, "frozen", False):
+            command = [sys.executable]
+        else:
+            command = [sys.executable, os.path.join(execute_dir, "main.py")]
+        return command + [
+            "--cluster-worker", "--cluster-port", str(self.coordinator.port), "--node-id", node_id,
+            "--exit-with-coordinator",
+        ]
+
+    async def _keep_worker_running(self, node_id: str):
+        # Workers report their state through the coordinator, the metrics endpoint stays in this process.
+        env = {**os.environ, "CLUSTER_TOKEN": self.token, "METRICS_PORT": "0"}
+        attempt = 0
+        while not self._stopping:
+            started = time.monotonic()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *self.worker_command(node_id),
+                    stdin=subprocess.DEVNULL,
+                    env=env,
+                    cwd=execute_dir,
+                    startupinfo=utils.get_startup_info()
+                )
+            except OSError as e:
+                logger.error(f"Failed to start engine worker {node_id}: {e}")
+                return
+            self.processes[node_id] = process
+            logger.info(f"Engine worker {node_id} started, pid {process.pid}")
+            return_code = await process.wait()
+            if self._stopping:
+                return
+
+            self.restarts[node_id] += 1
+            attempt = 0 if time.monotonic() - started > self.STABLE_RUN_SECONDS else attempt + 1
+            delay = self.RESTART_DELAYS[min(attempt, len(self.RESTART_DELAYS) - 1)]
+            logger.warning(f"Engine worker {node_id} exited with code {return_code}, restarting in {delay}s")
+            await asyncio.sleep(delay)
+
+    async def stop(self):
+        """
+        Stop the workers, giving their recorders time to finalize the output files. Closing the coordinator
+        makes every worker shut down on its own; workers that do not are terminated, then killed.
+        """
+        self._stopping = True
+        registry.remove_collector(self.collect_metrics)
+        await self.coordinator.shutdown()
+        running = [process for process in self.processes.values() if process.returncode is None]
+        if running:
+            logger.info(f"Waiting for {len(running)} engine workers to stop")
+        for signal_process in (None, asyncio.subprocess.Process.terminate, asyncio.subprocess.Process.kill):
+            running = [process for process in running if process.returncode is None]
+            if not running:
+                break
+            if signal_process:
+                logger.warning(f"{len(running)} engine workers did not stop, sending {signal_process.__name__}")
+                for process in running:
+                    signal_process(process)
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(process.wait() for process in running)), timeout=self.STOP_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                pass
+        for task in self._tasks:
+            task.cancel()
+
+    async def sync_recordings(self, recordings_data: list[dict]):
+        """Forward the recording list saved by the UI, e.g. an added room or a monitor toggle."""
+        if not self._stopping:
+            await self.coordinator.set_recordings(recordings_data)
+
+    async def persist_recordings(self):
+        """Save the recordings after workers changed them, like ``RecordingManager.persist_recordings``."""
+        data_to_save = [recording.to_dict() for recording in GlobalRecordingState.recordings]
+        await self.config_manager.save_recordings_config(data_to_save)
+        await self.sync_recordings(data_to_save)
+
+    def send_command(self, rec_id: str, command: str, **fields):
+        """Ask the worker that owns a recording to ``check`` it or ``stop`` its recorder."""
+        if not self._stopping:
+            self._spawn(self.coordinator.send_command(rec_id, {"command": command, **fields}))
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    def on_state(self, node_id: str, state: dict):
+        recording = GlobalRecordingState.recordings_by_id.get(state.get("rec_id"))
+        if recording is None:
+            return
+        recording.update({key: state[key] for key in SHARED_STATE_FIELDS if key in state})
+
+        is_recording = bool(state.get("is_recording"))
+        if is_recording and not recording.is_recording:
+            recording.start_time = datetime.now()
+        elif recording.is_recording and not is_recording and recording.start_time is not None:
+            recording.cumulative_duration += datetime.now() - recording.start_time
+            recording.last_duration = recording.cumulative_duration
+            recording.start_time = None
+        recording.is_recording = is_recording
+        EventBus.get_instance().emit(RecordingStatusChanged(recording))
+
+    def on_recordings(self, node_id: str, recordings_data: list[dict]):
+        changed = False
+        for data in recordings_data:
+            recording = GlobalRecordingState.recordings_by_id.get(data.get("rec_id"))
+            if recording is None:
+                continue
+            updates = {key: data[key] for key in WORKER_CONFIG_FIELDS if key in data}
+            if any(getattr(recording, key) != value for key, value in updates.items()):
+                recording.update(updates)
+                changed = True
+        if changed:
+            self._spawn(self.persist_recordings())
+
+    def collect_metrics(self):
+        for node_id, stats in self.stats().items():
+            ENGINE_WORKER_UP.set(1 if stats["running"] else 0, node=node_id)
+            ENGINE_WORKER_RESTARTS.set_total(stats["restarts"], node=node_id)
+
+    def stats(self) -> dict[str, dict]:
+        return {
+            node_id: {
+                "pid": process.pid,
+                "running": process.returncode is None,
+                "restarts": self.restarts.get(node_id, 0),
+            }
+            for node_id, process in self.processes.items()
+        }
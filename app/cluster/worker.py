@@ -0,0 +1,283 @@
+import asyncio
+import os
+import socket
+
+from ..core.config.config_manager import ConfigManager
+from ..core.events.event_bus import EventBus
+from ..core.events.events import RecordingEvent, RecordingStatusChanged
+from ..core.metrics.profiler import start_loop_profiler
+from ..core.metrics.server import start_metrics_server
+from ..core.runtime.node_sidecar import apply_node_sidecar_settings
+from ..headless.app import HeadlessApp
+from ..models.recording.recording_model import Recording
+from ..utils.logger import logger
+from .protocol import HEARTBEAT_INTERVAL, ProtocolError, close_writer, open_connection, read_message, send_message
+
+RECONNECT_DELAYS = (1, 2, 5, 10, 30)
+# How long a worker waits for the recorders of released rooms to stop before confirming an assignment.
+RELEASE_TIMEOUT = 25.0
+
+
+class ClusterConfigManager(ConfigManager):
+    """
+    Config access of a worker node. The recording list comes from the coordinator instead of
+    ``recordings.json``, and saving it sends the node's recordings back to the coordinator.
+    """
+
+    def __init__(self, run_path, worker: "ClusterWorker"):
+        self.worker = worker
+        super().__init__(run_path)
+
+    def load_recordings_config(self):
+        return []
+
+    async def save_recordings_config(self, config):
+        await self.worker.send({"type": "recordings", "recordings": config})
+
+
+def recording_state(recording: Recording) -> dict:
+    """The runtime fields of a recording that the coordinator shares with the rest of the cluster."""
+    return {
+        "rec_id": recording.rec_id,
+        "streamer_name": recording.streamer_name,
+        "status_info": recording.status_info,
+        "display_title": recording.display_title,
+        "live_title": recording.live_title,
+        "is_live": recording.is_live,
+        "is_recording": recording.is_recording,
+        "is_checking": recording.is_checking,
+        "monitor_status": recording.monitor_status,
+        "last_live_at": recording.last_live_at,
+    }
+
+
+class ClusterWorker(HeadlessApp):
+    """
+    A headless engine that records the rooms assigned to it by a cluster coordinator.
+
+    The worker keeps recording its current rooms while the coordinator is unreachable and reconciles
+    against the assignment it receives after reconnecting.
+    """
+
+    def __init__(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            host: str,
+            port: int,
+            node_id: str | None = None,
+            capacity: int = 1,
+            token: str | None = None,
+            exit_with_coordinator: bool = False,
+    ):
+        self.coordinator_host = host
+        self.coordinator_port = port
+        self.node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.capacity = capacity
+        self.token = token
+        self.exit_with_coordinator = exit_with_coordinator
+        self.epoch = 0
+        self._writer: asyncio.StreamWriter | None = None
+        self._send_lock = asyncio.Lock()
+        self._connection_task: asyncio.Task | None = None
+        super().__init__(loop)
+        self.state_subscription = EventBus.get_instance().subscribe(
+            self.on_recording_event, RecordingEvent, name="cluster_state", coalesce=lambda event: event.rec_id
+        )
+
+    def create_config_manager(self) -> ConfigManager:
+        return ClusterConfigManager(self.run_path, self)
+
+    def create_engine_supervisor(self):
+        return None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def send(self, message: dict) -> bool:
+        if not self.connected:
+            return False
+        try:
+            async with self._send_lock:
+                await send_message(self._writer, message)
+            return True
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Failed to send {message['type']} to the coordinator: {e}")
+            return False
+
+    async def on_recording_event(self, event: RecordingEvent):
+        if self.record_manager.find_recording_by_id(event.rec_id) is event.recording:
+            await self.send({"type": "state", "recordings": [recording_state(event.recording)]})
+
+    async def start_periodic_tasks(self):
+        self.metrics_server = await start_metrics_server(self)
+        self.loop_profiler = start_loop_profiler(self)
+        apply_node_sidecar_settings(self)
+        if not self.exit_with_coordinator:
+            # Local workers share the app's storage roots, which the app's own retention covers.
+            self.record_manager.start_retention()
+        # Rooms arrive with the first assignment, which schedules their checks through the warm-up.
+        await self.record_manager.setup_periodic_live_check(
+            int(self.record_manager.loop_time_seconds or 180), check_on_start=False
+        )
+        self._connection_task = asyncio.create_task(self.stay_connected())
+
+    async def stay_connected(self):
+        attempt = 0
+        while True:
+            try:
+                reader, writer = await open_connection(self.coordinator_host, self.coordinator_port)
+            except OSError as e:
+                delay = RECONNECT_DELAYS[min(attempt, len(RECONNECT_DELAYS) - 1)]
+                attempt += 1
+                logger.warning(f"Coordinator unreachable ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+
+            attempt = 0
+            self._writer = writer
+            heartbeat_task = None
+            try:
+                await self.send({
+                    "type": "hello", "node_id": self.node_id, "capacity": self.capacity, "pid": os.getpid(),
+                    "token": self.token,
+                })
+                welcome = await read_message(reader)
+                if not welcome or welcome["type"] != "welcome":
+                    logger.error(f"Coordinator refused node {self.node_id}: {welcome}")
+                else:
+                    logger.info(f"Joined cluster at {self.coordinator_host}:{self.coordinator_port} as {self.node_id}")
+                    interval = float(welcome.get("heartbeat_interval") or HEARTBEAT_INTERVAL)
+                    heartbeat_task = asyncio.create_task(self._heartbeat(interval))
+                    await self.send({"type": "state", "recordings": [
+                        recording_state(recording) for recording in self.record_manager.recordings
+                    ]})
+                    while (message := await read_message(reader)) is not None:
+                        await self._handle_message(message)
+                    logger.warning("Coordinator closed the connection")
+            except (ConnectionError, ProtocolError) as e:
+                logger.warning(f"Lost connection to the coordinator: {e}")
+            finally:
+                if heartbeat_task:
+                    heartbeat_task.cancel()
+                self._writer = None
+                await close_writer(writer)
+            if self.exit_with_coordinator:
+                # A worker process of a local supervisor must not outlive it.
+                self.request_shutdown()
+                return
+            await asyncio.sleep(RECONNECT_DELAYS[0])
+
+    async def _heartbeat(self, interval: float):
+        while True:
+            recordings = self.record_manager.recordings
+            await self.send({"type": "heartbeat", "stats": {
+                "recordings": len(recordings),
+                "live": sum(1 for recording in recordings if recording.is_live),
+                "recording": len(self.record_manager.active_recorders),
+                "recording_enabled": self.recording_enabled,
+            }})
+            await asyncio.sleep(interval)
+
+    async def _handle_message(self, message: dict):
+        if message["type"] == "assign":
+            self.epoch = message.get("epoch", self.epoch)
+            await self.apply_assignment(message.get("recordings") or [])
+            await self.send({"type": "assigned", "epoch": self.epoch})
+        elif message["type"] == "command":
+            self.handle_command(message)
+        else:
+            logger.debug(f"Unknown message from the coordinator: {message['type']}")
+
+    def handle_command(self, message: dict):
+        """Start or stop one of this node's recordings on request of the UI, see ``EngineSupervisor``."""
+        record_manager = self.record_manager
+        recording = record_manager.find_recording_by_id(message.get("rec_id"))
+        if recording is None:
+            logger.debug(f"Ignoring {message.get('command')} for a recording this node does not own")
+            return
+        if message.get("command") == "check":
+            self.page.run_task(record_manager.check_if_live, recording)
+        elif message.get("command") == "stop":
+            record_manager.stop_recording(recording, manually_stopped=bool(message.get("manually_stopped", True)))
+            record_manager.emit(RecordingStatusChanged(recording))
+        else:
+            logger.debug(f"Unknown command from the coordinator: {message.get('command')}")
+
+    async def apply_assignment(self, recordings_data: list[dict]):
+        """
+        Stop the rooms this node no longer owns and wait for their recorders to exit, so the coordinator can
+        hand them to another node; then add or update the ones it was given.
+        """
+        record_manager = self.record_manager
+        wanted = {data["rec_id"]: data for data in recordings_data}
+        revoked = [recording for recording in record_manager.recordings if recording.rec_id not in wanted]
+        for recording in revoked:
+            record_manager.stop_recording(recording, manually_stopped=False)
+            await record_manager.remove_recording(recording, persist=False)
+            await self.record_card_manager.remove_recording_card([recording])
+        await self.wait_for_recorders([recording.rec_id for recording in revoked])
+
+        added = []
+        for rec_id, data in wanted.items():
+            recording = record_manager.find_recording_by_id(rec_id)
+            if recording is None:
+                recording = Recording.from_dict(data)
+                recording.loop_time_seconds = record_manager.loop_time_seconds
+                recording.update_title(record_manager._[recording.quality])
+                recording.showed_checking_status = True
+                await record_manager.add_recording(recording, persist=False)
+                added.append(recording)
+            elif recording.to_dict() != data:
+                monitor_status = data.get("monitor_status")
+                recording.update({
+                    key: value for key, value in data.items() if key not in ("rec_id", "monitor_status")
+                })
+                if monitor_status and not recording.monitor_status:
+                    await record_manager.start_monitor_recording(recording, auto_save=False)
+                elif not monitor_status and recording.monitor_status:
+                    await record_manager.stop_monitor_recording(recording, auto_save=False)
+
+        for recording in added:
+            record_manager.schedule_live_check(recording)
+        logger.info(
+            f"Assignment epoch {self.epoch}: {len(wanted)} recordings, {len(added)} added, {len(revoked)} released"
+        )
+
+    async def wait_for_recorders(self, rec_ids: list[str]):
+        active_recorders = self.record_manager.active_recorders
+        deadline = asyncio.get_running_loop().time() + RELEASE_TIMEOUT
+        while any(rec_id in active_recorders for rec_id in rec_ids):
+            if asyncio.get_running_loop().time() > deadline:
+                logger.warning("Released recordings are still stopping, confirming the assignment anyway")
+                return
+            await asyncio.sleep(0.5)
+
+    async def shutdown(self):
+        await super().shutdown()
+        if self._connection_task:
+            self._connection_task.cancel()
+        self.state_subscription.close()
+
+
+async def _serve_worker(
+        host: str, port: int, node_id: str | None, capacity: int, token: str | None, exit_with_coordinator: bool
+):
+    worker = ClusterWorker(asyncio.get_running_loop(), host, port, node_id, capacity, token, exit_with_coordinator)
+    await worker.run()
+
+
+def run_worker(
+        host: str,
+        port: int,
+        node_id: str | None = None,
+        capacity: int = 1,
+        token: str | None = None,
+        exit_with_coordinator: bool = False,
+):
+    """Entry point of ``main.py --cluster-worker``."""
+    logger.info("Starting StreamCap cluster worker")
+    try:
+        asyncio.run(_serve_worker(host, port, node_id, capacity, token, exit_with_coordinator))
+    except KeyboardInterrupt:
+        logger.info("Interrupted, exiting")
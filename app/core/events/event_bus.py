@@ -0,0 +1,233 @@
+import asyncio
+import inspect
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from ...utils.logger import logger
+from .events import Event
+
+EventHandler = Callable[[Event], Awaitable[Any] | Any]
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_new", "block")
+
+
+class Subscription:
+    """
+    One subscriber of the event bus with its own bounded queue and consumer task.
+
+    With a ``coalesce`` key function, a queued event is replaced by a newer event with the same key
+    instead of being delivered twice, so a slow subscriber only sees the latest state per key.
+    """
+
+    def __init__(
+            self,
+            bus: "EventBus",
+            handler: EventHandler,
+            event_types: tuple[type[Event], ...],
+            name: str,
+            maxsize: int,
+            overflow: str,
+            coalesce: Callable[[Event], Hashable] | None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.bus = bus
+        self.handler = handler
+        self.event_types = event_types
+        self.name = name
+        self.maxsize = max(1, maxsize)
+        self.overflow = overflow
+        self.coalesce = coalesce
+        self._queue: OrderedDict[Hashable, Event] = OrderedDict()
+        self._sequence = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._task: asyncio.Task | None = None
+        self.closed = False
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def accepts(self, event: Event) -> bool:
+        return not self.closed and isinstance(event, self.event_types)
+
+    def _key(self, event: Event) -> Hashable:
+        return (True, self.coalesce(event)) if self.coalesce else (False, next(self._sequence))
+
+    def offer(self, event: Event) -> bool:
+        """Queue an event without waiting. Returns False if it was dropped."""
+        key = self._key(event)
+        if key in self._queue:
+            self._queue[key] = event
+            self.coalesced += 1
+            return True
+        if len(self._queue) >= self.maxsize:
+            if self.overflow == "drop_new":
+                self.dropped += 1
+                return False
+            # A blocking subscriber can only push back on awaiting publishers; emit() must not block.
+            self._queue.popitem(last=False)
+            self.dropped += 1
+        self._put(key, event)
+        return True
+
+    async def put(self, event: Event):
+        """Queue an event, waiting for room if the subscriber applies backpressure."""
+        if self.overflow == "block":
+            while len(self._queue) >= self.maxsize and self._key_if_coalesced(event) not in self._queue:
+                self._not_full.clear()
+                await self._not_full.wait()
+                if self.closed:
+                    return
+        self.offer(event)
+
+    def _key_if_coalesced(self, event: Event) -> Hashable | None:
+        return (True, self.coalesce(event)) if self.coalesce else None
+
+    def _put(self, key: Hashable, event: Event):
+        self._queue[key] = event
+        self._not_empty.set()
+        if len(self._queue) >= self.maxsize:
+            self._not_full.clear()
+        self._ensure_consumer()
+
+    def _ensure_consumer(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._consume(), name=f"event-bus:{self.name}")
+
+    async def _consume(self):
+        while not self.closed:
+            if not self._queue:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+            _, event = self._queue.popitem(last=False)
+            self._not_full.set()
+            try:
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Event handler {self.name} failed on {type(event).__name__}: {e}")
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def close(self):
+        self.closed = True
+        self._queue.clear()
+        self._not_empty.set()
+        self._not_full.set()
+        self.bus.unsubscribe(self)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.pending,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+class EventBus:
+    """
+    In-process publish/subscribe for engine events.
+
+    Publishing never runs subscriber code inline: each subscription has its own bounded queue that is
+    drained by its own task, so a slow UI cannot hold up persistence or notifications. Events may be
+    emitted from other threads; they are handed over to the loop the bus was first used on.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = EventBus()
+        return cls._instance
+
+    def __init__(self):
+        self._subscriptions: list[Subscription] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(
+            self,
+            handler: EventHandler,
+            event_types: type[Event] | tuple[type[Event], ...] = Event,
+            name: str | None = None,
+            maxsize: int = 1000,
+            overflow: str = "drop_oldest",
+            coalesce: Callable[[Event], Hashable] | None = None,
+    ) -> Subscription:
+        if not isinstance(event_types, tuple):
+            event_types = (event_types,)
+        subscription = Subscription(
+            self, handler, event_types, name or getattr(handler, "__qualname__", "handler"), maxsize, overflow,
+            coalesce
+        )
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def _bind_loop(self) -> bool:
+        """Return True when called on the bus loop, binding the bus to the current loop on first use."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._loop is None or self._loop.is_closed():
+            self._loop = loop
+        return loop is not None and loop is self._loop
+
+    def emit(self, event: Event):
+        """Publish an event without waiting; subscribers that are full drop events per their policy."""
+        if not self._bind_loop():
+            if self._loop is None:
+                logger.debug(f"Event bus has no loop yet, dropping {type(event).__name__}")
+                return
+            self._loop.call_soon_threadsafe(self.emit, event)
+            return
+        self.published += 1
+        for subscription in self._matching(event):
+            subscription.offer(event)
+
+    async def publish(self, event: Event):
+        """Publish an event, waiting on subscribers that apply backpressure."""
+        if not self._bind_loop():
+            self.emit(event)
+            return
+        self.published += 1
+        for subscription in self._matching(event):
+            await subscription.put(event)
+
+    def _matching(self, event: Event) -> list[Subscription]:
+        with self._lock:
+            return [subscription for subscription in self._subscriptions if subscription.accepts(event)]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        stats: dict[str, dict[str, int]] = {}
+        for subscription in subscriptions:
+            # Every UI session subscribes under the same name, so their counters are summed.
+            totals = stats.setdefault(subscription.name, {"subscribers": 0})
+            totals["subscribers"] += 1
+            for key, value in subscription.stats().items():
+                totals[key] = totals.get(key, 0) + value
+        return stats
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+from ...models.recording.recording_model import Recording
+
+
+@dataclass(frozen=True)
+class Event:
+    """Base class of everything published on the engine event bus."""
+
+
+@dataclass(frozen=True)
+class RecordingEvent(Event):
+    recording: Recording
+
+    @property
+    def rec_id(self) -> str:
+        return self.recording.rec_id
+
+
+@dataclass(frozen=True)
+class RecordingStatusChanged(RecordingEvent):
+    """The displayed state of a recording changed, e.g. its status text or monitor flag."""
+
+
+@dataclass(frozen=True)
+class LiveCheckStarted(RecordingEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class LiveCheckFailed(RecordingEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class WentLive(RecordingEvent):
+    title: str | None = None
+
+
+@dataclass(frozen=True)
+class WentOffline(RecordingEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class RecordingStarted(RecordingEvent):
+    record_url: str | None = None
+    output_path: str | None = None
+
+
+@dataclass(frozen=True)
+class RecordingStopped(RecordingEvent):
+    output_path: str | None = None
+    error: bool = False
+
+
+@dataclass(frozen=True)
+class SegmentClosed(RecordingEvent):
+    path: str = ""
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class OutputFinalized(RecordingEvent):
+    """An output file will not be written or post-processed by the recorder any more."""
+
+    path: str = ""
+
+
+@dataclass(frozen=True)
+class OutputMigrated(Event):
+    """A finished recording was moved from a hot output root to the cold storage root."""
+
+    source: str
+    destination: str
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class DiskSpaceChanged(Event):
+    """An output volume moved between the "ok", "low" (predicted to fill up soon) and "full" states."""
+
+    disk: str
+    state: str
+    free: int = 0
+    seconds_to_full: float | None = None
@@ -0,0 +1,149 @@
+import os
+
+from .registry import MetricsRegistry
+
+registry = MetricsRegistry.get_instance()
+
+LIVE_CHECK_DURATION = registry.histogram(
+    "streamcap_live_check_duration_seconds",
+    "Time spent resolving the stream info of a live room, excluding cache hits.",
+    ("platform",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0),
+)
+LIVE_CHECKS = registry.counter(
+    "streamcap_live_checks_total", "Completed live status checks by result.", ("platform", "result")
+)
+LIVE_CHECK_ERRORS = registry.counter(
+    "streamcap_live_check_errors_total", "Stream info resolutions that failed, by error type.", ("platform", "error")
+)
+RECORDINGS = registry.gauge("streamcap_recordings", "Recordings in the library by state.", ("state",))
+ACTIVE_RECORDERS = registry.gauge("streamcap_active_recorders", "Recorders currently writing output.")
+RECORDED_BYTES = registry.counter(
+    "streamcap_recorded_bytes_total", "Bytes written by recorders.", ("platform", "disk")
+)
+RECORDING_OUTPUT_BYTES = registry.gauge(
+    "streamcap_recording_output_bytes", "Output size of the current session of each active recording.", ("rec_id",)
+)
+RECORDER_RESTARTS = registry.counter(
+    "streamcap_recorder_restarts_total",
+    "Recorders replaced while the room stayed live, by reason (failover, url_refresh).",
+    ("platform", "reason"),
+)
+RECORDER_EXITS = registry.counter(
+    "streamcap_recorder_exits_total", "Recorders that ended, by outcome (stopped, error).", ("platform", "outcome")
+)
+QUEUE_DEPTH = registry.gauge(
+    "streamcap_queue_depth", "Pending or running background jobs by queue.", ("queue",)
+)
+NOTIFICATIONS = registry.counter(
+    "streamcap_notifications_total", "Message push attempts by service and result.", ("service", "result")
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "streamcap_event_loop_lag_seconds",
+    "Delay between when a periodic loop probe was due and when it ran.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_BUS_PENDING = registry.gauge(
+    "streamcap_event_bus_pending", "Events queued per event bus subscriber.", ("subscriber",)
+)
+EVENT_BUS_EVENTS = registry.counter(
+    "streamcap_event_bus_events_total",
+    "Events per event bus subscriber by outcome (delivered, coalesced, dropped, failed).",
+    ("subscriber", "outcome"),
+)
+RATE_LIMITER_RATE = registry.gauge(
+    "streamcap_rate_limiter_rate", "Current live check rate per platform in requests per second.", ("platform",)
+)
+RATE_LIMITER_THROTTLED = registry.counter(
+    "streamcap_rate_limiter_throttled_total", "Times a platform rate limited live checks.", ("platform",)
+)
+STREAM_INFO_CACHE = registry.counter(
+    "streamcap_stream_info_cache_lookups_total", "Stream info cache lookups by result.", ("result",)
+)
+STREAM_INFO_CACHE_SIZE = registry.gauge("streamcap_stream_info_cache_entries", "Cached stream info results.")
+HANDLER_CACHE = registry.counter(
+    "streamcap_handler_cache_lookups_total", "Platform handler cache lookups by result.", ("result",)
+)
+HANDLER_CACHE_EVICTIONS = registry.counter(
+    "streamcap_handler_cache_evictions_total", "Platform handlers evicted, expired or invalidated."
+)
+HANDLER_CACHE_SIZE = registry.gauge("streamcap_handler_cache_entries", "Cached platform handler instances.")
+ENGINE_WORKER_UP = registry.gauge(
+    "streamcap_engine_worker_up", "Whether each local engine worker process is running.", ("node",)
+)
+ENGINE_WORKER_RESTARTS = registry.counter(
+    "streamcap_engine_worker_restarts_total", "Restarts of each local engine worker process.", ("node",)
+)
+WARMUP_PENDING = registry.gauge("streamcap_warmup_pending_checks", "Live checks waiting in the startup warm-up.")
+DISK_FREE_BYTES = registry.gauge("streamcap_disk_free_bytes", "Free space of each output volume.", ("disk",))
+DISK_WRITE_RATE = registry.gauge(
+    "streamcap_disk_write_bytes_per_second", "Smoothed rate at which each output volume fills up.", ("disk",)
+)
+STORAGE_MIGRATIONS = registry.counter(
+    "streamcap_storage_migrations_total", "Recordings handled by storage tiering, by result.", ("result",)
+)
+STORAGE_MIGRATED_BYTES = registry.counter(
+    "streamcap_storage_migrated_bytes_total", "Bytes moved from the hot output roots to cold storage."
+)
+RETENTION_INDEXED_BYTES = registry.gauge(
+    "streamcap_retention_indexed_bytes", "Size of the recordings in the storage roots known to retention."
+)
+RETENTION_DELETED_BYTES = registry.counter(
+    "streamcap_retention_deleted_bytes_total", "Bytes of recordings deleted by retention rules or to free space."
+)
+
+
+def get_disk_label(path: str) -> str:
+    """The mount point or drive holding a path, used to aggregate written bytes per disk."""
+    path = os.path.abspath(path)
+    drive, _ = os.path.splitdrive(path)
+    if drive:
+        return drive
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def collect_engine_state():
+    from ..events.event_bus import EventBus
+    from ..platforms.platform_handlers import PlatformHandler
+    from ..platforms.stream_info_cache import StreamInfoCache
+    from ..recording.record_manager import GlobalRecordingState
+    from ..runtime.process_manager import BackgroundService
+
+    recordings = list(GlobalRecordingState.recordings)
+    RECORDINGS.set(len(recordings), state="total")
+    RECORDINGS.set(sum(1 for recording in recordings if recording.monitor_status), state="monitored")
+    RECORDINGS.set(sum(1 for recording in recordings if recording.is_live), state="live")
+    RECORDINGS.set(sum(1 for recording in recordings if recording.is_checking), state="checking")
+    ACTIVE_RECORDERS.set(sum(1 for recording in recordings if recording.is_recording))
+    WARMUP_PENDING.set(GlobalRecordingState.warmup.pending)
+    QUEUE_DEPTH.set(len(BackgroundService.get_instance().tasks), queue="background")
+
+    RATE_LIMITER_RATE.clear()
+    for platform_key, state in GlobalRecordingState.rate_limiter.snapshot().items():
+        RATE_LIMITER_RATE.set(state["rate"], platform=platform_key)
+        RATE_LIMITER_THROTTLED.set_total(state["throttled_total"], platform=platform_key)
+
+    cache_stats = StreamInfoCache.get_instance().stats()
+    STREAM_INFO_CACHE_SIZE.set(cache_stats["size"])
+    for result in ("hits", "coalesced", "misses"):
+        STREAM_INFO_CACHE.set_total(cache_stats[result], result=result)
+
+    handler_stats = PlatformHandler.get_cache_stats()
+    HANDLER_CACHE_SIZE.set(handler_stats["size"])
+    HANDLER_CACHE_EVICTIONS.set_total(handler_stats["evictions"])
+    for result in ("hits", "misses"):
+        HANDLER_CACHE.set_total(handler_stats[result], result=result)
+
+    EVENT_BUS_PENDING.clear()
+    for subscriber, stats in EventBus.get_instance().stats().items():
+        EVENT_BUS_PENDING.set(stats["pending"], subscriber=subscriber)
+        for outcome in ("delivered", "coalesced", "dropped", "failed"):
+            EVENT_BUS_EVENTS.set_total(stats[outcome], subscriber=subscriber, outcome=outcome)
+
+
+registry.add_collector(collect_engine_state)
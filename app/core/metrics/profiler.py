@@ -0,0 +1,269 @@
+import asyncio
+import heapq
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ...utils.logger import logger
+from .server import LoopLagMonitor
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_DIR = os.path.dirname(APP_DIR)
+
+
+def _location(frame: traceback.FrameSummary) -> str:
+    path = frame.filename
+    if path.startswith(PROJECT_DIR + os.sep):
+        path = os.path.relpath(path, PROJECT_DIR)
+    return f"{path}:{frame.lineno} {frame.name}"
+
+
+def trim_loop_frames(stack: traceback.StackSummary) -> traceback.StackSummary:
+    """Drop the frames of the event loop itself, keeping the callback that blocks it."""
+    for index in range(len(stack) - 1, -1, -1):
+        frame = stack[index]
+        if frame.name == "_run" and frame.filename.endswith(os.path.join("asyncio", "events.py")):
+            return traceback.StackSummary.from_list(stack[index + 1:]) if index + 1 < len(stack) else stack
+    return stack
+
+
+def call_site(stack: traceback.StackSummary) -> str:
+    """
+    Describe where a blocked loop is stuck as "<innermost StreamCap frame> -> <innermost frame>", e.g.
+    ``app/utils/utils.py:120 get_file_paths -> os.py:scandir``; the first part is the code to fix.
+    """
+    leaf = stack[-1]
+    own = next((frame for frame in reversed(stack) if frame.filename.startswith(APP_DIR + os.sep)), None)
+    leaf_name = f"{os.path.basename(leaf.filename)}:{leaf.name}"
+    if own is None:
+        return _location(leaf)
+    if own is leaf:
+        return _location(own)
+    return f"{_location(own)} -> {leaf_name}"
+
+
+@dataclass
+class Stall:
+    started_at: datetime
+    task_name: str
+    duration: float = 0.0
+    sites: Counter = field(default_factory=Counter)
+    stacks: dict[str, traceback.StackSummary] = field(default_factory=dict)
+
+    @property
+    def main_site(self) -> str:
+        return self.sites.most_common(1)[0][0] if self.sites else "unknown"
+
+    def __lt__(self, other: "Stall"):
+        return self.duration < other.duration
+
+
+class LoopProfiler:
+    """
+    Opt-in profiler for an event loop that is blocked by synchronous code.
+
+    A probe coroutine beats every ``PROBE_INTERVAL`` seconds. A watchdog thread checks the beat and, while
+    it is overdue by more than ``threshold`` seconds, samples the stack of the loop thread. Every stall is
+    logged with the running task and the stack of its most sampled call site; the samples are aggregated
+    into the blocking call sites written to ``report_path`` every ``report_interval`` seconds.
+    """
+
+    PROBE_INTERVAL = 0.05
+    SAMPLE_INTERVAL = 0.01
+    LAG_HISTORY = 20000
+    TOP_ENTRIES = 15
+
+    def __init__(self, report_path: str, threshold: float = 0.1, report_interval: float = 300):
+        self.report_path = report_path
+        self.threshold = threshold
+        self.report_interval = report_interval
+        self.monitor = LoopLagMonitor(self.PROBE_INTERVAL, histogram=None, history=self.LAG_HISTORY)
+        self.site_time: Counter = Counter()
+        self.task_time: Counter = Counter()
+        self.stall_count = 0
+        self.stall_time = 0.0
+        self.slowest: list[Stall] = []
+        self.started = time.time()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._report_task: asyncio.Task | None = None
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self.monitor.start()
+        self._thread = threading.Thread(target=self._watch, name="loop-profiler", daemon=True)
+        self._thread.start()
+        self._report_task = self.loop.create_task(self._report_periodically())
+        logger.info(
+            f"Event loop profiler started, threshold {self.threshold * 1000:.0f}ms, report: {self.report_path}"
+        )
+
+    def stop(self):
+        self._stop_event.set()
+        self.monitor.stop()
+        if self._report_task:
+            self._report_task.cancel()
+        self.write_report()
+
+    def _current_task_name(self) -> str:
+        try:
+            task = asyncio.current_task(self.loop)
+        except RuntimeError:
+            task = None
+        return task.get_name() if task else "<callback>"
+
+    def _watch(self):
+        stall = None
+        while not self._stop_event.wait(self.SAMPLE_INTERVAL):
+            blocked_for = time.perf_counter() - self.monitor.last_beat - self.monitor.interval
+            if blocked_for < self.threshold:
+                if stall is not None:
+                    self._finish(stall)
+                    stall = None
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = trim_loop_frames(traceback.extract_stack(frame))
+            del frame
+            if stall is None:
+                stall = Stall(datetime.now(), self._current_task_name())
+            site = call_site(stack)
+            stall.sites[site] += 1
+            stall.stacks.setdefault(site, stack)
+            stall.duration = blocked_for
+            with self._lock:
+                self.site_time[site] += self.SAMPLE_INTERVAL
+
+    def _finish(self, stall: Stall):
+        with self._lock:
+            self.stall_count += 1
+            self.stall_time += stall.duration
+            self.task_time[stall.task_name] += stall.duration
+            stall.stacks = {stall.main_site: stall.stacks[stall.main_site]}
+            if len(self.slowest) < self.TOP_ENTRIES:
+                heapq.heappush(self.slowest, stall)
+            elif stall.duration > self.slowest[0].duration:
+                heapq.heapreplace(self.slowest, stall)
+        stack = "".join(traceback.format_list(stall.stacks[stall.main_site]))
+        logger.warning(
+            f"Event loop blocked for {stall.duration:.3f}s in task {stall.task_name} at {stall.main_site}\n{stack}"
+        )
+
+    async def _report_periodically(self):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            await asyncio.to_thread(self.write_report)
+
+    def lag_percentiles(self) -> dict[str, float]:
+        lags = sorted(self.monitor.history)
+        if not lags:
+            return {}
+        return {
+            name: lags[min(len(lags) - 1, int(len(lags) * quantile))]
+            for name, quantile in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))
+        }
+
+    def render_report(self) -> str:
+        with self._lock:
+            site_time = self.site_time.most_common(self.TOP_ENTRIES)
+            task_time = self.task_time.most_common(self.TOP_ENTRIES)
+            slowest = sorted(self.slowest, reverse=True)
+            stall_count, stall_time = self.stall_count, self.stall_time
+            sampled_total = sum(self.site_time.values()) or 1
+        lags = self.lag_percentiles()
+
+        lines = [
+            f"Event loop profile at {datetime.now():%Y-%m-%d %H:%M:%S}, "
+            f"running for {time.time() - self.started:.0f}s, pid {os.getpid()}",
+            "Loop lag: " + (", ".join(f"{name} {value * 1000:.1f}ms" for name, value in lags.items()) or "no samples"),
+            f"Stalls over {self.threshold * 1000:.0f}ms: {stall_count}, {stall_time:.2f}s in total",
+            "",
+            "Top blocking call sites (sampled time):",
+        ]
+        lines += [f"  {seconds:8.2f}s {seconds / sampled_total:6.1%}  {site}" for site, seconds in site_time]
+        lines += ["", "Blocked time by task:"]
+        lines += [f"  {seconds:8.2f}s  {task_name}" for task_name, seconds in task_time]
+        lines += ["", "Slowest stalls:"]
+        for stall in slowest:
+            lines.append(f"  {stall.duration:8.3f}s  {stall.started_at:%H:%M:%S}  {stall.task_name}  {stall.main_site}")
+        for stall in slowest[:3]:
+            lines += ["", f"Stack of the {stall.duration:.3f}s stall in {stall.task_name}:"]
+            lines.append("".join(traceback.format_list(stall.stacks[stall.main_site])).rstrip())
+        return "\n".join(lines) + "\n"
+
+    def write_report(self):
+        report = self.render_report()
+        try:
+            os.makedirs(os.path.dirname(self.report_path), exist_ok=True)
+            with open(self.report_path, "w", encoding="utf-8") as file:
+                file.write(report)
+        except OSError as e:
+            logger.error(f"Failed to write the event loop profile: {e}")
+            return
+        logger.info(f"Event loop profile: {self.stall_count} stalls, {self.stall_time:.2f}s blocked")
+
+
+def loop_profiler_settings(app) -> tuple[bool, float, float]:
+    """
+    Whether the profiler is on, from ``loop_profiler`` in the settings unless the LOOP_PROFILER environment
+    variable is set, and its threshold and report interval in seconds.
+    """
+    user_config = app.settings.user_config
+    enabled = os.getenv("LOOP_PROFILER")
+    if enabled is None:
+        enabled = user_config.get("loop_profiler")
+
+    try:
+        threshold = float(user_config.get("loop_profiler_threshold_ms") or 100) / 1000
+        report_interval = float(user_config.get("loop_profiler_report_interval") or 300)
+    except ValueError:
+        logger.warning("Invalid loop profiler settings, using the defaults")
+        threshold, report_interval = 0.1, 300
+    return str(enabled).lower() in ("true", "1"), threshold, report_interval
+
+
+def start_loop_profiler(app) -> LoopProfiler | None:
+    """
+    Start the profiler when ``loop_profiler`` is enabled in the settings or the LOOP_PROFILER environment
+    variable is "true". Each engine process writes its own report to ``logs/``.
+    """
+    enabled, threshold, report_interval = loop_profiler_settings(app)
+    if not enabled:
+        return None
+
+    node_id = getattr(app, "node_id", None)
+    file_name = f"loop_profile_{node_id}.txt" if node_id else "loop_profile.txt"
+    profiler = LoopProfiler(os.path.join(app.run_path, "logs", file_name), threshold, report_interval)
+    profiler.start()
+    return profiler
+
+
+def apply_loop_profiler_settings(app):
+    """
+    Start, stop or retune ``app.loop_profiler`` after its settings changed. Must run on the app's event loop.
+    """
+    enabled, threshold, report_interval = loop_profiler_settings(app)
+    profiler = app.loop_profiler
+    if not enabled:
+        if profiler:
+            profiler.stop()
+            app.loop_profiler = None
+            logger.info("Event loop profiler stopped")
+    elif profiler is None:
+        app.loop_profiler = start_loop_profiler(app)
+    else:
+        # Both are read on every use: the watchdog compares each sample against the threshold and the report
+        # task picks up the new interval after its current sleep.
+        profiler.threshold = threshold
+        profiler.report_interval = report_interval
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import time
+from collections import deque
+
+from ...utils.logger import logger
+from ..events.event_bus import EventBus
+from ..events.events import RecordingStopped
+from .metrics import EVENT_LOOP_LAG, RECORDER_EXITS, RECORDING_OUTPUT_BYTES
+from .registry import Histogram, MetricsRegistry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic probe runs on the event loop, i.e. how long the loop was blocked."""
+
+    def __init__(self, interval: float = 0.5, histogram: Histogram | None = EVENT_LOOP_LAG, history: int = 0):
+        self.interval = interval
+        self.histogram = histogram
+        self.history = deque(maxlen=history) if history else None
+        self.last_lag = 0.0
+        self.last_beat = time.perf_counter()
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self.last_beat = time.perf_counter()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.last_beat = time.perf_counter()
+            self.last_lag = max(0.0, self.last_beat - expected)
+            if self.histogram:
+                self.histogram.observe(self.last_lag)
+            if self.history is not None:
+                self.history.append(self.last_lag)
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing ``GET /metrics`` in the Prometheus text format on a dedicated port.
+
+    It runs on the engine's event loop, so a scrape also reflects how responsive that loop is.
+    """
+
+    def __init__(self, host: str, port: int, registry: MetricsRegistry | None = None):
+        self.host = host
+        self.port = port
+        self.registry = registry or MetricsRegistry.get_instance()
+        self.loop_monitor = LoopLagMonitor()
+        self._server: asyncio.AbstractServer | None = None
+        self._subscription = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.loop_monitor.start()
+        self._subscription = EventBus.get_instance().subscribe(
+            self.on_recording_stopped, RecordingStopped, name="metrics"
+        )
+        logger.info(f"Metrics available at http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        self.loop_monitor.stop()
+        if self._subscription:
+            self._subscription.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @staticmethod
+    async def on_recording_stopped(event: RecordingStopped):
+        RECORDER_EXITS.inc(
+            platform=event.recording.platform_key or "unknown", outcome="error" if event.error else "stopped"
+        )
+        RECORDING_OUTPUT_BYTES.remove(rec_id=event.rec_id)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while (line := await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] not in ("GET", "HEAD"):
+                await self._respond(writer, 405, "Method Not Allowed\n")
+            elif parts[1].split("?", 1)[0] != "/metrics":
+                await self._respond(writer, 404, "Not Found\n")
+            else:
+                body = await asyncio.to_thread(self.registry.render)
+                await self._respond(writer, 200, body, CONTENT_TYPE, head_only=parts[0] == "HEAD")
+        except (asyncio.TimeoutError, ConnectionError, UnicodeDecodeError):
+            pass
+        except Exception as e:
+            logger.warning(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(
+            writer: asyncio.StreamWriter,
+            status: int,
+            body: str,
+            content_type: str = "text/plain; charset=utf-8",
+            head_only: bool = False,
+    ):
+        reasons = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}
+        payload = body.encode("utf-8")
+        headers = (
+            f"HTTP/1.1 {status} {reasons[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(headers.encode("latin-1") + (b"" if head_only else payload))
+        await writer.drain()
+
+
+async def start_metrics_server(app) -> MetricsServer | None:
+    """
+    Start the metrics endpoint when ``metrics_port`` (or the METRICS_PORT environment variable) is set;
+    0 or empty keeps it disabled.
+    """
+    user_config = app.settings.user_config
+    port = os.getenv("METRICS_PORT") or user_config.get("metrics_port") or "0"
+    host = os.getenv("METRICS_HOST") or user_config.get("metrics_host") or DEFAULT_METRICS_HOST
+    try:
+        port = int(port)
+    except ValueError:
+        logger.warning(f"Invalid metrics port: {port}")
+        return None
+    if port <= 0:
+        return None
+
+    server = MetricsServer(host, port)
+    try:
+        await server.start()
+    except OSError as e:
+        logger.error(f"Failed to start metrics server on {host}:{port}: {e}")
+        return None
+    return server
@@ -1,19 +1,30 @@
 import abc
+import asyncio
+import contextlib
 import inspect
-import re
 import threading
-from typing import Any, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
-from streamget import StreamData
+from ....utils.lazy_import import LazyModule
+from .handler_cache import HandlerCache
+from .router import PlatformRouter, RouteMatch
+
+if TYPE_CHECKING:
+    from streamget import StreamData
+
+# streamget imports every platform client up front, so it is only loaded once a handler actually resolves a stream.
+streamget = LazyModule("streamget")
 
 T = TypeVar("T", bound="PlatformHandler")
-InstanceKey = tuple[str | None, tuple[tuple[str, str], ...] | None, str, str | None, str | None, str | None, str | None]
 
 
 class PlatformHandler(abc.ABC):
     _registry: dict[str, type["PlatformHandler"]] = {}
-    _instances: dict[InstanceKey, "PlatformHandler"] = {}
+    _instances: HandlerCache = HandlerCache()
     _lock: threading.Lock = threading.Lock()
+    router: PlatformRouter
+    # Keeps the tasks closing clients on a running loop alive until they finish.
+    _close_tasks: set[asyncio.Task] = set()
 
     def __init__(
         self,
@@ -32,14 +43,83 @@ class PlatformHandler(abc.ABC):
         self.username = username
         self.password = password
         self.account_type = account_type
+        self._use_lock = threading.Lock()
+        self._in_use = 0
+        self._close_requested = False
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     @abc.abstractmethod
-    async def get_stream_info(self, live_url: str) -> StreamData:
+    async def get_stream_info(self, live_url: str) -> "StreamData":
         """
         Abstract method to get stream information based on the live URL.
         """
         pass
 
+    @contextlib.contextmanager
+    def in_use(self):
+        """
+        Mark the handler as busy resolving a stream; a ``close`` requested meanwhile (e.g. when the handler is
+        evicted from the cache) is carried out once the last use ends.
+        """
+        with self._use_lock:
+            self._in_use += 1
+            try:
+                # The client is bound to the loop it is used on, which is where it has to be closed too.
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        try:
+            yield self
+        finally:
+            with self._use_lock:
+                self._in_use -= 1
+                close_now = not self._in_use and self._close_requested
+                if close_now:
+                    self._close_requested = False
+            if close_now:
+                self._close_client()
+
+    def close(self) -> None:
+        """
+        Release the HTTP resources held by the underlying streamget client, if any, once no check uses it.
+        """
+        with self._use_lock:
+            if self._in_use:
+                self._close_requested = True
+                return
+        self._close_client()
+
+    def _close_client(self) -> None:
+        live_stream = getattr(self, "live_stream", None)
+        if live_stream is None:
+            return
+        for method_name in ("aclose", "close"):
+            method = getattr(live_stream, method_name, None)
+            if not callable(method):
+                continue
+            result = method()
+            if inspect.isawaitable(result):
+                self._run_on_owning_loop(result)
+            return
+
+    def _run_on_owning_loop(self, coro) -> None:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        loop = self._loop if self._loop is not None and not self._loop.is_closed() else running_loop
+        if loop is None:
+            asyncio.run(coro)
+        elif loop is running_loop:
+            task = loop.create_task(coro)
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, loop)
+        else:
+            # An idle resolver pool loop, closed from the worker thread that runs it between resolutions.
+            loop.run_until_complete(coro)
+
     @classmethod
     def register(cls: type[T], *patterns: str) -> type[T]:
         """
@@ -48,6 +128,7 @@ class PlatformHandler(abc.ABC):
         with cls._lock:
             for pattern in patterns:
                 cls._registry[pattern] = cls
+        PlatformHandler.router.invalidate()
         return cls
 
     @classmethod
@@ -60,24 +141,42 @@ class PlatformHandler(abc.ABC):
 
     @classmethod
     def _get_instance_key(
-        cls, proxy: str | None, cookies: str | None, record_quality: str, platform: str | None,
-        username: str | None = None, password: str | None = None, account_type: str | None = None
-    ) -> InstanceKey:
+        cls, handler_class: type["PlatformHandler"], proxy: str | None, cookies: str | None, record_quality: str,
+        platform: str | None, username: str | None = None, password: str | None = None,
+        account_type: str | None = None
+    ) -> str:
+        """
+        Generate a hashed key for each instance so that credentials are not kept as cache keys.
         """
-        Generate a unique key for each instance based on the provided parameters.
+        return HandlerCache.make_key(
+            handler_class.__qualname__, proxy, cookies, record_quality, platform, username, password, account_type
+        )
+
+    @classmethod
+    def invalidate_instances(cls, platform_key: str | None = None) -> int:
+        """
+        Close and drop cached handlers of a platform, e.g. after its cookies or account changed.
         """
-        return proxy, cookies, record_quality, platform, username, password, account_type
+        return cls._instances.invalidate(platform_key)
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, int]:
+        """Handler cache statistics of this process, including the caches of thread resolver pool workers."""
+        return HandlerCache.combined_stats()
 
     @classmethod
     def _get_handler_class(cls, live_url: str) -> type["PlatformHandler"] | None:
         """
         Find the appropriate handler class based on the live URL.
         """
-        registered_patterns = cls.get_registered_patterns()
-        for pattern, handler_class in registered_patterns.items():
-            if re.search(pattern, live_url):
-                return handler_class
-        return None
+        return cls.router.resolve(live_url).handler_class
+
+    @classmethod
+    def resolve_route(cls, live_url: str) -> RouteMatch:
+        """
+        Resolve the handler class and platform info of a live URL in one cached lookup.
+        """
+        return cls.router.resolve(live_url)
 
     @classmethod
     def get_handler_instance(
@@ -90,16 +189,23 @@ class PlatformHandler(abc.ABC):
         username: str | None = None,
         password: str | None = None,
         account_type: str | None = None,
+        cache: HandlerCache | None = None,
     ) -> Optional["PlatformHandler"]:
         """
-        Get or create an instance of a platform handler based on the live URL and other parameters.
+        Get or create an instance of a platform handler based on the live URL and other parameters, from
+        ``cache`` when given (e.g. a resolver pool worker's own) instead of the shared one.
         """
-        handler_class = cls._get_handler_class(live_url)
+        instances = cls._instances if cache is None else cache
+        route = cls.resolve_route(live_url)
+        handler_class = route.handler_class
         if not handler_class:
             return None
 
-        instance_key = cls._get_instance_key(proxy, cookies, record_quality, platform, username, password, account_type)
-        if instance_key not in cls._instances:
+        instance_key = cls._get_instance_key(
+            handler_class, proxy, cookies, record_quality, platform, username, password, account_type
+        )
+        handler = instances.get(instance_key)
+        if handler is None:
             init_signature = inspect.signature(handler_class.__init__)
             handler_kwargs: dict[str, Any] = {
                 "proxy": proxy,
@@ -111,8 +217,9 @@ class PlatformHandler(abc.ABC):
                 "account_type": account_type,
             }
             filtered_kwargs = {k: v for k, v in handler_kwargs.items() if k in init_signature.parameters}
-            with cls._lock:
-                if instance_key not in cls._instances:
-                    cls._instances[instance_key] = handler_class(**filtered_kwargs)
+            handler = instances.put(instance_key, handler_class(**filtered_kwargs), route.platform_key)
+
+        return handler
+
 
-        return cls._instances[instance_key]
+PlatformHandler.router = PlatformRouter(PlatformHandler.get_registered_patterns)
@@ -0,0 +1,143 @@
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ....utils.logger import logger
+
+
+@dataclass
+class HandlerCacheEntry:
+    handler: Any
+    platform_key: str | None
+    last_used: float
+
+
+class HandlerCache:
+    """
+    LRU cache of platform handler instances with an idle TTL.
+
+    Keys are SHA-256 digests of the handler parameters so cookies and account passwords are never kept
+    as plain dictionary keys. Evicted or invalidated handlers are closed to release their HTTP resources.
+    """
+
+    # Every live cache (the shared one and those of the resolver pool workers) and their running totals, which
+    # outlive the caches of workers that were replaced, for ``combined_stats``.
+    _caches: "weakref.WeakSet[HandlerCache]" = weakref.WeakSet()
+    _totals: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+    _totals_lock = threading.Lock()
+
+    def __init__(self, maxsize: int = 256, ttl: float = 1800):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, HandlerCacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        HandlerCache._caches.add(self)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, dict):
+                part = sorted(part.items())
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.last_used > self.ttl:
+                self._evict(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                self._count("misses")
+                return None
+            entry.last_used = now
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._count("hits")
+            return entry.handler
+
+    def put(self, key: str, handler: Any, platform_key: str | None = None) -> Any:
+        """Store a handler unless another thread got there first, and return the cached instance."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.handler
+            self._entries[key] = HandlerCacheEntry(handler, platform_key, time.monotonic())
+            self._purge()
+            return handler
+
+    def invalidate(self, platform_key: str | None = None) -> int:
+        """Drop every handler of a platform, or all handlers when no platform key is given."""
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if platform_key is None or entry.platform_key == platform_key
+            ]
+            for key in keys:
+                self._evict(key)
+        if keys:
+            logger.debug(f"Invalidated {len(keys)} cached handler(s) for platform: {platform_key or 'all'}")
+        return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    def _purge(self):
+        now = time.monotonic()
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.maxsize and now - entry.last_used <= self.ttl:
+                break
+            self._evict(key)
+
+    def _evict(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.evictions += 1
+        self._count("evictions")
+        close = getattr(entry.handler, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Failed to close evicted handler {type(entry.handler).__name__}: {e}")
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    @classmethod
+    def _count(cls, field: str):
+        with cls._totals_lock:
+            cls._totals[field] += 1
+
+    @classmethod
+    def combined_stats(cls) -> dict[str, int]:
+        """Size, hits, misses and evictions over every handler cache this process has used."""
+        caches = list(cls._caches)
+        with cls._totals_lock:
+            totals = dict(cls._totals)
+        return {"caches": len(caches), "size": sum(len(cache) for cache in caches), **totals}
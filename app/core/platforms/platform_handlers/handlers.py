@@ -1,7 +1,12 @@
-import streamget
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from ....utils.utils import trace_error_decorator
-from .base import PlatformHandler, StreamData
+from .base import PlatformHandler, streamget
+
+if TYPE_CHECKING:
+    from streamget import StreamData
 
 
 class CustomHandler(PlatformHandler):
@@ -18,7 +23,9 @@ class CustomHandler(PlatformHandler):
 
     @trace_error_decorator
     async def get_stream_info(self, live_url: str) -> StreamData:
-        stream_data = StreamData(platform="Custom", anchor_name="CustomLive", is_live=True, record_url=live_url)
+        stream_data = streamget.StreamData(
+            platform="Custom", anchor_name="CustomLive", is_live=True, record_url=live_url
+        )
         if ".flv" in live_url:
             stream_data.flv_url = live_url
         if ".m3u8" in live_url:
@@ -0,0 +1,192 @@
+import functools
+import re
+import threading
+from collections.abc import Callable
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+PLATFORM_INFO_TABLE: tuple[tuple[str, str, str], ...] = (
+    ("douyin.com/", "抖音直播", "douyin"),
+    ("https://www.tiktok.com/", "TikTok直播", "tiktok"),
+    ("https://live.kuaishou.com/", "快手直播", "kuaishou"),
+    ("https://www.huya.com/", "虎牙直播", "huya"),
+    ("https://www.douyu.com/", "斗鱼直播", "douyu"),
+    ("https://www.yy.com/", "YY直播", "yy"),
+    ("https://live.bilibili.com/", "B站直播", "bilibili"),
+    ("https://www.xiaohongshu.com/", "小红书直播", "xiaohongshu"),
+    ("xhslink.com/", "小红书直播", "xhs"),
+    ("https://www.bigo.tv/", "Bigo直播", "bigo"),
+    ("https://app.blued.cn/", "Blued直播", "blued"),
+    ("sooplive.co.kr/", "SOOP", "sooplive"),
+    ("www.sooplive.com/", "SOOP", "sooplive"),
+    ("cc.163.com/", "网易CC直播", "netease"),
+    ("qiandurebo.com/", "千度热播", "qiandurebo"),
+    ("pandalive.co.kr/", "PandaTV", "pandalive"),
+    ("fm.missevan.com/", "猫耳FM直播", "maoerfm"),
+    ("winktv.co.kr/", "WinkTV", "winktv"),
+    ("flextv.co.kr/", "FlexTV", "flextv"),
+    ("ttinglive.com/", "FlexTV", "flextv"),
+    ("look.163.com/", "Look直播", "look"),
+    ("popkontv.com/", "PopkonTV", "popkontv"),
+    ("twitcasting.tv/", "TwitCasting", "twitcasting"),
+    ("live.baidu.com/", "百度直播", "baidu"),
+    ("weibo.com/", "微博直播", "weibo"),
+    ("kugou.com/", "酷狗直播", "kugou"),
+    ("twitch.tv/", "TwitchTV", "twitch"),
+    ("liveme.com/", "LiveMe", "liveme"),
+    ("huajiao.com/", "花椒直播", "huajiao"),
+    ("7u66.com/", "流星直播", "liuxing"),
+    ("showroom-live.com/", "ShowRoom", "showroom"),
+    ("live.acfun.cn/", "Acfun", "acfun"),
+    ("tlclw.com/", "畅聊直播", "changliao"),
+    ("ybw1666.com/", "音播直播", "yingbo"),
+    ("inke.cn/", "映客直播", "inke"),
+    ("zhihu.com/", "知乎直播", "zhihu"),
+    ("chzzk.naver.com/", "CHZZK", "chzzk"),
+    ("haixiutv.com/", "嗨秀直播", "haixiu"),
+    ("vvxqiu.com/", "VV星球", "vvxq"),
+    ("17.live/", "17Live", "17live"),
+    ("lang.live/", "浪Live", "lang"),
+    ("m.pp.weimipopo.com/", "漂漂直播", "piaopiao"),
+    (".6.cn/", "六间房直播", "6room"),
+    ("lehaitv.com/", "乐嗨直播", "lehai"),
+    ("h.catshow168.com/", "花猫直播", "catshow"),
+    ("live.shopee", "shopee", "shopee"),
+    (".shp.", "shopee", "shopee"),
+    ("youtube.com/", "Youtube", "youtube"),
+    ("tb.cn", "淘宝直播", "taobao"),
+    ("tbzb.taobao.com", "淘宝直播", "taobao"),
+    ("3.cn", "京东直播", "jd"),
+    ("faceit.com", "faceit", "faceit"),
+    ("lailianjie.com", "连接直播", "lianjie"),
+    ("miguvideo.com", "咪咕直播", "migu"),
+    ("imkktv.com", "来秀直播", "laixiu"),
+    ("picarto.tv", "Picarto", "picarto"),
+    (".m3u8", "自定义录制直播", "custom"),
+    (".flv", "自定义录制直播", "custom"),
+)
+
+# Entries that are not a host suffix and therefore keep the original substring semantics.
+URL_FRAGMENT_KEYS = frozenset({"live.shopee", ".shp.", ".m3u8", ".flv"})
+HOST_LABEL_PATTERN = re.compile(r"^[a-z0-9-]+(?:\.[a-z0-9-]+)+$")
+
+
+class RouteMatch(NamedTuple):
+    handler_class: Any
+    platform: str | None
+    platform_key: str | None
+
+
+class HostSuffixTrie:
+    """Trie over reversed host labels, returning the value of the longest registered suffix."""
+
+    _VALUE = object()
+
+    def __init__(self):
+        self._root: dict = {}
+
+    def insert(self, host: str, value: Any):
+        node = self._root
+        for label in reversed(host.lower().split(".")):
+            node = node.setdefault(label, {})
+        node.setdefault(self._VALUE, value)
+
+    def lookup(self, host: str | None) -> Any:
+        if not host:
+            return None
+        node = self._root
+        found = None
+        for label in reversed(host.lower().split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(self._VALUE, found)
+        return found
+
+
+class PlatformRouter:
+    """
+    Resolve a live room URL to its handler class and platform info.
+
+    Handler patterns are compiled into one regex that preserves registration order. Platform info
+    keeps the semantics of the ordered substring table: the host-suffix trie only proposes an entry,
+    which is used when its key occurs in the URL and no earlier entry does, otherwise the table is
+    scanned in order. Results are memoized per URL and the cache is dropped whenever a new handler
+    pattern is registered.
+    """
+
+    def __init__(self, patterns_provider: Callable[[], dict[str, Any]], cache_size: int = 2048):
+        self._patterns_provider = patterns_provider
+        self._lock = threading.Lock()
+        self._handler_regex: re.Pattern | None = None
+        self._handler_groups: dict[str, Any] = {}
+        self._host_trie = HostSuffixTrie()
+        self._platform_table: list[tuple[str, str, str]] = []
+        self._build_platform_table()
+        self._resolve_cached = functools.lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _build_platform_table(self):
+        for index, (key, platform, platform_key) in enumerate(PLATFORM_INFO_TABLE):
+            host = key.split("://", 1)[-1].strip("./")
+            if key not in URL_FRAGMENT_KEYS and HOST_LABEL_PATTERN.match(host):
+                self._host_trie.insert(host, index)
+            self._platform_table.append((key, platform, platform_key))
+
+    def build(self):
+        """Compile the combined handler pattern from the current registry."""
+        patterns = self._patterns_provider()
+        groups = {}
+        alternatives = []
+        for index, (pattern, handler_class) in enumerate(patterns.items()):
+            group_name = f"_route{index}"
+            groups[group_name] = handler_class
+            alternatives.append(f"(?=[\\s\\S]*?(?P<{group_name}>{pattern}))")
+        regex = re.compile("^(?:" + "|".join(alternatives) + ")") if alternatives else None
+        with self._lock:
+            self._handler_regex = regex
+            self._handler_groups = groups
+
+    def invalidate(self):
+        with self._lock:
+            self._handler_regex = None
+            self._handler_groups = {}
+        self._resolve_cached.cache_clear()
+
+    def resolve(self, url: str) -> RouteMatch:
+        return self._resolve_cached(url)
+
+    def cache_info(self):
+        return self._resolve_cached.cache_info()
+
+    def _resolve(self, url: str) -> RouteMatch:
+        platform, platform_key = self.get_platform_info(url)
+        return RouteMatch(self.get_handler_class(url), platform, platform_key)
+
+    def get_handler_class(self, url: str) -> Any:
+        if self._handler_regex is None:
+            self.build()
+        regex, groups = self._handler_regex, self._handler_groups
+        if regex is None:
+            return None
+        match = regex.match(url)
+        if not match:
+            return None
+        if match.lastgroup in groups:
+            return groups[match.lastgroup]
+        for group_name, value in match.groupdict().items():
+            if value is not None and group_name in groups:
+                return groups[group_name]
+        return None
+
+    def get_platform_info(self, url: str) -> tuple[str | None, str | None]:
+        host = urlsplit(url if "://" in url else f"//{url}").hostname
+        index = self._host_trie.lookup(host)
+        if index is not None:
+            key, platform, platform_key = self._platform_table[index]
+            if key in url and not any(earlier in url for earlier, _, _ in self._platform_table[:index]):
+                return platform, platform_key
+
+        for key, platform, platform_key in self._platform_table:
+            if key in url:
+                return platform, platform_key
+        return None, None
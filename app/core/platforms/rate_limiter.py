@@ -0,0 +1,160 @@
+import asyncio
+import re
+import time
+
+from ...utils.logger import logger
+
+THROTTLE_STATUS_CODES = (403, 429)
+# Status codes only count next to an HTTP status wording, room ids and URLs in the message contain numbers too.
+THROTTLE_PATTERN = re.compile(
+    r"(?:status(?: code)?|http(?: error)?|error code)\W{0,3}(?:403|429)\b|too many requests|forbidden|rate limit",
+    re.IGNORECASE,
+)
+
+
+def is_throttle_error(error: BaseException | None) -> bool:
+    """Return True if an error looks like the platform is rate limiting or banning us."""
+    if error is None:
+        return False
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None) or getattr(error, "status_code", None)
+    if status_code in THROTTLE_STATUS_CODES:
+        return True
+    return bool(THROTTLE_PATTERN.search(str(error)))
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to how the platform responds.
+
+    A throttle response halves the rate and starts an exponentially growing cooldown, empty results shave
+    the rate a little, and every success raises it back towards the configured rate in small steps.
+    """
+
+    EMPTY_RESULT_FACTOR = 0.8
+    EMPTY_RESULTS_BEFORE_COOLDOWN = 3
+    RECOVERY_STEP = 0.1
+    BASE_COOLDOWN = 30.0
+    MAX_COOLDOWN = 900.0
+
+    def __init__(self, platform_key: str, rate: float, burst: int, min_rate: float | None = None):
+        self.platform_key = platform_key
+        self.base_rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min_rate or rate / 20
+        self.rate = rate
+        self.tokens = float(self.burst)
+        self.cooldown_until = 0.0
+        self.strikes = 0
+        self.empty_results = 0
+        self.throttled_total = 0
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        # The lock only guards taking a token; waiting happens outside it so a cooldown never queues the
+        # other checks of the platform behind one sleeper.
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                if now < self.cooldown_until:
+                    delay = self.cooldown_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    delay = (1 - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+
+    async def wait_for_cooldown(self):
+        """Wait until the platform is out of its cooldown, without taking a token."""
+        while (delay := self.cooldown_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self):
+        self.empty_results = 0
+        if self.rate >= self.base_rate and not self.strikes:
+            return
+        self.rate = min(self.base_rate, self.rate + self.base_rate * self.RECOVERY_STEP)
+        if self.rate >= self.base_rate:
+            self.strikes = 0
+            logger.info(f"Rate limiter recovered: {self.platform_key}, rate {self.rate:.2f}/s")
+
+    def on_throttled(self, reason: str = "throttled"):
+        now = time.monotonic()
+        self.strikes += 1
+        self.throttled_total += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        cooldown = min(self.MAX_COOLDOWN, self.BASE_COOLDOWN * 2 ** (self.strikes - 1))
+        self.cooldown_until = max(self.cooldown_until, now + cooldown)
+        self.tokens = 0
+        self._updated_at = now
+        logger.warning(
+            f"Rate limiter backing off: {self.platform_key} ({reason}), "
+            f"rate {self.rate:.2f}/s, cooldown {cooldown:.0f}s"
+        )
+
+    def on_empty_result(self):
+        self.empty_results += 1
+        if self.empty_results >= self.EMPTY_RESULTS_BEFORE_COOLDOWN:
+            self.empty_results = 0
+            self.on_throttled("repeated empty stream data")
+        else:
+            self.rate = max(self.min_rate, self.rate * self.EMPTY_RESULT_FACTOR)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {
+            "rate": round(self.rate, 3),
+            "base_rate": self.base_rate,
+            "burst": self.burst,
+            "tokens": round(min(self.burst, self.tokens + (now - self._updated_at) * self.rate), 2),
+            "cooldown_remaining": round(max(0.0, self.cooldown_until - now), 1),
+            "strikes": self.strikes,
+            "throttled_total": self.throttled_total,
+        }
+
+
+class PlatformRateLimiter:
+    """Registry of one adaptive token bucket per platform key."""
+
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, AdaptiveTokenBucket] = {}
+
+    def get(self, platform_key: str | None) -> AdaptiveTokenBucket:
+        platform_key = platform_key or "unknown"
+        bucket = self._buckets.get(platform_key)
+        if bucket is None:
+            bucket = AdaptiveTokenBucket(platform_key, self.rate, self.burst)
+            self._buckets[platform_key] = bucket
+        return bucket
+
+    def configure(self, rate: float, burst: int):
+        """Apply new defaults to existing buckets without discarding their backoff state."""
+        self.rate = rate
+        self.burst = burst
+        for bucket in self._buckets.values():
+            bucket.base_rate = rate
+            bucket.burst = max(1, burst)
+            bucket.min_rate = rate / 20
+            bucket.rate = min(bucket.rate, rate)
+
+    def report(self, platform_key: str | None, stream_info, error: BaseException | None = None):
+        """Feed the outcome of one stream info request back into the platform's bucket."""
+        bucket = self.get(platform_key)
+        if is_throttle_error(error):
+            bucket.on_throttled(type(error).__name__)
+        elif not stream_info or not getattr(stream_info, "anchor_name", None):
+            bucket.on_empty_result()
+        else:
+            bucket.on_success()
+
+    def snapshot(self) -> dict[str, dict]:
+        return {platform_key: bucket.snapshot() for platform_key, bucket in self._buckets.items()}
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from ...utils import utils
+from ...utils.logger import logger
+from .platform_handlers import PlatformHandler
+from .platform_handlers.handler_cache import HandlerCache
+
+if TYPE_CHECKING:
+    from streamget import StreamData
+
+HANDLER_FIELDS = ("proxy", "cookies", "record_quality", "platform", "username", "password", "account_type")
+POOL_MODES = ("inline", "thread", "process")
+
+_worker_state = threading.local()
+
+
+class RemoteResolveError(Exception):
+    """Picklable stand-in for an error raised while resolving a stream inside a pool worker."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_worker_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _worker_state.loop = loop
+        # Handlers hold HTTP clients bound to the loop that first used them, so each loop gets its own.
+        _worker_state.handlers = HandlerCache()
+    return loop
+
+
+async def _get_stream_info(handler: PlatformHandler, live_url: str) -> tuple[StreamData | None, Any]:
+    """Return the stream info together with the error the handler swallowed while resolving it, if any."""
+    utils.last_error.set(None)
+    with handler.in_use():
+        stream_info = await handler.get_stream_info(live_url)
+    return stream_info, utils.last_error.get()
+
+
+def _resolve_in_worker(live_url: str, handler_kwargs: dict[str, Any]) -> tuple[StreamData | None, Any]:
+    """
+    Resolve a stream on the worker's own event loop, so JS signing and payload parsing block
+    the worker instead of the UI loop.
+    """
+    loop = _get_worker_loop()
+    handler = PlatformHandler.get_handler_instance(live_url, **handler_kwargs, cache=_worker_state.handlers)
+    if handler is None:
+        return None, None
+    stream_info, error = loop.run_until_complete(_get_stream_info(handler, live_url))
+    if error is not None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None) or getattr(error, "status_code", None)
+        error = RemoteResolveError(f"{type(error).__name__}: {error}", status_code)
+    return (stream_info or None), error
+
+
+class ResolverPool:
+    """
+    Runs platform handler resolution inline, on a thread pool or on a process pool.
+
+    Each worker owns an event loop and its own handler instances; only the live URL, the handler parameters
+    and the resulting StreamData cross the worker boundary.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, mode: str = "inline", workers: int = 4):
+        if cls._instance is None:
+            cls._instance = ResolverPool(mode, workers)
+        elif (cls._instance.mode, cls._instance.workers) != (mode, workers):
+            cls._instance.shutdown(cancel_futures=False)
+            cls._instance = ResolverPool(mode, workers)
+        return cls._instance
+
+    def __init__(self, mode: str = "inline", workers: int = 4):
+        if mode not in POOL_MODES:
+            logger.warning(f"Unknown resolver pool mode: {mode}, falling back to inline")
+            mode = "inline"
+        self.mode = mode
+        self.workers = max(1, workers)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="resolver")
+                atexit.register(self.shutdown)
+                logger.info(f"Started {self.mode} resolver pool with {self.workers} workers")
+            return self._executor
+
+    async def resolve(self, handler: PlatformHandler, live_url: str) -> tuple[StreamData | None, Any]:
+        """Return the stream info of a live URL together with the error the handler swallowed, if any."""
+        if self.mode == "inline":
+            return await _get_stream_info(handler, live_url)
+
+        handler_kwargs = {field: getattr(handler, field, None) for field in HANDLER_FIELDS}
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), _resolve_in_worker, live_url, handler_kwargs)
+        except BrokenExecutor as e:
+            logger.error(f"Resolver pool is broken, restarting it on next use: {e}")
+            self.shutdown()
+            return None, e
+        except Exception as e:
+            logger.error(f"Resolver pool failed for {live_url}: {type(e).__name__}: {e}")
+            return None, e
+
+    def shutdown(self, cancel_futures: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=cancel_futures)
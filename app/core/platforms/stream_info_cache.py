@@ -0,0 +1,117 @@
+import asyncio
+import copy
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ...utils.logger import logger
+
+StreamInfoKey = tuple[str, str | None, str]
+
+# Result of an in-flight request whose caller was cancelled; the callers waiting on it fetch again.
+_CANCELLED = object()
+
+
+class StreamInfoCache:
+    """
+    Short-lived cache of resolved stream info with per-key request coalescing.
+
+    Concurrent callers asking for the same room and quality with the same proxy and credentials share one
+    in-flight request. Live results are kept for a few seconds, offline results a little longer, failed lookups
+    are never cached.
+    """
+
+    _instance = None
+
+    LIVE_TTL = 10.0
+    OFFLINE_TTL = 30.0
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = StreamInfoCache()
+        return cls._instance
+
+    def __init__(self, live_ttl: float = LIVE_TTL, offline_ttl: float = OFFLINE_TTL):
+        self.live_ttl = live_ttl
+        self.offline_ttl = offline_ttl
+        self._results: dict[StreamInfoKey, tuple[float, Any]] = {}
+        self._in_flight: dict[StreamInfoKey, asyncio.Future] = {}
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        live_url: str, quality: str | None = None, proxy: str | None = None, *credentials: Any
+    ) -> StreamInfoKey:
+        """
+        The cache key of a room; the proxy and credentials (cookies, account) are part of it as a digest, so a
+        result fetched with one account is never served to a request made with another.
+        """
+        digest = hashlib.sha256(repr((proxy, credentials)).encode("utf-8")).hexdigest()
+        return live_url.strip(), quality, digest
+
+    async def get_or_fetch(self, key: StreamInfoKey, fetcher: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, stream_info = cached
+            if time.monotonic() < expires_at:
+                self.hits += 1
+                return copy.copy(stream_info)
+            del self._results[key]
+
+        while (future := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+            stream_info = await asyncio.shield(future)
+            if stream_info is not _CANCELLED:
+                return copy.copy(stream_info)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            stream_info = await fetcher()
+        except asyncio.CancelledError:
+            # Only this caller gave up; the others retry instead of being cancelled with it.
+            future.set_result(_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(stream_info)
+            self._store(key, stream_info)
+            return stream_info
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key: StreamInfoKey, stream_info: Any):
+        if not stream_info or not getattr(stream_info, "anchor_name", None):
+            return
+        ttl = self.live_ttl if stream_info.is_live else self.offline_ttl
+        if ttl > 0:
+            self._results[key] = (time.monotonic() + ttl, copy.copy(stream_info))
+
+    def invalidate(self, live_url: str):
+        """Forget every cached result of a room, e.g. after its stream URL stopped working."""
+        live_url = live_url.strip()
+        keys = [key for key in self._results if key[0] == live_url]
+        for key in keys:
+            del self._results[key]
+        if keys:
+            logger.debug(f"Invalidated cached stream info: {live_url}")
+
+    def clear(self):
+        self._results.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._results),
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+        }
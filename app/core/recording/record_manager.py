@@ -1,5 +1,6 @@
 import asyncio
 import threading
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta
 
@@ -8,13 +9,46 @@ from ...models.recording.recording_model import Recording
 from ...models.recording.recording_status_model import RecordingStatus
 from ...utils import utils
 from ...utils.logger import logger
+from ..events.event_bus import EventBus
+from ..events.events import (
+    DiskSpaceChanged,
+    LiveCheckFailed,
+    LiveCheckStarted,
+    OutputFinalized,
+    OutputMigrated,
+    RecordingEvent,
+    RecordingStatusChanged,
+    WentLive,
+    WentOffline,
+)
+from ..metrics.metrics import LIVE_CHECKS
 from ..platforms.platform_handlers import get_platform_info
+from ..platforms.rate_limiter import PlatformRateLimiter
 from ..runtime.process_manager import BackgroundService
+from ..storage.disk_monitor import DiskMonitor, VolumeState
+from ..storage.output_placement import DEFAULT_PLACEMENT_POLICY, OutputPlacement
+from ..storage.retention import RetentionEngine, recording_owners
+from ..storage.tiering import StorageTiering
+from .search_index import RecordingSearchIndex
+from .startup_warmup import LiveCheckWarmup
+from .status_buckets import RecordingStatusBuckets
 from .stream_manager import LiveStreamRecorder
 
 
 class GlobalRecordingState:
     recordings = []
+    recordings_by_id = {}
+    search_index = RecordingSearchIndex()
+    status_buckets = RecordingStatusBuckets()
+    rate_limiter = PlatformRateLimiter()
+    warmup = LiveCheckWarmup()
+    disk_monitor = DiskMonitor()
+    output_placement = OutputPlacement(disk_monitor)
+    storage_tiering = StorageTiering(disk_monitor)
+    retention = RetentionEngine(disk_monitor, storage_tiering)
+    persistence_subscription = None
+    tiering_subscription = None
+    retention_subscription = None
     lock = threading.Lock()
 
 
@@ -31,7 +65,30 @@ class RecordingManager:
         self.initialize_dynamic_state()
         max_concurrent = int(self.settings.user_config.get("platform_max_concurrent_requests", 3))
         self.platform_semaphores = defaultdict(lambda: asyncio.Semaphore(max_concurrent))
+        self.apply_rate_limit_settings()
+        self.apply_warmup_settings()
+        self.apply_disk_monitor_settings()
+        self.apply_output_placement_settings()
+        self.apply_storage_tiering_settings()
+        self.apply_retention_settings()
         self.active_recorders = {}
+        self.event_subscriptions = [
+            self.event_bus.subscribe(self.notify_went_live, WentLive, name="desktop_notify"),
+            self.event_bus.subscribe(self.on_disk_space_changed, DiskSpaceChanged, name="disk_space"),
+        ]
+        if GlobalRecordingState.persistence_subscription is None:
+            # Shared by all sessions; one save per burst of state changes worth keeping across restarts.
+            GlobalRecordingState.persistence_subscription = self.event_bus.subscribe(
+                self.on_persistent_state_changed, WentLive, name="persistence", coalesce=lambda _: "recordings"
+            )
+        if GlobalRecordingState.tiering_subscription is None:
+            GlobalRecordingState.tiering_subscription = self.event_bus.subscribe(
+                self.on_output_finalized, OutputFinalized, name="storage_tiering"
+            )
+        if GlobalRecordingState.retention_subscription is None:
+            GlobalRecordingState.retention_subscription = self.event_bus.subscribe(
+                self.retention.on_event, (OutputFinalized, OutputMigrated, DiskSpaceChanged), name="retention"
+            )
 
     @property
     def recordings(self):
@@ -41,6 +98,141 @@ class RecordingManager:
     def recordings(self, value):
         raise AttributeError("Please use add_recording/update_recording methods to modify data")
 
+    @property
+    def search_index(self) -> RecordingSearchIndex:
+        return GlobalRecordingState.search_index
+
+    @property
+    def status_buckets(self) -> RecordingStatusBuckets:
+        return GlobalRecordingState.status_buckets
+
+    @property
+    def rate_limiter(self) -> PlatformRateLimiter:
+        return GlobalRecordingState.rate_limiter
+
+    def apply_rate_limit_settings(self):
+        user_config = self.settings.user_config
+        try:
+            rate = float(user_config.get("platform_rate_limit_per_second") or 2)
+            burst = int(user_config.get("platform_rate_limit_burst") or 10)
+        except ValueError:
+            logger.warning("Invalid platform rate limit settings, keeping the current values")
+            return
+        if rate > 0 and burst > 0:
+            self.rate_limiter.configure(rate=rate, burst=burst)
+
+    @property
+    def event_bus(self) -> EventBus:
+        return EventBus.get_instance()
+
+    def emit(self, event: RecordingEvent):
+        self.event_bus.emit(event)
+
+    def close(self):
+        """Detach this session's subscribers from the event bus."""
+        for subscription in self.event_subscriptions:
+            subscription.close()
+        self.event_subscriptions.clear()
+
+    async def on_persistent_state_changed(self, _):
+        await self.persist_recordings()
+
+    async def notify_went_live(self, event: WentLive):
+        if desktop_notify.should_push_notification(self.app):
+            desktop_notify.send_notification(
+                title=self._["notify"],
+                message=event.recording.streamer_name + ' | ' + self._["live_recording_started_message"],
+                app_icon=self.app.tray_manager.icon_path
+            )
+
+    @property
+    def warmup(self) -> LiveCheckWarmup:
+        return GlobalRecordingState.warmup
+
+    def apply_warmup_settings(self):
+        try:
+            window = self.settings.user_config.get("startup_check_window_seconds", LiveCheckWarmup.DEFAULT_WINDOW)
+            window = float(window or 0)
+        except ValueError:
+            logger.warning("Invalid startup check window, keeping the current value")
+            return
+        self.warmup.window_seconds = max(0.0, window)
+
+    @property
+    def disk_monitor(self) -> DiskMonitor:
+        return GlobalRecordingState.disk_monitor
+
+    def apply_disk_monitor_settings(self):
+        user_config = self.settings.user_config
+        try:
+            threshold = float(user_config.get("recording_space_threshold") or 0)
+            guard_minutes = float(user_config.get("disk_full_guard_minutes") or 0)
+            interval = float(user_config.get("disk_check_interval_seconds") or DiskMonitor.DEFAULT_INTERVAL)
+        except ValueError:
+            logger.warning("Invalid disk space settings, keeping the current values")
+            return
+        self.disk_monitor.configure(threshold, guard_minutes * 60, interval)
+
+    @property
+    def output_placement(self) -> OutputPlacement:
+        return GlobalRecordingState.output_placement
+
+    def apply_output_placement_settings(self):
+        policy = self.settings.user_config.get("output_placement_policy") or DEFAULT_PLACEMENT_POLICY
+        self.output_placement.configure(policy)
+
+    @property
+    def storage_tiering(self) -> StorageTiering:
+        return GlobalRecordingState.storage_tiering
+
+    def apply_storage_tiering_settings(self):
+        user_config = self.settings.user_config
+        try:
+            delay_minutes = float(user_config.get("tiering_delay_minutes") or 0)
+            bandwidth = float(user_config.get("tiering_bandwidth_limit") or 0)
+        except ValueError:
+            logger.warning("Invalid storage tiering settings, keeping the current values")
+            return
+        self.storage_tiering.configure(
+            bool(user_config.get("storage_tiering_enabled")),
+            self.settings.get_output_roots(),
+            user_config.get("cold_save_path"),
+            delay_minutes * 60,
+            bandwidth,
+            user_config.get("tiering_verify_checksum", True),
+        )
+
+    @staticmethod
+    async def on_output_finalized(event: OutputFinalized):
+        GlobalRecordingState.storage_tiering.schedule(event.path)
+
+    @property
+    def retention(self) -> RetentionEngine:
+        return GlobalRecordingState.retention
+
+    def apply_retention_settings(self):
+        user_config = self.settings.user_config
+        try:
+            interval_minutes = float(user_config.get("retention_interval_minutes") or 0)
+        except ValueError:
+            logger.warning("Invalid retention interval, keeping the current settings")
+            return
+        self.retention.configure(
+            bool(user_config.get("retention_enabled")),
+            user_config.get("retention_dry_run", True),
+            user_config.get("retention_rules"),
+            user_config.get("retention_reclaim_space", True),
+            interval_minutes * 60 or RetentionEngine.DEFAULT_INTERVAL,
+            self.settings.get_storage_roots(),
+        )
+
+    def start_retention(self):
+        """
+        Start retention in the process that owns the storage roots: the app itself, or a cluster worker on
+        another machine. Engine workers started by the app leave it to the app.
+        """
+        self.retention.start(self.app.config_manager.config_path, lambda: recording_owners(self.recordings))
+
     def load(self):
         language = self.app.language_manager.language
         for key in ("recording_manager", "video_quality"):
@@ -51,6 +243,9 @@ class RecordingManager:
         recordings_data = self.app.config_manager.load_recordings_config()
         if not GlobalRecordingState.recordings:
             GlobalRecordingState.recordings = [Recording.from_dict(rec) for rec in recordings_data]
+            GlobalRecordingState.recordings_by_id = {rec.rec_id: rec for rec in GlobalRecordingState.recordings}
+            GlobalRecordingState.search_index.rebuild(GlobalRecordingState.recordings)
+            GlobalRecordingState.status_buckets.rebuild(GlobalRecordingState.recordings)
         logger.info(f"Live Recordings: Loaded {len(self.recordings)} items")
 
     def initialize_dynamic_state(self):
@@ -62,25 +257,45 @@ class RecordingManager:
             recording.update_title(self._[recording.quality])
             recording.showed_checking_status = True
 
-    async def add_recording(self, recording):
+    async def add_recording(self, recording, persist: bool = True):
         with GlobalRecordingState.lock:
             GlobalRecordingState.recordings.append(recording)
-            await self.persist_recordings()
+            GlobalRecordingState.recordings_by_id[recording.rec_id] = recording
+            GlobalRecordingState.search_index.add(recording)
+            GlobalRecordingState.status_buckets.add(recording)
+            if persist:
+                await self.persist_recordings()
 
-    async def remove_recording(self, recording: Recording):
+    async def remove_recording(self, recording: Recording, persist: bool = True):
         with GlobalRecordingState.lock:
             GlobalRecordingState.recordings.remove(recording)
-            await self.persist_recordings()
+            GlobalRecordingState.recordings_by_id.pop(recording.rec_id, None)
+            GlobalRecordingState.search_index.remove(recording.rec_id)
+            GlobalRecordingState.status_buckets.remove(recording.rec_id)
+            GlobalRecordingState.warmup.discard(recording.rec_id)
+            if persist:
+                await self.persist_recordings()
 
     async def clear_all_recordings(self):
         with GlobalRecordingState.lock:
             GlobalRecordingState.recordings.clear()
+            GlobalRecordingState.recordings_by_id.clear()
+            GlobalRecordingState.search_index.clear()
+            GlobalRecordingState.status_buckets.clear()
+            GlobalRecordingState.warmup.clear()
             await self.persist_recordings()
 
     async def persist_recordings(self):
         """Persist recordings to a JSON file."""
         data_to_save = [rec.to_dict() for rec in self.recordings]
         await self.app.config_manager.save_recordings_config(data_to_save)
+        if not self.runs_engine:
+            await self.app.engine_supervisor.sync_recordings(data_to_save)
+
+    @property
+    def runs_engine(self) -> bool:
+        """False when live checks and recorders run in engine worker processes, see EngineSupervisor."""
+        return getattr(self.app, "engine_supervisor", None) is None
 
     async def update_recording_card(self, recording: Recording, updated_info: dict):
         """Update an existing recording object and persist changes to a JSON file."""
@@ -117,8 +332,7 @@ class RecordingManager:
                 selected=False,
             )
 
-            self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-            self.app.page.pubsub.send_others_on_topic("update", recording)
+            self.emit(RecordingStatusChanged(recording))
 
             self.app.page.run_task(self.check_if_live, recording)
 
@@ -138,8 +352,7 @@ class RecordingManager:
                 selected=False,
             )
             self.stop_recording(recording, manually_stopped=True)
-            self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-            self.app.page.pubsub.send_others_on_topic("update", recording)
+            self.emit(RecordingStatusChanged(recording))
             if auto_save:
                 self.app.page.run_task(self.persist_recordings)
 
@@ -180,20 +393,47 @@ class RecordingManager:
                 await self.remove_recording(recording)
                 logger.info(f"Delete Items: {recording.rec_id}-{recording.streamer_name}")
 
-    def find_recording_by_id(self, rec_id: str):
+    @staticmethod
+    def find_recording_by_id(rec_id: str):
         """Find a recording by its ID (hash of dict representation)."""
-        for rec in self.recordings:
-            if rec.rec_id == rec_id:
-                return rec
-        return None
+        return GlobalRecordingState.recordings_by_id.get(rec_id)
+
+    def search_recordings(self, query: str) -> set[str]:
+        """Return the ids of recordings matching a search query, see `RecordingSearchIndex.search`."""
+        return self.search_index.search(query)
 
-    async def check_all_live_status(self):
+    def schedule_live_check(self, recording: Recording):
+        """
+        Check a recording as part of the startup warm-up, so that opening the app or refreshing the browser
+        with a large library does not fire every check at once.
+        """
+        if not recording.monitor_status or not self.warmup.schedule(recording, self._dispatch_live_check):
+            self._dispatch_live_check(recording)
+
+    def _dispatch_live_check(self, recording: Recording):
+        self.app.page.run_task(self.check_if_live, recording)
+
+    async def check_all_live_status(self, staggered: bool = False):
         """Check the live status of all recordings and update their display titles."""
         for recording in self.recordings:
             if recording.monitor_status and not recording.is_recording:
+                if self.warmup.is_pending(recording.rec_id):
+                    continue
                 is_exceeded = utils.is_time_interval_exceeded(recording.detection_time, recording.loop_time_seconds)
                 if not recording.detection_time or is_exceeded:
-                    self.app.page.run_task(self.check_if_live, recording)
+                    if staggered:
+                        self.schedule_live_check(recording)
+                    else:
+                        self._dispatch_live_check(recording)
+
+    def log_rate_limiter_state(self):
+        """Log the platforms that are currently throttled below their configured rate."""
+        for platform_key, state in self.rate_limiter.snapshot().items():
+            if state["rate"] < state["base_rate"] or state["cooldown_remaining"]:
+                logger.info(
+                    f"Rate limiter state: {platform_key}, rate {state['rate']}/{state['base_rate']} req/s, "
+                    f"cooldown {state['cooldown_remaining']}s, throttled {state['throttled_total']} times"
+                )
 
     _periodic_task_running = False
 
@@ -205,19 +445,28 @@ class RecordingManager:
     def set_periodic_task_running(cls, value=True):
         cls._periodic_task_running = value
 
-    async def setup_periodic_live_check(self, interval: int = 180):
-        """Set up a periodic task to check live status."""
+    async def setup_periodic_live_check(self, interval: int = 180, check_on_start: bool | None = None):
+        """
+        Set up a periodic task to check live status. Unless ``check_on_start`` says otherwise, the first pass
+        only runs right away when the recording cards do not already check on startup.
+        """
 
         async def periodic_check():
             logger.info("Starting periodic live check background task")
+            first_run = True
             while True:
                 immediate_check_on_startup = self.app.settings.user_config.get("check_live_on_browser_refresh", True)
-                if immediate_check_on_startup:
+                check_first = not immediate_check_on_startup
+                if first_run and check_on_start is not None:
+                    check_first = check_on_start
+                if not check_first:
                     await asyncio.sleep(interval)
                 await self.check_free_space()
                 if self.app.recording_enabled:
-                    await self.check_all_live_status()
-                if not immediate_check_on_startup:
+                    await self.check_all_live_status(staggered=first_run)
+                first_run = False
+                self.log_rate_limiter_state()
+                if check_first:
                     await asyncio.sleep(interval)
 
         if not RecordingManager.is_periodic_task_running():
@@ -225,13 +474,19 @@ class RecordingManager:
             self.periodic_task_started = True
             logger.info(f"Initializing periodic live check task with interval: {interval}s")
             asyncio.create_task(periodic_check())
+            self.storage_tiering.start()
         else:
             logger.info("Periodic live check task already running globally, skipping initialization")
 
     async def check_if_live(self, recording: Recording):
         """Check if the live stream is available, fetch stream data and update is_live status."""
 
+        if not self.runs_engine:
+            # The worker that owns the room checks it, and starts recording if it is live.
+            self.app.engine_supervisor.send_command(recording.rec_id, "check")
+            return
         recording.manually_stopped = False
+        self.warmup.discard(recording.rec_id)
         if recording.is_recording or recording.stopping_in_progress:
             logger.debug(f"Skip check_if_live because recording is busy: {recording.url}")
             return
@@ -244,7 +499,7 @@ class RecordingManager:
             recording.display_title = f"[{self._['monitor_stopped']}] {recording.title}"
             recording.status_info = RecordingStatus.STOPPED_MONITORING
             recording.is_checking = False
-            self.app.page.run_task(self.app.record_card_manager.update_card, recording)
+            self.emit(RecordingStatusChanged(recording))
             return
 
         recording.detection_time = datetime.now().time()
@@ -253,7 +508,7 @@ class RecordingManager:
         if not recording.showed_checking_status:
             recording.status_info = RecordingStatus.STATUS_CHECKING
             recording.showed_checking_status = True
-            self.app.page.run_task(self.app.record_card_manager.update_card, recording)
+            self.emit(LiveCheckStarted(recording))
 
         if recording.scheduled_recording:
             scheduled_time_range_list = await self.get_scheduled_time_range(
@@ -270,7 +525,7 @@ class RecordingManager:
                 recording.is_live = False
                 recording.is_checking = False
                 logger.info(f"Skip Detection: {recording.url} not in scheduled check range {scheduled_time_range_list}")
-                self.app.page.run_task(self.app.record_card_manager.update_card, recording)
+                self.emit(RecordingStatusChanged(recording))
                 return
 
         recording.status_info = RecordingStatus.STATUS_CHECKING
@@ -284,8 +539,7 @@ class RecordingManager:
         if self.settings.user_config["language"] != "zh_CN":
             platform = platform_key
 
-        output_dir = self.settings.get_video_save_path()
-        await self.check_free_space(output_dir)
+        await self.check_free_space()
         if not self.app.recording_enabled:
             recording.is_checking = False
             recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
@@ -294,7 +548,6 @@ class RecordingManager:
             "platform": platform,
             "platform_key": platform_key,
             "live_url": recording.url,
-            "output_dir": output_dir,
             "segment_record": recording.segment_record,
             "segment_time": recording.segment_time,
             "save_format": recording.record_format,
@@ -303,22 +556,31 @@ class RecordingManager:
 
         semaphore = self.platform_semaphores[platform_key]
         recorder = LiveStreamRecorder(self.app, recording, recording_info)
+        # A cooldown of the platform is sat out before taking a slot, so throttled checks do not hold them.
+        await self.rate_limiter.get(platform_key).wait_for_cooldown()
         async with semaphore:
             stream_info = await recorder.fetch_stream()
             logger.info(f"Stream Data: {stream_info}")
+        if self.find_recording_by_id(recording.rec_id) is not recording:
+            logger.debug(f"Recording was removed during its live check: {recording.url}")
+            return
         if not stream_info or not stream_info.anchor_name:
             logger.error(f"Fetch stream data failed: {recording.url}")
+            LIVE_CHECKS.inc(platform=recording.platform_key or "unknown", result="error")
             recording.is_checking = False
             recording.status_info = RecordingStatus.LIVE_STATUS_CHECK_ERROR
             if recording.monitor_status:
-                self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-                self.app.page.pubsub.send_others_on_topic("update", recording)
+                self.emit(LiveCheckFailed(recording))
             return
         if self.settings.user_config.get("remove_emojis"):
             stream_info.anchor_name = utils.clean_name(stream_info.anchor_name, self._["live_room"])
 
+        LIVE_CHECKS.inc(
+            platform=recording.platform_key or "unknown", result="live" if stream_info.is_live else "offline"
+        )
         if stream_info.is_live:
             recording.live_title = stream_info.title
+            recording.last_live_at = time.time()
             if recording.streamer_name.strip() == self._["live_room"]:
                 recording.streamer_name = stream_info.anchor_name
             recording.title = f"{recording.streamer_name} - {self._[recording.quality]}"
@@ -328,13 +590,7 @@ class RecordingManager:
                 recording.is_live = stream_info.is_live
                 recording.notified_live_start = False
                 recording.notified_live_end = False
-
-                if desktop_notify.should_push_notification(self.app):
-                    desktop_notify.send_notification(
-                        title=self._["notify"],
-                        message=recording.streamer_name + ' | ' + self._["live_recording_started_message"],
-                        app_icon=self.app.tray_manager.icon_path
-                    )
+                self.emit(WentLive(recording, stream_info.title))
 
             msg_manager = message_pusher.MessagePusher(self.settings)
             user_config = self.settings.user_config
@@ -356,7 +612,14 @@ class RecordingManager:
                 )
                 recording.notified_live_start = True
 
+            output_root = None
             if not recording.only_notify_no_record:
+                output_root = self.output_placement.choose(self.settings.get_output_roots())
+            if not recording.only_notify_no_record and output_root is None:
+                recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
+                logger.warning(f"Not starting {recording.url}, every output disk is low on space")
+            elif not recording.only_notify_no_record:
+                recorder.place_output(output_root)
                 recording.status_info = RecordingStatus.PREPARING_RECORDING
                 recording.loop_time_seconds = self.loop_time_seconds
                 self.start_update(recording)
@@ -376,6 +639,7 @@ class RecordingManager:
             recording.is_recording = False
             if recording.is_live:
                 recording.is_live = False
+                self.emit(WentOffline(recording))
                 self.app.page.run_task(recorder.end_message_push)
 
             recording.status_info = RecordingStatus.MONITORING
@@ -392,13 +656,13 @@ class RecordingManager:
                 self.app.page.run_task(self.persist_recordings)
 
         recording.is_checking = False
-        self.app.page.run_task(self.app.record_card_manager.update_card, recording)
-        self.app.page.pubsub.send_others_on_topic("update", recording)
+        self.emit(RecordingStatusChanged(recording))
         return
 
-    @staticmethod
-    def start_update(recording: Recording):
+    def start_update(self, recording: Recording):
         """Start the recording process."""
+        if not self.runs_engine:
+            return
         if recording.is_live and not recording.is_recording:
             # Reset cumulative and last durations for a fresh start
             recording.update(
@@ -413,6 +677,10 @@ class RecordingManager:
 
     def stop_recording(self, recording: Recording, manually_stopped: bool = True):
         """Stop the recording process."""
+        if not self.runs_engine:
+            # The recorder runs in a worker process, whose state reports update this recording.
+            self.app.engine_supervisor.send_command(recording.rec_id, "stop", manually_stopped=manually_stopped)
+            return
         recording.is_live = False
         if recording.is_recording:
 
@@ -468,23 +736,36 @@ class RecordingManager:
                 self.app.current_page.content_area.controls[1] = self.app.current_page.create_filter_area()
                 self.app.current_page.content_area.update()
 
-    async def check_free_space(self, output_dir: str | None = None):
-        disk_space_limit = float(self.settings.user_config.get("recording_space_threshold") or 0)
-        output_dir = output_dir or self.settings.get_video_save_path()
-        if utils.check_disk_capacity(output_dir) < disk_space_limit:
-            self.app.recording_enabled = False
-            logger.error(
-                f"Disk space remaining is below {disk_space_limit} GB. Recording function disabled"
-            )
-            self.app.page.run_task(
-                self.app.snack_bar.show_snack_bar,
-                self._["not_disk_space_tip"],
-                duration=86400,
-                show_close_icon=True
-            )
+    async def check_free_space(self):
+        """
+        Enable or disable recording from the disk monitor's latest samples of the output roots; recording stops
+        once all of them are full. Samples are taken in a thread, only the first check of a root waits for one.
+        """
+        roots = self.settings.get_output_roots()
+        self.apply_disk_state(await asyncio.gather(*(self.disk_monitor.watch(root) for root in roots)))
 
-        else:
+    async def on_disk_space_changed(self, event: DiskSpaceChanged):
+        volumes = [self.disk_monitor.volume_for(root) for root in self.settings.get_output_roots()]
+        if any(volume is not None and volume.disk == event.disk for volume in volumes):
+            self.apply_disk_state([volume for volume in volumes if volume is not None])
+
+    def apply_disk_state(self, volumes: list[VolumeState]):
+        if any(volume.state != "full" for volume in volumes):
             self.app.recording_enabled = True
+            return
+        if not self.app.recording_enabled:
+            return
+        self.app.recording_enabled = False
+        logger.error(
+            f"Disk space remaining is below {self.disk_monitor.threshold / 1024 ** 3:.2f} GB. "
+            f"Recording function disabled"
+        )
+        self.app.page.run_task(
+            self.app.snack_bar.show_snack_bar,
+            self._["not_disk_space_tip"],
+            duration=86400,
+            show_close_icon=True
+        )
 
     @staticmethod
     async def get_scheduled_time_range(scheduled_start_time, monitor_hours) -> list | None:
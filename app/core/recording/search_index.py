@@ -0,0 +1,189 @@
+import bisect
+import re
+import threading
+from collections import defaultdict
+
+from ...models.recording.recording_model import Recording
+
+CJK_RANGES = "぀-ヿ㐀-䶿一-鿿가-힯豈-﫿"
+TOKEN_PATTERN = re.compile(f"[{CJK_RANGES}]+|[^\\W_{CJK_RANGES}]+")
+CJK_PATTERN = re.compile(f"^[{CJK_RANGES}]+$")
+
+
+class RecordingSearchIndex:
+    """
+    Incremental inverted index over the searchable fields of recordings.
+
+    Latin words are matched by prefix, CJK runs are indexed as unigrams and bigrams so that any
+    substring of a Chinese/Japanese/Korean name can be found. Queries are whitespace separated terms
+    that must all match; a term may be scoped to one field with ``field:value``.
+    """
+
+    FIELDS = {
+        "streamer_name": ("streamer_name",),
+        "url": ("url",),
+        "platform": ("platform", "platform_key"),
+        "live_title": ("live_title",),
+    }
+    FIELD_ALIASES = {
+        "name": "streamer_name",
+        "streamer": "streamer_name",
+        "streamer_name": "streamer_name",
+        "url": "url",
+        "platform": "platform",
+        "title": "live_title",
+        "live_title": "live_title",
+    }
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: dict[str, dict[str, set[str]]] = {field: defaultdict(set) for field in self.FIELDS}
+        self._sorted_vocab: dict[str, list[str] | None] = dict.fromkeys(self.FIELDS)
+        self._doc_tokens: dict[str, dict[str, set[str]]] = {}
+        watched_attrs = tuple({attr for attrs in self.FIELDS.values() for attr in attrs})
+        Recording.add_change_listener(self._on_recording_changed, watched_attrs)
+
+    def __len__(self):
+        return len(self._doc_tokens)
+
+    def __contains__(self, rec_id):
+        return rec_id in self._doc_tokens
+
+    @staticmethod
+    def tokenize(text: str | None) -> list[str]:
+        """Split text into lowercase word tokens and CJK runs."""
+        if not text:
+            return []
+        return TOKEN_PATTERN.findall(str(text).lower())
+
+    @staticmethod
+    def _expand_cjk(run: str) -> set[str]:
+        grams = set(run)
+        grams.update(run[i:i + 2] for i in range(len(run) - 1))
+        return grams
+
+    def _index_terms(self, text: str | None) -> set[str]:
+        terms = set()
+        for token in self.tokenize(text):
+            if CJK_PATTERN.match(token):
+                terms.update(self._expand_cjk(token))
+            else:
+                terms.add(token)
+        return terms
+
+    def _extract(self, recording: Recording) -> dict[str, set[str]]:
+        return {
+            field: set().union(*(self._index_terms(getattr(recording, attr, None)) for attr in attrs))
+            for field, attrs in self.FIELDS.items()
+        }
+
+    def add(self, recording: Recording):
+        """Index a recording, replacing any previous entry with the same id."""
+        with self._lock:
+            self._remove_locked(recording.rec_id)
+            doc = self._extract(recording)
+            for field, terms in doc.items():
+                postings = self._postings[field]
+                for term in terms:
+                    if term not in postings:
+                        self._sorted_vocab[field] = None
+                    postings[term].add(recording.rec_id)
+            self._doc_tokens[recording.rec_id] = doc
+
+    def update(self, recording: Recording):
+        """Re-index a recording only if it is already part of the index."""
+        if recording.rec_id in self._doc_tokens:
+            self.add(recording)
+
+    def remove(self, rec_id: str):
+        with self._lock:
+            self._remove_locked(rec_id)
+
+    def clear(self):
+        with self._lock:
+            for field in self.FIELDS:
+                self._postings[field].clear()
+                self._sorted_vocab[field] = None
+            self._doc_tokens.clear()
+
+    def rebuild(self, recordings: list[Recording]):
+        with self._lock:
+            self.clear()
+            for recording in recordings:
+                self.add(recording)
+
+    def _remove_locked(self, rec_id: str):
+        doc = self._doc_tokens.pop(rec_id, None)
+        if not doc:
+            return
+        for field, terms in doc.items():
+            postings = self._postings[field]
+            for term in terms:
+                ids = postings.get(term)
+                if ids is None:
+                    continue
+                ids.discard(rec_id)
+                if not ids:
+                    del postings[term]
+                    self._sorted_vocab[field] = None
+
+    def _on_recording_changed(self, recording: Recording, _field: str):
+        self.update(recording)
+
+    def _vocab(self, field: str) -> list[str]:
+        vocab = self._sorted_vocab[field]
+        if vocab is None:
+            vocab = sorted(self._postings[field])
+            self._sorted_vocab[field] = vocab
+        return vocab
+
+    def _match_prefix(self, field: str, prefix: str) -> set[str]:
+        vocab = self._vocab(field)
+        postings = self._postings[field]
+        matched = set()
+        index = bisect.bisect_left(vocab, prefix)
+        while index < len(vocab) and vocab[index].startswith(prefix):
+            matched.update(postings[vocab[index]])
+            index += 1
+        return matched
+
+    def _match_cjk(self, field: str, run: str) -> set[str]:
+        postings = self._postings[field]
+        grams = [run] if len(run) == 1 else [run[i:i + 2] for i in range(len(run) - 1)]
+        matched = None
+        for gram in grams:
+            ids = postings.get(gram)
+            if not ids:
+                return set()
+            matched = set(ids) if matched is None else matched & ids
+        return matched or set()
+
+    def _match_token(self, fields: tuple[str, ...], token: str) -> set[str]:
+        is_cjk = bool(CJK_PATTERN.match(token))
+        matched = set()
+        for field in fields:
+            matched |= self._match_cjk(field, token) if is_cjk else self._match_prefix(field, token)
+        return matched
+
+    def search(self, query: str) -> set[str]:
+        """
+        Return the ids of all recordings matching every term of the query.
+
+        Examples: ``lol``, ``platform:douyin 主播``, ``title:valorant name:shroud``.
+        """
+        with self._lock:
+            result = None
+            for term in query.split():
+                fields = tuple(self.FIELDS)
+                field_name, sep, value = term.partition(":")
+                if sep and field_name.lower() in self.FIELD_ALIASES and value:
+                    fields = (self.FIELD_ALIASES[field_name.lower()],)
+                    term = value
+
+                for token in self.tokenize(term):
+                    matched = self._match_token(fields, token)
+                    result = matched if result is None else result & matched
+                    if not result:
+                        return set()
+
+            return set(self._doc_tokens) if result is None else result
@@ -0,0 +1,93 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ...models.recording.recording_model import Recording
+from ...utils.logger import logger
+
+
+class LiveCheckWarmup:
+    """
+    Spreads the live checks issued at startup or on a browser refresh over a time window.
+
+    Recordings that were live most recently are checked first, rooms that have never been seen live go last.
+    Checks scheduled while a warm-up is running join the same window instead of starting a new one.
+
+    Only ``last_live_at`` is kept across restarts. Besides ordering the checks, it is what a card shows until
+    its room's first check, marked stale ("last live at ..."). It is never restored into ``is_live``: a stale
+    status would otherwise drive notifications and recording decisions as if it were current.
+    """
+
+    DEFAULT_WINDOW = 60.0
+
+    def __init__(self, window_seconds: float = DEFAULT_WINDOW):
+        self.window_seconds = window_seconds
+        self._queue: list[tuple[tuple, int, str]] = []
+        self._pending: dict[str, tuple[Recording, Callable[[Recording], Any]]] = {}
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+        self._deadline = 0.0
+        self.dispatched = 0
+
+    @property
+    def is_active(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def is_pending(self, rec_id: str) -> bool:
+        return rec_id in self._pending
+
+    @staticmethod
+    def priority(recording: Recording) -> tuple:
+        last_live_at = recording.last_live_at or 0
+        return not last_live_at, -last_live_at
+
+    def schedule(self, recording: Recording, check: Callable[[Recording], Any]) -> bool:
+        """
+        Queue a check for the recording. Returns False when staggering is disabled and the caller should
+        check right away.
+        """
+        if self.window_seconds <= 0:
+            return False
+        if recording.rec_id not in self._pending:
+            heapq.heappush(self._queue, (self.priority(recording), next(self._counter), recording.rec_id))
+        self._pending[recording.rec_id] = (recording, check)
+
+        if not self.is_active:
+            self._deadline = time.monotonic() + self.window_seconds
+            self.dispatched = 0
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Live check warm-up started over {self.window_seconds:.0f}s")
+        return True
+
+    def discard(self, rec_id: str):
+        """Drop a queued check, e.g. because the recording was checked or removed in the meantime."""
+        self._pending.pop(rec_id, None)
+
+    def clear(self):
+        self._pending.clear()
+        self._queue.clear()
+
+    async def _run(self):
+        while self._queue:
+            _, _, rec_id = heapq.heappop(self._queue)
+            entry = self._pending.pop(rec_id, None)
+            if entry is None:
+                continue
+            recording, check = entry
+            try:
+                check(recording)
+                self.dispatched += 1
+            except Exception as e:
+                logger.warning(f"Warm-up live check failed to start: {recording.url}, {e}")
+
+            if self._pending:
+                remaining_time = max(0.0, self._deadline - time.monotonic())
+                await asyncio.sleep(remaining_time / (len(self._pending) + 1))
+        logger.info(f"Live check warm-up finished, {self.dispatched} checks dispatched")
@@ -0,0 +1,204 @@
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+
+from ...models.recording.recording_model import Recording
+from ...models.recording.recording_status_model import RecordingStatus
+
+ERROR_STATUSES = (RecordingStatus.RECORDING_ERROR, RecordingStatus.LIVE_STATUS_CHECK_ERROR)
+
+
+def is_error_status(recording: Recording) -> bool:
+    return recording.status_info in ERROR_STATUSES
+
+
+def is_live_status(recording: Recording) -> bool:
+    return bool(
+        recording.is_live
+        and recording.monitor_status
+        and not recording.is_recording
+        and recording.status_info not in ERROR_STATUSES
+        and recording.status_info != RecordingStatus.NOT_IN_SCHEDULED_CHECK
+    )
+
+
+def is_offline_status(recording: Recording) -> bool:
+    return bool(
+        not recording.is_live
+        and recording.monitor_status
+        and recording.status_info not in ERROR_STATUSES
+        and recording.status_info != RecordingStatus.NOT_IN_SCHEDULED_CHECK
+    )
+
+
+def is_stopped_status(recording: Recording) -> bool:
+    return bool(not recording.monitor_status or recording.status_info == RecordingStatus.NOT_IN_SCHEDULED_CHECK)
+
+
+class RecordingStatusBuckets:
+    """
+    Live membership sets and counters per status bucket and per platform.
+
+    Membership is recomputed only for the recording whose state changed, so status filters,
+    counters and the platform dropdown never need to scan the whole recording list. Listeners are
+    called without arguments whenever the membership of a status bucket changes.
+    """
+
+    BUCKETS = {
+        "recording": lambda rec: bool(rec.is_recording),
+        "living": is_live_status,
+        "error": is_error_status,
+        "offline": is_offline_status,
+        "stopped": is_stopped_status,
+    }
+    STATE_FIELDS = ("is_recording", "is_live", "monitor_status", "status_info")
+    PLATFORM_FIELDS = ("platform", "platform_key")
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._all: set[str] = set()
+        self._members: dict[str, set[str]] = {bucket: set() for bucket in self.BUCKETS}
+        self._platform_members: dict[str, set[str]] = defaultdict(set)
+        self._platform_names: dict[str, str] = {}
+        self._rec_platform: dict[str, str] = {}
+        self._listeners: list[Callable[[], None]] = []
+        Recording.add_change_listener(self._on_recording_changed, self.STATE_FIELDS + self.PLATFORM_FIELDS)
+
+    def add_listener(self, listener: Callable[[], None]):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self):
+        for listener in list(self._listeners):
+            listener()
+
+    def add(self, recording: Recording):
+        with self._lock:
+            changed = self._add(recording)
+        if changed:
+            self._notify()
+
+    def _add(self, recording: Recording) -> bool:
+        is_new = recording.rec_id not in self._all
+        self._all.add(recording.rec_id)
+        changed = self._refresh_state(recording)
+        self._refresh_platform(recording)
+        return is_new or changed
+
+    def refresh(self, recording: Recording):
+        """Recompute bucket membership of a recording that is already tracked."""
+        if recording.rec_id in self._all:
+            self.add(recording)
+
+    def remove(self, rec_id: str):
+        with self._lock:
+            if rec_id not in self._all:
+                return
+            self._all.discard(rec_id)
+            for members in self._members.values():
+                members.discard(rec_id)
+            self._drop_platform(rec_id)
+        self._notify()
+
+    def clear(self):
+        with self._lock:
+            changed = bool(self._all)
+            self._clear()
+        if changed:
+            self._notify()
+
+    def _clear(self):
+        self._all.clear()
+        for members in self._members.values():
+            members.clear()
+        self._platform_members.clear()
+        self._platform_names.clear()
+        self._rec_platform.clear()
+
+    def rebuild(self, recordings: list[Recording]):
+        with self._lock:
+            self._clear()
+            for recording in recordings:
+                self._add(recording)
+        self._notify()
+
+    def _on_recording_changed(self, recording: Recording, field: str):
+        if recording.rec_id not in self._all:
+            return
+        with self._lock:
+            if field in self.PLATFORM_FIELDS:
+                self._refresh_platform(recording)
+                return
+            changed = self._refresh_state(recording)
+        if changed:
+            self._notify()
+
+    def _refresh_state(self, recording: Recording) -> bool:
+        changed = False
+        for bucket, predicate in self.BUCKETS.items():
+            members = self._members[bucket]
+            is_member = predicate(recording)
+            if is_member == (recording.rec_id in members):
+                continue
+            changed = True
+            if is_member:
+                members.add(recording.rec_id)
+            else:
+                members.discard(recording.rec_id)
+        return changed
+
+    def _refresh_platform(self, recording: Recording):
+        self._drop_platform(recording.rec_id)
+        if recording.platform and recording.platform_key:
+            self._rec_platform[recording.rec_id] = recording.platform_key
+            self._platform_members[recording.platform_key].add(recording.rec_id)
+            self._platform_names[recording.platform_key] = recording.platform
+
+    def _drop_platform(self, rec_id: str):
+        platform_key = self._rec_platform.pop(rec_id, None)
+        if platform_key is None:
+            return
+        members = self._platform_members.get(platform_key)
+        if members is not None:
+            members.discard(rec_id)
+            if not members:
+                del self._platform_members[platform_key]
+                self._platform_names.pop(platform_key, None)
+
+    @property
+    def total(self) -> int:
+        return len(self._all)
+
+    def count(self, bucket: str) -> int:
+        if bucket == "all":
+            return len(self._all)
+        return len(self._members.get(bucket, ()))
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            return {"all": len(self._all), **{bucket: len(members) for bucket, members in self._members.items()}}
+
+    def members(self, bucket: str) -> frozenset[str]:
+        with self._lock:
+            if bucket == "all":
+                return frozenset(self._all)
+            return frozenset(self._members.get(bucket, ()))
+
+    def platforms(self) -> dict[str, str]:
+        """Return ``{platform_key: platform_name}`` for every platform that has at least one recording."""
+        with self._lock:
+            return dict(self._platform_names)
+
+    def matching_ids(self, status_filter: str, platform_filter: str) -> set[str]:
+        with self._lock:
+            if status_filter == "all":
+                ids = set(self._all)
+            else:
+                ids = set(self._members.get(status_filter, ()))
+            if platform_filter != "all":
+                ids &= self._platform_members.get(platform_filter, set())
+            return ids
@@ -0,0 +1,73 @@
+import re
+import time
+from urllib.parse import parse_qs, urlsplit
+
+# Query parameters that carry an absolute expiry time, in the order they are tried.
+PLATFORM_EXPIRY_PARAMS = {
+    "douyin": ("expire",),
+    "tiktok": ("expire",),
+    "huya": ("wsTime",),
+    "douyu": ("txTime", "wsTime", "expire"),
+    "bilibili": ("expires", "deadline"),
+    "kuaishou": ("expire", "txTime"),
+    "yy": ("wsTime", "expire"),
+    "netease": ("wsTime", "txTime"),
+}
+GENERIC_EXPIRY_PARAMS = (
+    "expire", "expires", "Expires", "expiration", "deadline", "x-expires", "txTime", "wsTime", "wsABSTime",
+)
+HEX_TIME_PARAMS = frozenset({"txTime", "wsTime", "wsABSTime"})
+TOKEN_EXPIRY_PATTERN = re.compile(r"(?:^|[~&])exp=(\d{10})")
+
+MAX_EXPIRY_SECONDS = 30 * 24 * 3600
+
+
+def _parse_timestamp(value: str, is_hex: bool) -> float | None:
+    value = value.strip()
+    try:
+        if is_hex and re.fullmatch(r"[0-9a-fA-F]{8}", value):
+            timestamp = int(value, 16)
+        elif value.isdigit():
+            timestamp = int(value)
+            if len(value) == 13:
+                timestamp /= 1000
+        else:
+            return None
+    except ValueError:
+        return None
+
+    now = time.time()
+    if now - 24 * 3600 < timestamp < now + MAX_EXPIRY_SECONDS:
+        return float(timestamp)
+    return None
+
+
+def get_stream_expiry(stream_url: str | None, platform_key: str | None = None) -> float | None:
+    """
+    Return the unix time at which a signed stream URL stops working, or None if it carries no usable expiry.
+
+    Handles decimal and millisecond epochs (``expire``, ``expires``), the hex timestamps used by Tencent and
+    Wangsu CDNs (``txTime``, ``wsTime``) and Akamai style ``exp=`` tokens. Zero or implausible values are ignored.
+    """
+    if not stream_url:
+        return None
+    query = parse_qs(urlsplit(stream_url).query)
+    if not query:
+        return None
+
+    param_names = PLATFORM_EXPIRY_PARAMS.get(platform_key, ()) + GENERIC_EXPIRY_PARAMS
+    for name in param_names:
+        values = query.get(name)
+        if values:
+            expiry = _parse_timestamp(values[0], name in HEX_TIME_PARAMS)
+            if expiry:
+                return expiry
+
+    for name in ("hdnts", "__token__"):
+        for value in query.get(name, ()):
+            match = TOKEN_EXPIRY_PATTERN.search(value)
+            if match:
+                expiry = _parse_timestamp(match.group(1), False)
+                if expiry:
+                    return expiry
+    return None
@@ -1,21 +1,46 @@
+from __future__ import annotations
+
 import asyncio
 import os
 import shutil
 import subprocess
 import time
 from datetime import datetime
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from ...messages import desktop_notify, message_pusher
 from ...models.media.video_quality_model import VideoQuality
 from ...models.recording.recording_status_model import RecordingStatus
 from ...utils import utils
 from ...utils.logger import logger
+from ..events.event_bus import EventBus
+from ..events.events import (
+    OutputFinalized,
+    RecordingStarted,
+    RecordingStatusChanged,
+    RecordingStopped,
+    SegmentClosed,
+)
 from ..media import ffmpeg_builders
 from ..media.direct_downloader import DirectStreamDownloader
+from ..metrics.metrics import (
+    LIVE_CHECK_DURATION,
+    LIVE_CHECK_ERRORS,
+    QUEUE_DEPTH,
+    RECORDED_BYTES,
+    RECORDER_RESTARTS,
+    RECORDING_OUTPUT_BYTES,
+)
 from ..platforms import platform_handlers
-from ..platforms.platform_handlers import StreamData
+from ..platforms.resolver_pool import ResolverPool
+from ..platforms.stream_info_cache import StreamInfoCache
 from ..runtime.process_manager import BackgroundService
+from ..storage.output_placement import is_within
+from .stream_expiry import get_stream_expiry
+from .stream_sources import StreamSourceSet
+
+if TYPE_CHECKING:
+    from streamget import StreamData
 
 T = TypeVar("T")
 
@@ -24,6 +49,11 @@ class LiveStreamRecorder:
     DEFAULT_SEGMENT_TIME = "1800"
     DEFAULT_SAVE_FORMAT = "mp4"
     DEFAULT_QUALITY = VideoQuality.OD
+    URL_REFRESH_MARGIN = 60
+    URL_REFRESH_RETRY = 15
+    STALL_TIMEOUT = 60
+    OUTPUT_POLL_INTERVAL = 5
+    SAFE_RETURN_CODES = (0, 255)
 
     def __init__(self, app, recording, recording_info):
         self.app = app
@@ -32,6 +62,7 @@ class LiveStreamRecorder:
         self.recording_info = recording_info
         self.subprocess_start_info = app.subprocess_start_up_info
         self.should_stop = False  # manually stopped
+        self.handed_over = False  # replaced by a recorder with a freshly resolved stream URL
 
         self.user_config = self.settings.user_config
         self.account_config = self.settings.accounts_config
@@ -47,9 +78,15 @@ class LiveStreamRecorder:
         self.save_format = self._get_info("save_format", default=self.DEFAULT_SAVE_FORMAT).lower()
         self.proxy = self.is_use_proxy()
         self.direct_downloader = None
+        self.fetch_error = None
+        self.stream_info = None
+        self.source_set = None
+        self._output_size = -1
+        self._metered_bytes = 0
+        self._output_progress_at = 0
+        self._current_segment = None
         self.min_valid_recording_duration = 25
         self.recording_start_time = 0
-        os.makedirs(self.output_dir, exist_ok=True)
         self.app.language_manager.add_observer(self)
         self._ = {}
         self.load()
@@ -105,7 +142,16 @@ class LiveStreamRecorder:
 
         return full_filename
 
+    def place_output(self, output_root: str):
+        """Record below the output root chosen by the placement policy, also after a failover."""
+        self.recording_info["output_dir"] = self.output_dir = output_root
+        os.makedirs(self.output_dir, exist_ok=True)
+
     def _get_output_dir(self, stream_info: StreamData) -> str:
+        if self.recording.recording_dir and not is_within(self.recording.recording_dir, self.output_dir):
+            # The previous session was placed on another output root.
+            self.recording.recording_dir = None
+
         if self.recording.recording_dir and self.user_config.get("folder_name_time"):
             current_date = datetime.today().strftime("%Y-%m-%d")
             if current_date not in self.recording.recording_dir:
@@ -165,7 +211,10 @@ class LiveStreamRecorder:
 
     def _get_record_url(self, stream_info: StreamData):
 
-        url = self._select_source_url(stream_info)
+        if self.source_set and self.source_set.current:
+            url = self.source_set.current.url
+        else:
+            url = self._select_source_url(stream_info)
 
         http_record_list = ["shopee", "migu"]
         if self.user_config.get("force_https_recording") and url.startswith("http://"):
@@ -210,7 +259,30 @@ class LiveStreamRecorder:
             account_type=self.account_config.get(self.platform_key, {}).get("account_type")
         )
 
-        stream_info = await handler.get_stream_info(self.live_url)
+        rate_limiter = self.app.record_manager.rate_limiter
+        resolver_pool = ResolverPool.get_instance(
+            mode=self.user_config.get("resolver_pool_mode") or "inline",
+            workers=int(self.user_config.get("resolver_pool_workers") or 4),
+        )
+
+        async def resolve_stream_info():
+            await rate_limiter.get(self.platform_key).acquire()
+            started = time.perf_counter()
+            result, self.fetch_error = await resolver_pool.resolve(handler, self.live_url)
+            platform_label = self.platform_key or "unknown"
+            LIVE_CHECK_DURATION.observe(time.perf_counter() - started, platform=platform_label)
+            if result is None or self.fetch_error:
+                error_type = type(self.fetch_error).__name__ if self.fetch_error else "NoStreamData"
+                LIVE_CHECK_ERRORS.inc(platform=platform_label, error=error_type)
+            rate_limiter.report(self.platform_key, result, self.fetch_error)
+            return result
+
+        stream_info = await StreamInfoCache.get_instance().get_or_fetch(
+            StreamInfoCache.make_key(
+                self.live_url, self.quality, self.proxy, self.cookies, self.account_config.get(self.platform_key)
+            ),
+            resolve_stream_info
+        )
         self.recording.is_checking = False
         return stream_info
 
@@ -220,6 +292,12 @@ class LiveStreamRecorder:
         """
 
         self.save_format, use_direct_download = self._get_record_format(stream_info)
+        self.stream_info = stream_info
+        if self.source_set is None:
+            # Candidates are only probed on the first failover, a healthy start costs no extra CDN requests.
+            self.source_set = StreamSourceSet.from_stream_info(
+                stream_info, self._select_source_url(stream_info), flv_only=use_direct_download
+            )
         filename = self._get_filename(stream_info)
         self.output_dir = self._get_output_dir(stream_info)
         save_path = self._get_save_path(filename, use_direct_download)
@@ -246,11 +324,7 @@ class LiveStreamRecorder:
 
         if use_direct_download:
             logger.info(f"Use Direct Downloader to Download FLV Stream: {record_url}")
-            headers = {}
-            header_params = self.get_headers_params(record_url, self.platform_key)
-            if header_params:
-                key, value = header_params.split(":", 1)
-                headers[key] = value
+            headers = self._get_headers_dict(record_url)
 
             self.direct_downloader = DirectStreamDownloader(
                 record_url=record_url,
@@ -289,15 +363,101 @@ class LiveStreamRecorder:
                 self.user_config.get("custom_script_command")
             )
 
+    def _get_headers_dict(self, record_url: str | None) -> dict[str, str]:
+        headers = {}
+        header_params = self.get_headers_params(record_url or self.live_url, self.platform_key)
+        if header_params:
+            key, value = header_params.split(":", 1)
+            headers[key] = value
+        return headers
+
+    @staticmethod
+    def _list_output_files(save_file_path: str) -> list[tuple[str, int]]:
+        """Return (path, size) of the files written so far, oldest segment first."""
+        if "%03d" not in save_file_path:
+            if os.path.exists(save_file_path):
+                return [(save_file_path, os.path.getsize(save_file_path))]
+            return []
+        directory = os.path.dirname(save_file_path)
+        prefix = os.path.basename(save_file_path).split("%03d", 1)[0]
+        try:
+            with os.scandir(directory) as entries:
+                files = [(entry.path, entry.stat().st_size) for entry in entries if entry.name.startswith(prefix)]
+        except OSError:
+            return []
+        return sorted(files)
+
+    async def _track_output(self, save_file_path: str) -> int:
+        """Return the total output size, emitting SegmentClosed once FFmpeg has moved on to a new segment."""
+        files = await asyncio.to_thread(self._list_output_files, save_file_path)
+        if files:
+            newest = files[-1][0]
+            if self._current_segment and newest != self._current_segment:
+                sizes = dict(files)
+                self.emit(SegmentClosed(self.recording, self._current_segment, sizes.get(self._current_segment, 0)))
+            self._current_segment = newest
+        total = sum(size for _, size in files)
+        self._meter_output(total)
+        return total
+
+    def _meter_output(self, total: int):
+        """Count newly written bytes; a shrinking total (e.g. a converted segment was removed) is not negative."""
+        if total > self._metered_bytes:
+            disk_monitor = self.app.record_manager.disk_monitor
+            disk_monitor.add_written(self.output_dir, total - self._metered_bytes)
+            disk = disk_monitor.disk_label(self.output_dir)
+            RECORDED_BYTES.inc(total - self._metered_bytes, platform=self.platform_key or "unknown", disk=disk)
+        self._metered_bytes = total
+        RECORDING_OUTPUT_BYTES.set(total, rec_id=self.recording.rec_id)
+
+    async def _close_current_segment(self):
+        if self._current_segment:
+            path = self._current_segment
+            size = await asyncio.to_thread(lambda: os.path.getsize(path) if os.path.exists(path) else 0)
+            self.emit(SegmentClosed(self.recording, self._current_segment, size))
+            self._current_segment = None
+
+    def emit(self, event):
+        EventBus.get_instance().emit(event)
+
+    def finalize_outputs(self, paths: list[str]):
+        """Announce output files that neither the recorder nor post-processing will touch again."""
+        for path in paths:
+            self.emit(OutputFinalized(self.recording, path))
+
+    def is_stalled(self, output_size: int) -> bool:
+        """True once the recorded output has not grown for STALL_TIMEOUT seconds."""
+        now = time.time()
+        if output_size != self._output_size:
+            self._output_size = output_size
+            self._output_progress_at = now
+            return False
+        return now - self._output_progress_at > self.STALL_TIMEOUT
+
+    async def fail_over(self, reason: str) -> bool:
+        """Hand the recording to a new recorder on the next healthy source URL, if there is one."""
+        if self.handed_over or not self.stream_info or not self.source_set or not self.source_set.has_next():
+            return False
+        await self.source_set.probe(self._get_headers_dict(self.stream_info.record_url), self.proxy)
+        next_source = self.source_set.fail_current()
+        logger.warning(f"Stream source failed ({reason}), switching to {next_source.kind} source: {self.live_url}")
+        recorder = LiveStreamRecorder(self.app, self.recording, self.recording_info)
+        recorder.source_set = self.source_set
+        self.handed_over = True
+        RECORDER_RESTARTS.inc(platform=self.platform_key or "unknown", reason="failover")
+        await recorder.start_recording(self.stream_info)
+        return True
+
     async def remove_active_recorder(self):
         try:
-            if self.recording.rec_id in self.app.record_manager.active_recorders:
+            if self.app.record_manager.active_recorders.get(self.recording.rec_id) is self:
                 del self.app.record_manager.active_recorders[self.recording.rec_id]
                 logger.info(f"Removed recorder from active_recorders: {self.recording.rec_id}")
         except Exception as e:
             logger.error(f"Failed to remove recorder instance: {e}")
 
     async def recheck_live_status(self):
+        StreamInfoCache.get_instance().invalidate(self.live_url)
         if not self.should_stop:
             # not manually stopped
             recording_duration = time.time() - self.recording_start_time
@@ -340,12 +500,16 @@ class LiveStreamRecorder:
             logger.info(f"Recording in Progress: {live_url}")
             logger.log("STREAM", f"Recording Stream URL: {record_url}")
             self.recording_start_time = time.time()
+            self.app.page.run_task(self.refresh_before_expiry, record_url)
+            self.emit(RecordingStarted(self.recording, record_url, save_file_path))
 
+            next_output_poll = 0.0
             while True:
                 if self.should_stop or self.recording.force_stop or not self.app.recording_enabled:
                     logger.info(f"Preparing to End Recording: {live_url}")
                     await self.remove_active_recorder()
-                    self.recording.is_recording = False
+                    if not self.handed_over:
+                        self.recording.is_recording = False
                     try:
                         if os.name == "nt":
                             if process.stdin:
@@ -367,39 +531,58 @@ class LiveStreamRecorder:
                         process.kill()
                         await process.wait()
 
-                    self.recording.force_stop = False
+                    if not self.handed_over:
+                        self.recording.force_stop = False
                     break
 
                 if process.returncode is not None:
                     logger.info(f"Exit loop recording (normal 0 | abnormal 1): code={process.returncode}, {live_url}")
                     await self.remove_active_recorder()
-                    self.recording.is_recording = False
+                    if process.returncode not in self.SAFE_RETURN_CODES:
+                        await self.fail_over(f"ffmpeg exited with code {process.returncode}")
+                    if not self.handed_over:
+                        self.recording.is_recording = False
                     break
 
+                if time.monotonic() >= next_output_poll:
+                    next_output_poll = time.monotonic() + self.OUTPUT_POLL_INTERVAL
+                    if self.is_stalled(await self._track_output(save_file_path)):
+                        await self.fail_over(f"no data written for {self.STALL_TIMEOUT}s")
+
                 await asyncio.sleep(1)
 
             return_code = process.returncode
-            safe_return_code = [0, 255]
+            safe_return_code = self.SAFE_RETURN_CODES
             stdout, stderr = await process.communicate()
+            await self._track_output(save_file_path)
+            await self._close_current_segment()
             
-            if return_code not in safe_return_code and stderr:
+            if return_code not in safe_return_code and stderr and not self.handed_over:
                 if not self.recording.is_recording:
                     logger.error(f"FFmpeg Stderr Output: {str(stderr.decode()).splitlines()[0]}")
                     self.recording.status_info = RecordingStatus.RECORDING_ERROR
+                    StreamInfoCache.get_instance().invalidate(self.live_url)
 
                     try:
                         self.app.record_manager.stop_recording(self.recording)
-                        await self.app.record_card_manager.update_card(self.recording)
-                        self.app.page.pubsub.send_others_on_topic("update", self.recording)
+                        self.emit(RecordingStatusChanged(self.recording))
                         await self.app.snack_bar.show_snack_bar(
                             record_name + " " + self._["record_stream_error"], duration=2000
                         )
                     except Exception as e:
                         logger.debug(f"Failed to update UI: {e}")
 
+            if self.handed_over:
+                logger.info(f"Recorder handed over to a fresh stream URL: {record_name}")
+            else:
+                self.emit(RecordingStopped(
+                    self.recording, save_file_path, self.recording.status_info == RecordingStatus.RECORDING_ERROR
+                ))
+
             if return_code in safe_return_code:
-                self.recording.is_live = False
-                if not self.recording.is_recording:
+                if not self.handed_over:
+                    self.recording.is_live = False
+                if not self.recording.is_recording and not self.handed_over:
                     if self.recording.monitor_status:
                         self.recording.status_info = RecordingStatus.MONITORING
                         display_title = self.recording.title
@@ -414,18 +597,15 @@ class LiveStreamRecorder:
                         logger.success(f"Live recording completed: {record_name}")
                         self.app.page.run_task(self.end_message_push)
                     
-                    try:
-                        self.recording.update({"display_title": display_title})
-                        self.app.page.run_task(self.app.record_card_manager.update_card, self.recording)
-                        self.app.page.pubsub.send_others_on_topic("update", self.recording)
-                    except Exception as e:
-                        logger.debug(f"Failed to update UI: {e}")
+                    self.recording.update({"display_title": display_title})
+                    self.emit(RecordingStatusChanged(self.recording))
 
                 if not self.app.recording_enabled:
                     self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
                     self.app.page.run_task(self.stop_recording_notify)
 
-                await self.recheck_live_status()
+                if not self.handed_over:
+                    await self.recheck_live_status()
 
                 if self.user_config.get("convert_to_mp4") and self.save_format == "ts":
                     if self.segment_record:
@@ -473,14 +653,21 @@ class LiveStreamRecorder:
                             self.user_config.get("convert_to_mp4")
                         )
 
+            # Files that are converted to MP4 are final once the conversion is done, see converts_mp4.
+            if not (return_code in safe_return_code and self.user_config.get("convert_to_mp4")
+                    and self.save_format == "ts"):
+                output_files = await asyncio.to_thread(self._list_output_files, save_file_path)
+                self.finalize_outputs([path for path, _ in output_files])
+
         except Exception as e:
             logger.error(f"An error occurred during the subprocess execution: {e}")
             self.recording.status_info = RecordingStatus.RECORDING_ERROR
+            StreamInfoCache.get_instance().invalidate(self.live_url)
 
+            self.emit(RecordingStopped(self.recording, error=True))
             try:
                 self.app.record_manager.stop_recording(self.recording)
-                await self.app.record_card_manager.update_card(self.recording)
-                self.app.page.pubsub.send_others_on_topic("update", self.recording)
+                self.emit(RecordingStatusChanged(self.recording))
                 await self.app.snack_bar.show_snack_bar(
                     record_name + " " + self._["no_ffmpeg_tip"], duration=4000
                 )
@@ -488,7 +675,8 @@ class LiveStreamRecorder:
                 logger.debug(f"Failed to update UI: {e}")
             return False
         finally:
-            self.recording.record_url = None
+            if not self.handed_over:
+                self.recording.record_url = None
 
         return True
 
@@ -502,7 +690,9 @@ class LiveStreamRecorder:
             return
 
         # Otherwise, execute transcoding normally
-        await self._do_converts_mp4(converts_file_path, is_original_delete)
+        with QUEUE_DEPTH.track_in_progress(queue="post_processing"):
+            outputs = await self._do_converts_mp4(converts_file_path, is_original_delete)
+        self.finalize_outputs(outputs)
 
     def converts_mp4_sync(self, converts_file_path: str, is_original_delete: bool = True) -> None:
         """Synchronous version of the transcoding method, used for background service"""
@@ -513,8 +703,8 @@ class LiveStreamRecorder:
         finally:
             loop.close()
 
-    async def _do_converts_mp4(self, converts_file_path: str, is_original_delete: bool = True) -> None:
-        """Actual execution method for transcoding"""
+    async def _do_converts_mp4(self, converts_file_path: str, is_original_delete: bool = True) -> list[str]:
+        """Actual execution method for transcoding, returns the files it leaves behind"""
         converts_success = False
         save_path = None
         try:
@@ -550,6 +740,7 @@ class LiveStreamRecorder:
         except subprocess.CalledProcessError as e:
             logger.error(f"Video transcoding failed! Error message: {e.output.decode()}")
 
+        outputs = [save_path] if converts_success else [converts_file_path]
         try:
             if converts_success:
                 if is_original_delete:
@@ -560,13 +751,14 @@ class LiveStreamRecorder:
                 else:
                     converts_dir = f"{os.path.dirname(save_path)}/original"
                     os.makedirs(converts_dir, exist_ok=True)
-                    shutil.move(converts_file_path, converts_dir)
+                    outputs.append(shutil.move(converts_file_path, converts_dir))
                     logger.info(f"Move Transcoding Files: {converts_file_path}")
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Error occurred during conversion: {e}")
         except Exception as e:
             logger.error(f"An unknown error occurred: {e}")
+        return outputs
 
     async def custom_script_execute(
             self,
@@ -615,6 +807,7 @@ class LiveStreamRecorder:
             loop.close()
 
     async def run_script_async(self, command: str) -> None:
+        QUEUE_DEPTH.inc(queue="post_processing")
         try:
             process = await asyncio.create_subprocess_exec(
                 *command.split(),
@@ -643,6 +836,8 @@ class LiveStreamRecorder:
             logger.error("Please add `#!/bin/bash` at the beginning of your bash script file.")
         except Exception as e:
             logger.error(f"An error occurred: {e}")
+        finally:
+            QUEUE_DEPTH.dec(queue="post_processing")
 
     @staticmethod
     def get_headers_params(live_url, platform_key):
@@ -684,14 +879,14 @@ class LiveStreamRecorder:
             logger.info(f"Direct Downloading: {live_url}")
             logger.log("STREAM", f"Direct Download Stream URL: {record_url}")
             self.recording_start_time = time.time()
+            self.app.page.run_task(self.refresh_before_expiry, record_url)
+            self.emit(RecordingStarted(self.recording, record_url, save_file_path))
 
             while True:
                 if self.should_stop or self.recording.force_stop or not self.app.recording_enabled:
                     logger.info(f"Prepare to end direct download: {live_url}")
                     await self.remove_active_recorder()
-                    self.recording.is_recording = False
                     await self.direct_downloader.stop_download()
-                    self.recording.force_stop = False
                     break
 
                 await asyncio.sleep(1)
@@ -699,10 +894,21 @@ class LiveStreamRecorder:
                 if self.direct_downloader.download_task and self.direct_downloader.download_task.done():
                     break
 
+                self._meter_output(self.direct_downloader.total_bytes)
+                if self.is_stalled(self.direct_downloader.total_bytes):
+                    await self.fail_over(f"no data received for {self.STALL_TIMEOUT}s")
+
             await self.remove_active_recorder()
-            self.recording.is_recording = False
+            self.emit(SegmentClosed(self.recording, save_file_path, self.direct_downloader.total_bytes))
+            self.finalize_outputs([save_file_path])
+            if self.handed_over:
+                logger.info(f"Direct downloader handed over to a fresh stream URL: {record_name}")
+            else:
+                self.recording.is_recording = False
+                self.recording.force_stop = False
+                self.emit(RecordingStopped(self.recording, save_file_path))
 
-            if not self.recording.is_recording:
+            if not self.recording.is_recording and not self.handed_over:
                 self.recording.is_live = False
                 if self.recording.monitor_status:
                     self.recording.status_info = RecordingStatus.MONITORING
@@ -718,18 +924,15 @@ class LiveStreamRecorder:
                     logger.success(f"Direct Downloading Completed: {record_name}")
                     self.app.page.run_task(self.end_message_push)
 
-                try:
-                    self.recording.update({"display_title": display_title})
-                    await self.app.record_card_manager.update_card(self.recording)
-                    self.app.page.pubsub.send_others_on_topic("update", self.recording)
-                except Exception as e:
-                    logger.debug(f"Failed to update UI: {e}")
+                self.recording.update({"display_title": display_title})
+                self.emit(RecordingStatusChanged(self.recording))
 
             if not self.app.recording_enabled:
                 self.recording.status_info = RecordingStatus.NOT_RECORDING_SPACE
                 self.app.page.run_task(self.stop_recording_notify)
 
-            await self.recheck_live_status()
+            if not self.handed_over:
+                await self.recheck_live_status()
 
             if self.user_config.get("execute_custom_script") and script_command:
                 logger.info("Prepare to execute custom script in the background")
@@ -760,11 +963,12 @@ class LiveStreamRecorder:
         except Exception as e:
             logger.error(f"Error occurred during direct download: {e}")
             self.recording.status_info = RecordingStatus.RECORDING_ERROR
+            StreamInfoCache.get_instance().invalidate(self.live_url)
 
+            self.emit(RecordingStopped(self.recording, save_file_path, error=True))
             try:
                 self.app.record_manager.stop_recording(self.recording)
-                await self.app.record_card_manager.update_card(self.recording)
-                self.app.page.pubsub.send_others_on_topic("update", self.recording)
+                self.emit(RecordingStatusChanged(self.recording))
                 await self.app.snack_bar.show_snack_bar(
                     record_name + " " + self._["record_stream_error"], duration=2000
                 )
@@ -772,7 +976,8 @@ class LiveStreamRecorder:
                 logger.debug(f"Failed to update UI: {e}")
             return False
         finally:
-            self.recording.record_url = None
+            if not self.handed_over:
+                self.recording.record_url = None
 
     async def stop_recording_notify(self):
         if desktop_notify.should_push_notification(self.app):
@@ -803,6 +1008,56 @@ class LiveStreamRecorder:
 
             self.app.page.run_task(msg_manager.push_messages, msg_title, push_content)
 
+    async def refresh_before_expiry(self, record_url: str):
+        """
+        Re-resolve the stream shortly before its signed URL expires and hand the recording over to a new
+        recorder, instead of waiting for the CDN to reject the old URL.
+        """
+        expires_at = get_stream_expiry(record_url, self.platform_key)
+        if not expires_at:
+            return
+        logger.info(f"Stream URL expires at {datetime.fromtimestamp(expires_at)}: {self.live_url}")
+
+        while True:
+            delay = expires_at - time.time() - self.URL_REFRESH_MARGIN
+            await asyncio.sleep(max(delay, self.URL_REFRESH_RETRY))
+            if (
+                    self.should_stop
+                    or self.handed_over
+                    or self.app.record_manager.active_recorders.get(self.recording.rec_id) is not self
+            ):
+                return
+            try:
+                if await self.hand_over_to_fresh_url(record_url, expires_at):
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to refresh stream URL: {self.live_url}, {e}")
+            if time.time() > expires_at:
+                logger.warning(f"Stream URL expired without a replacement: {self.live_url}")
+                return
+
+    async def hand_over_to_fresh_url(self, record_url: str, expires_at: float) -> bool:
+        StreamInfoCache.get_instance().invalidate(self.live_url)
+        recorder = LiveStreamRecorder(self.app, self.recording, self.recording_info)
+        stream_info = await recorder.fetch_stream()
+        if not stream_info or not stream_info.is_live:
+            return False
+
+        fresh_url = recorder._get_record_url(stream_info)
+        fresh_expiry = get_stream_expiry(fresh_url, self.platform_key)
+        if not fresh_url or fresh_url == record_url or (fresh_expiry and fresh_expiry <= expires_at):
+            logger.debug(f"Platform returned no fresher stream URL yet: {self.live_url}")
+            return False
+
+        if self.should_stop or self.app.record_manager.active_recorders.get(self.recording.rec_id) is not self:
+            return False
+
+        logger.info(f"Handing recording over to refreshed stream URL: {self.live_url}")
+        self.handed_over = True
+        RECORDER_RESTARTS.inc(platform=self.platform_key or "unknown", reason="url_refresh")
+        await recorder.start_recording(stream_info)
+        return True
+
     def request_stop(self):
         logger.info(f"Stop requested for recorder: {self.recording.url}, rec_id: {self.recording.rec_id}")
         logger.info(f"Recorder instance details - id: {id(self)}, recording: {self.recording.title}")
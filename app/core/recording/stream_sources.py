@@ -0,0 +1,150 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import httpx
+
+from ...utils import utils
+from ...utils.logger import logger
+
+
+@dataclass
+class StreamSource:
+    url: str
+    kind: str
+    first_byte_ms: float | None = None
+    throughput_kbps: float | None = None
+    failures: int = 0
+    probed: bool = False
+
+    @property
+    def score(self) -> float:
+        """Estimated seconds to fetch the probe budget; unprobed or failed sources sort last."""
+        if self.failures or self.first_byte_ms is None:
+            return float("inf")
+        transfer = StreamSourceSet.PROBE_BYTES / (self.throughput_kbps * 128) if self.throughput_kbps else 0
+        return self.first_byte_ms / 1000 + transfer
+
+
+class StreamSourceSet:
+    """
+    The candidate stream URLs of one live session, ranked by measured first-byte latency and throughput.
+
+    The recorder starts on the preferred URL and moves to the next candidate when the current one fails or
+    stalls, without going through a full live status check. The candidates are probed on the first failover
+    only, and the results are kept for later ones.
+    """
+
+    PROBE_BYTES = 256 * 1024
+    PROBE_TIMEOUT = 3.0
+    EXTRA_URL_SUFFIXES = (".flv", ".m3u8")
+
+    def __init__(self, sources: list[StreamSource], preferred_kind: str | None = None):
+        self.sources = sources
+        self.preferred_kind = preferred_kind or (sources[0].kind if sources else None)
+        self.index = 0
+
+    @staticmethod
+    def _kind(url: str) -> str:
+        return "hls" if ".m3u8" in url.split("?", 1)[0] else "flv"
+
+    @classmethod
+    def from_stream_info(cls, stream_info, preferred_url: str | None, flv_only: bool = False):
+        """Collect the preferred URL first, then flv/m3u8/record URLs and any backup lines in ``extra``."""
+        candidates = [preferred_url, stream_info.flv_url, stream_info.m3u8_url, stream_info.record_url]
+        extra = getattr(stream_info, "extra", None)
+        if isinstance(extra, dict):
+            for key, value in extra.items():
+                values = value if isinstance(value, list | tuple) else [value]
+                for item in values:
+                    if (
+                        "url" in str(key).lower()
+                        and isinstance(item, str)
+                        and item.startswith("http")
+                        and any(suffix in item for suffix in cls.EXTRA_URL_SUFFIXES)
+                    ):
+                        candidates.append(item)
+
+        sources = []
+        seen = set()
+        for url in candidates:
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            kind = cls._kind(url)
+            if flv_only and kind != "flv" and url != preferred_url:
+                continue
+            codec = utils.get_query_params(url, "codec")
+            if kind == "flv" and not flv_only and codec and codec[0] == "h265":
+                continue
+            sources.append(StreamSource(url, kind))
+        return cls(sources, cls._kind(preferred_url) if preferred_url else None)
+
+    def __len__(self):
+        return len(self.sources)
+
+    @property
+    def current(self) -> StreamSource | None:
+        return self.sources[self.index] if self.index < len(self.sources) else None
+
+    def has_next(self) -> bool:
+        return any(not source.failures for source in self.sources[self.index + 1:])
+
+    def fail_current(self) -> StreamSource | None:
+        """Mark the current source as failed and move to the next healthy one."""
+        if self.current:
+            self.current.failures += 1
+        self.index += 1
+        while self.current and self.current.failures:
+            self.index += 1
+        return self.current
+
+    async def _probe_one(self, source: StreamSource, headers: dict, proxy: str | None):
+        started = time.perf_counter()
+        received = 0
+        try:
+            async with httpx.AsyncClient(headers=headers, proxy=proxy, timeout=self.PROBE_TIMEOUT,
+                                         follow_redirects=True) as client:
+                async with client.stream("GET", source.url) as response:
+                    if response.status_code >= 400:
+                        source.failures += 1
+                        return
+                    first_byte_at = None
+                    async for chunk in response.aiter_bytes():
+                        if first_byte_at is None:
+                            first_byte_at = time.perf_counter()
+                            source.first_byte_ms = (first_byte_at - started) * 1000
+                        received += len(chunk)
+                        if received >= self.PROBE_BYTES or time.perf_counter() - started > self.PROBE_TIMEOUT:
+                            break
+                    if first_byte_at is not None:
+                        elapsed = max(time.perf_counter() - first_byte_at, 1e-3)
+                        source.throughput_kbps = received * 8 / 1024 / elapsed
+        except (httpx.HTTPError, OSError) as e:
+            logger.debug(f"Stream source probe failed: {source.url}, {e}")
+            source.failures += 1
+        finally:
+            source.probed = True
+
+    async def probe(self, headers: dict | None = None, proxy: str | None = None):
+        """
+        Probe the candidates after the current one that were not probed yet, concurrently, and order them best
+        first. Sources of the preferred kind (the configured FLV/HLS choice) stay ahead of the others.
+        """
+        remaining = self.sources[self.index + 1:]
+        unprobed = [source for source in remaining if not source.probed and not source.failures]
+        if len(remaining) < 2 or not unprobed:
+            return
+        await asyncio.gather(*(self._probe_one(source, headers or {}, proxy) for source in unprobed))
+        if all(source.failures for source in unprobed):
+            # Probing itself is blocked; keep these candidates usable and in their original order.
+            for source in unprobed:
+                source.failures = 0
+            return
+        remaining.sort(key=lambda source: (bool(source.failures), source.kind != self.preferred_kind, source.score))
+        self.sources[self.index + 1:] = remaining
+        for source in unprobed:
+            logger.debug(
+                f"Stream source {source.kind}: first byte {source.first_byte_ms or 0:.0f} ms, "
+                f"{source.throughput_kbps or 0:.0f} kbps, failed: {bool(source.failures)}"
+            )
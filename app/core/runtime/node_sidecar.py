@@ -0,0 +1,287 @@
+import atexit
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import execjs
+from execjs._abstract_runtime import AbstractRuntime
+from execjs._abstract_runtime_context import AbstractRuntimeContext
+
+from ...utils.logger import logger
+from ...utils.utils import get_startup_info
+
+RUNTIME_NAME = "StreamCapNode"
+
+# One JSON object per line in both directions: {"id", "op", ...} -> {"id", "ok", "result" | "error"}.
+# Stdout carries only the replies: anything the platform scripts print goes to stderr.
+SIDECAR_SCRIPT = r"""
+const vm = require("vm");
+const readline = require("readline");
+const { Console } = require("console");
+const writeReply = process.stdout.write.bind(process.stdout);
+process.stdout.write = process.stderr.write.bind(process.stderr);
+const contexts = new Map();
+const globals = {
+    require, Buffer, process, setTimeout, clearTimeout, setInterval, clearInterval,
+    console: new Console({ stdout: process.stderr, stderr: process.stderr }),
+    TextEncoder, TextDecoder, URL, URLSearchParams, atob, btoa,
+};
+function getContext(id) {
+    const ctx = contexts.get(id);
+    if (!ctx) throw new Error("unknown context: " + id);
+    return ctx;
+}
+function handle(req) {
+    switch (req.op) {
+        case "ping":
+            return "pong";
+        case "compile": {
+            if (!contexts.has(req.ctx)) {
+                const ctx = vm.createContext(Object.assign({}, globals));
+                vm.runInContext(req.source, ctx);
+                contexts.set(req.ctx, ctx);
+            }
+            return null;
+        }
+        case "eval":
+            return vm.runInContext("(" + req.code + "\n)", getContext(req.ctx));
+        case "exec":
+            return vm.runInContext("(function(){" + req.code + "\n})()", getContext(req.ctx));
+        case "call": {
+            const ctx = getContext(req.ctx);
+            ctx.__args = req.args;
+            return vm.runInContext(req.name + ".apply(this, __args)", ctx);
+        }
+        default:
+            throw new Error("unknown op: " + req.op);
+    }
+}
+function reply(message) {
+    writeReply(JSON.stringify(message) + "\n");
+}
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+    let req;
+    try {
+        req = JSON.parse(line);
+        const result = handle(req);
+        reply({ id: req.id, ok: true, result: result === undefined ? null : result });
+    } catch (e) {
+        reply({ id: req && req.id, ok: false, error: e && e.name ? e.name + ": " + e.message : String(e) });
+    }
+});
+"""
+
+
+class NodeSidecar:
+    """
+    A long-lived Node.js process that keeps compiled JS contexts warm.
+
+    The process is started on first use, restarted transparently after a crash, and contexts are
+    recompiled on the new process when needed. Requests from any thread are multiplexed over
+    stdin/stdout by request id.
+    """
+
+    _instance = None
+
+    REQUEST_TIMEOUT = 15
+    START_TIMEOUT = 10
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = NodeSidecar()
+            atexit.register(cls._instance.stop)
+        return cls._instance
+
+    def __init__(self):
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, Future] = {}
+        self._ids = itertools.count(1)
+        self._sources: dict[str, str] = {}
+        self._compiled: set[str] = set()
+        self.restarts = 0
+
+    @staticmethod
+    def find_node() -> str | None:
+        try:
+            from ...scripts import node_install
+            node_install.update_env_path()
+        except ImportError:
+            pass
+        return shutil.which("node")
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _ensure_started(self):
+        with self._lock:
+            if self.is_alive():
+                return
+            node = self.find_node()
+            if not node:
+                raise execjs.RuntimeUnavailableError("Node.js is not installed")
+            if self._process is not None:
+                self.restarts += 1
+                logger.warning(f"Node sidecar exited with code {self._process.returncode}, restarting")
+            self._fail_pending(execjs.RuntimeError("Node sidecar restarted"))
+            self._compiled.clear()
+            self._process = subprocess.Popen(
+                [node, "-e", SIDECAR_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                startupinfo=get_startup_info(),
+            )
+            threading.Thread(target=self._read_responses, args=(self._process,), daemon=True).start()
+            logger.info(f"Started Node sidecar, pid: {self._process.pid}")
+        self._send({"op": "ping"}, timeout=self.START_TIMEOUT)
+
+    def _read_responses(self, process: subprocess.Popen):
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(response, dict) or not isinstance(response.get("id"), int):
+                continue
+            future = self._pending.pop(response["id"], None)
+            if future is None:
+                continue
+            if response.get("ok"):
+                future.set_result(response.get("result"))
+            else:
+                future.set_exception(execjs.ProgramError(response.get("error")))
+        if self._process is process:
+            self._fail_pending(execjs.RuntimeError("Node sidecar exited"))
+
+    def _fail_pending(self, error: Exception):
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _send(self, payload: dict, timeout: float | None = None):
+        request_id = next(self._ids)
+        future = Future()
+        self._pending[request_id] = future
+        try:
+            with self._write_lock:
+                self._process.stdin.write(json.dumps({"id": request_id, **payload}, ensure_ascii=False) + "\n")
+                self._process.stdin.flush()
+        except (OSError, AttributeError) as e:
+            self._pending.pop(request_id, None)
+            raise execjs.RuntimeError(f"Node sidecar is not writable: {e}") from e
+        try:
+            return future.result(timeout or self.REQUEST_TIMEOUT)
+        except FutureTimeoutError:
+            self._pending.pop(request_id, None)
+            logger.error("Node sidecar request timed out, killing it")
+            self.stop()
+            raise execjs.RuntimeError("Node sidecar request timed out") from None
+
+    def request(self, payload: dict):
+        """Send a request, starting the sidecar and recompiling its context first if necessary."""
+        self._ensure_started()
+        context_id = payload.get("ctx")
+        if context_id and context_id not in self._compiled:
+            self._send({"op": "compile", "ctx": context_id, "source": self._sources[context_id]})
+            self._compiled.add(context_id)
+        return self._send(payload)
+
+    def compile(self, source: str) -> str:
+        context_id = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        self._sources.setdefault(context_id, source)
+        return context_id
+
+    def ping(self) -> bool:
+        """Health check; returns False instead of raising when the sidecar cannot answer."""
+        try:
+            return self.request({"op": "ping"}) == "pong"
+        except execjs.Error as e:
+            logger.warning(f"Node sidecar health check failed: {e}")
+            return False
+
+    def stop(self):
+        with self._lock:
+            process, self._process = self._process, None
+            self._compiled.clear()
+        if process is not None and process.poll() is None:
+            process.kill()
+        self._fail_pending(execjs.RuntimeError("Node sidecar stopped"))
+
+
+class SidecarRuntimeContext(AbstractRuntimeContext):
+    def __init__(self, sidecar: NodeSidecar, source: str):
+        self._sidecar = sidecar
+        self._context_id = sidecar.compile(source)
+
+    def is_available(self):
+        return True
+
+    def _exec_(self, source):
+        return self._sidecar.request({"op": "exec", "ctx": self._context_id, "code": source})
+
+    def _eval(self, source):
+        return self._sidecar.request({"op": "eval", "ctx": self._context_id, "code": source})
+
+    def _call(self, name, *args):
+        return self._sidecar.request({"op": "call", "ctx": self._context_id, "name": name, "args": list(args)})
+
+
+class SidecarRuntime(AbstractRuntime):
+    def __init__(self, sidecar: NodeSidecar):
+        self._sidecar = sidecar
+        self._available = False
+
+    @property
+    def name(self):
+        return RUNTIME_NAME
+
+    def is_available(self):
+        if not self._available:
+            self._available = self._sidecar.find_node() is not None
+        return self._available
+
+    def _compile(self, source, cwd=None):
+        return SidecarRuntimeContext(self._sidecar, source)
+
+
+def install_execjs_runtime() -> bool:
+    """
+    Make execjs use the warm Node sidecar, unless the user picked a runtime through EXECJS_RUNTIME.
+    """
+    if RUNTIME_NAME not in execjs.runtimes():
+        execjs.register(RUNTIME_NAME, SidecarRuntime(NodeSidecar.get_instance()))
+    if os.environ.get("EXECJS_RUNTIME", RUNTIME_NAME) != RUNTIME_NAME:
+        return False
+    os.environ["EXECJS_RUNTIME"] = RUNTIME_NAME
+    return True
+
+
+def uninstall_execjs_runtime():
+    """Hand execjs back to its own runtime lookup and stop the sidecar, if it was the selected runtime."""
+    if os.environ.get("EXECJS_RUNTIME") == RUNTIME_NAME:
+        del os.environ["EXECJS_RUNTIME"]
+        NodeSidecar.get_instance().stop()
+
+
+def apply_node_sidecar_settings(app) -> bool:
+    """
+    Install the sidecar runtime when ``node_sidecar`` is enabled in the settings (the default), otherwise
+    leave execjs on the runtime it picks by itself. Returns whether the sidecar serves execjs calls.
+    """
+    if str(app.settings.user_config.get("node_sidecar", True)).lower() in ("true", "1"):
+        return install_execjs_runtime()
+    uninstall_execjs_runtime()
+    return False
@@ -0,0 +1,205 @@
+import asyncio
+import os
+import shutil
+import time
+from dataclasses import dataclass
+
+from ...utils.logger import logger
+from ..events.event_bus import EventBus
+from ..events.events import DiskSpaceChanged
+from ..metrics.metrics import DISK_FREE_BYTES, DISK_WRITE_RATE, get_disk_label
+
+GB = 1024 ** 3
+
+
+def existing_ancestor(path: str) -> str:
+    """The path itself or its closest existing parent; output directories are created lazily."""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+@dataclass
+class VolumeState:
+    """The latest sample of one output volume."""
+
+    disk: str
+    path: str
+    total: int = 0
+    free: int = 0
+    write_rate: float = 0.0
+    sampled_at: float = 0.0
+    state: str = "ok"
+    error: str | None = None
+    written: int = 0
+    pending: asyncio.Future | None = None
+    task: asyncio.Task | None = None
+
+    @property
+    def free_gb(self) -> float:
+        return self.free / GB
+
+    def seconds_until(self, free_bytes: float) -> float | None:
+        """Seconds until free space drops to ``free_bytes`` at the current write rate, None when it is not falling."""
+        if self.free <= free_bytes:
+            return 0.0
+        if self.write_rate <= 0:
+            return None
+        return (self.free - free_bytes) / self.write_rate
+
+
+class DiskMonitor:
+    """
+    Samples the free space of every distinct output volume in a worker thread, so a slow network mount never
+    blocks the event loop; callers only read the cached samples.
+
+    Each volume is sampled on its own cadence, faster as it approaches the threshold. The fill rate is the larger
+    of what the recorders report writing and how fast free space actually shrinks (other processes and engine
+    workers write too). A volume is "low" once it is predicted to reach the threshold within ``guard_seconds``:
+    new recordings are refused there while running ones continue until it is "full".
+    """
+
+    DEFAULT_INTERVAL = 30.0
+    MIN_INTERVAL = 2.0
+    SAMPLE_TIMEOUT = 10.0
+    RATE_SMOOTHING = 0.3
+
+    def __init__(self, threshold_gb: float = 0.0, guard_seconds: float = 600, interval: float = DEFAULT_INTERVAL):
+        self.threshold = threshold_gb * GB
+        self.guard_seconds = guard_seconds
+        self.interval = interval
+        self._volumes: dict[str, VolumeState] = {}
+        self._roots: dict[str, VolumeState] = {}
+        self._adding: dict[str, asyncio.Future] = {}
+        self._labels: dict[str, str] = {}
+
+    def configure(self, threshold_gb: float, guard_seconds: float, interval: float):
+        self.threshold = max(0.0, threshold_gb) * GB
+        self.guard_seconds = max(0.0, guard_seconds)
+        self.interval = max(self.MIN_INTERVAL, interval)
+        for volume in self._volumes.values():
+            self._update_state(volume)
+
+    async def watch(self, path: str) -> VolumeState:
+        """
+        Return the volume holding ``path``, starting to sample it if it is new. Only the first call for a
+        directory waits, for one sample taken in a thread.
+        """
+        root = os.path.abspath(path)
+        volume = self._roots.get(root)
+        if volume is not None:
+            return volume
+        future = self._adding.get(root)
+        if future is None:
+            future = self._adding[root] = asyncio.ensure_future(self._add_root(root))
+            future.add_done_callback(lambda _: self._adding.pop(root, None))
+        return await asyncio.shield(future)
+
+    async def _add_root(self, root: str) -> VolumeState:
+        path, disk = await asyncio.to_thread(lambda: (existing_ancestor(root), get_disk_label(root)))
+        volume = self._volumes.get(disk)
+        if volume is None:
+            volume = self._volumes[disk] = VolumeState(disk, path)
+            await self._sample(volume)
+            volume.task = asyncio.create_task(self._sample_periodically(volume))
+            logger.info(f"Disk monitor watching {disk}: {volume.free_gb:.2f} GB free")
+        self._roots[root] = volume
+        return volume
+
+    async def refresh(self, path: str):
+        """Sample the watched volume holding ``path`` right away, e.g. after space was freed on it."""
+        volume = self.volume_for(path)
+        if volume is not None:
+            await self._sample(volume)
+
+    def volume_for(self, path: str) -> VolumeState | None:
+        """The watched volume holding ``path``, from the watched directories alone (no file system access)."""
+        path = os.path.abspath(path)
+        roots = [root for root in self._roots if path == root or path.startswith(root.rstrip(os.sep) + os.sep)]
+        return self._roots[max(roots, key=len)] if roots else None
+
+    def disk_label(self, path: str) -> str:
+        """Like ``get_disk_label``, but from the watched volumes or a cache so it is cheap to call per write."""
+        volume = self.volume_for(path)
+        if volume is not None:
+            return volume.disk
+        label = self._labels.get(path)
+        if label is None:
+            label = self._labels[path] = get_disk_label(path)
+        return label
+
+    def add_written(self, path: str, size: int):
+        """Report bytes a recorder wrote below ``path``, used to predict when its volume fills up."""
+        volume = self.volume_for(path)
+        if volume is not None and size > 0:
+            volume.written += size
+
+    def has_room(self, path: str) -> bool:
+        """False when the volume is full or predicted to fill up within the guard window; unknown volumes pass."""
+        volume = self.volume_for(path)
+        return volume is None or volume.state == "ok"
+
+    def describe(self, volume: VolumeState) -> str:
+        seconds = volume.seconds_until(self.threshold)
+        text = f"{volume.disk}: {volume.free_gb:.2f} GB free, writing {volume.write_rate / 1024 ** 2:.1f} MB/s"
+        if seconds is not None:
+            text += f", threshold reached in {seconds / 60:.0f} min"
+        return text
+
+    def _next_interval(self, volume: VolumeState) -> float:
+        seconds = volume.seconds_until(self.threshold)
+        if seconds is None:
+            return self.interval
+        return min(self.interval, max(self.MIN_INTERVAL, seconds / 4))
+
+    async def _sample_periodically(self, volume: VolumeState):
+        while True:
+            await asyncio.sleep(self._next_interval(volume))
+            await self._sample(volume)
+
+    async def _sample(self, volume: VolumeState):
+        # A hung mount keeps its one disk_usage call; later samples wait for it instead of piling up threads.
+        if volume.pending is None or volume.pending.done():
+            volume.pending = asyncio.get_running_loop().run_in_executor(None, shutil.disk_usage, volume.path)
+        try:
+            usage = await asyncio.wait_for(asyncio.shield(volume.pending), self.SAMPLE_TIMEOUT)
+        except asyncio.TimeoutError:
+            volume.error = f"disk usage of {volume.path} timed out after {self.SAMPLE_TIMEOUT:.0f}s"
+            logger.warning(f"Disk monitor: {volume.error}")
+            return
+        except OSError as e:
+            volume.error = str(e)
+            logger.warning(f"Disk monitor failed to read {volume.path}: {e}")
+            return
+
+        now = time.monotonic()
+        elapsed = now - volume.sampled_at if volume.sampled_at else 0.0
+        if elapsed > 0:
+            rate = max(volume.written, volume.free - usage.free, 0) / elapsed
+            volume.write_rate += self.RATE_SMOOTHING * (rate - volume.write_rate)
+        volume.written = 0
+        volume.total, volume.free, volume.sampled_at, volume.error = usage.total, usage.free, now, None
+        DISK_FREE_BYTES.set(volume.free, disk=volume.disk)
+        DISK_WRITE_RATE.set(volume.write_rate, disk=volume.disk)
+        self._update_state(volume)
+
+    def _update_state(self, volume: VolumeState):
+        if not volume.sampled_at:
+            return
+        seconds = volume.seconds_until(self.threshold)
+        if volume.free < self.threshold:
+            state = "full"
+        elif seconds is not None and seconds < self.guard_seconds:
+            state = "low"
+        else:
+            state = "ok"
+        if state == volume.state:
+            return
+        volume.state = state
+        log = logger.info if state == "ok" else logger.warning
+        log(f"Disk space {state}: {self.describe(volume)}")
+        EventBus.get_instance().emit(DiskSpaceChanged(volume.disk, state, volume.free, seconds))
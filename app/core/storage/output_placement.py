@@ -0,0 +1,104 @@
+import itertools
+import os
+import time
+from collections import defaultdict
+
+from ...utils.logger import logger
+from .disk_monitor import DiskMonitor, VolumeState
+
+PLACEMENT_POLICIES = ("round_robin", "least_loaded", "most_free")
+DEFAULT_PLACEMENT_POLICY = "most_free"
+
+
+def is_within(path: str, root: str) -> bool:
+    path, root = os.path.abspath(path), os.path.abspath(root)
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
+def parse_output_roots(primary: str, extra: str | list | None) -> list[str]:
+    """The primary save path followed by the extra roots (a list or one path per line), without duplicates."""
+    if isinstance(extra, str):
+        extra = extra.splitlines()
+    roots = []
+    for root in [primary, *(extra or [])]:
+        root = (root or "").strip()
+        if root and not any(os.path.abspath(root) == os.path.abspath(known) for known in roots):
+            roots.append(root)
+    return roots
+
+
+def root_for(path: str, roots: list[str]) -> str | None:
+    """The innermost of ``roots`` containing ``path``."""
+    matches = [root for root in roots if is_within(path, root)]
+    return max(matches, key=lambda root: len(os.path.abspath(root))) if matches else None
+
+
+class OutputPlacement:
+    """
+    Chooses the output root of each new recording among the roots whose volume has room, see
+    ``DiskMonitor.has_room``:
+
+    - ``round_robin`` takes the roots in turn;
+    - ``least_loaded`` takes the volume with the lowest measured write rate;
+    - ``most_free`` takes the volume with the most free space left after ``SPACE_HORIZON`` seconds at its
+      expected write rate.
+
+    Recordings placed since a volume was last sampled do not show in its write rate yet, so each of them
+    counts as ``RECORDING_RATE_ESTIMATE`` for both policies; otherwise a burst of streams going live would
+    land on one disk.
+    """
+
+    RECORDING_RATE_ESTIMATE = 1024 ** 2
+    SPACE_HORIZON = 3600
+
+    def __init__(self, disk_monitor: DiskMonitor, policy: str = DEFAULT_PLACEMENT_POLICY):
+        self.disk_monitor = disk_monitor
+        self.policy = policy
+        self._turn = itertools.count()
+        self._placed: dict[str, list[float]] = defaultdict(list)
+
+    def configure(self, policy: str):
+        if policy not in PLACEMENT_POLICIES:
+            logger.warning(f"Unknown output placement policy: {policy}, using {DEFAULT_PLACEMENT_POLICY}")
+            policy = DEFAULT_PLACEMENT_POLICY
+        self.policy = policy
+
+    def choose(self, roots: list[str]) -> str | None:
+        """Pick the root for a recording that is about to start, None when every volume is low on space."""
+        candidates = [root for root in roots if self.disk_monitor.has_room(root)]
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            root = candidates[0]
+        elif self.policy == "round_robin":
+            root = candidates[next(self._turn) % len(candidates)]
+        elif self.policy == "least_loaded":
+            root = min(candidates, key=self.expected_write_rate)
+        else:
+            root = max(candidates, key=self.free_space)
+        self._placed[root].append(time.monotonic())
+        return root
+
+    def _volume(self, root: str) -> VolumeState | None:
+        volume = self.disk_monitor.volume_for(root)
+        return volume if volume is not None and volume.sampled_at else None
+
+    def _unmeasured(self, volume: VolumeState) -> int:
+        count = 0
+        for root, placed in self._placed.items():
+            if self.disk_monitor.volume_for(root) is volume:
+                placed[:] = [placed_at for placed_at in placed if placed_at > volume.sampled_at]
+                count += len(placed)
+        return count
+
+    def expected_write_rate(self, root: str) -> float:
+        volume = self._volume(root)
+        if volume is None:
+            return 0.0
+        return volume.write_rate + self._unmeasured(volume) * self.RECORDING_RATE_ESTIMATE
+
+    def free_space(self, root: str) -> float:
+        volume = self._volume(root)
+        if volume is None:
+            return 0.0
+        return volume.free - self.expected_write_rate(root) * self.SPACE_HORIZON
@@ -0,0 +1,609 @@
+import asyncio
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from ...utils import utils
+from ...utils.logger import logger
+from ..events.events import DiskSpaceChanged, OutputFinalized, OutputMigrated
+from ..metrics.metrics import RETENTION_DELETED_BYTES, RETENTION_INDEXED_BYTES
+from .disk_monitor import GB, DiskMonitor, VolumeState
+from .output_placement import is_within, root_for
+from .tiering import MEDIA_EXTENSIONS, StorageTiering
+
+INDEX_FILE = "retention_index.json"
+REPORT_FILE = "retention_report.json"
+SEGMENT_SUFFIX = re.compile(r"_\d{3}$")
+TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}")
+DATE_FOLDER = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# (platform key, streamer name, recording directory) of a recording, used to attribute files found on disk.
+RecordingOwner = tuple[str | None, str | None, str | None]
+
+
+def session_of(path: str) -> str:
+    """Files of one recorder run share their name up to the segment number, on either storage tier."""
+    return SEGMENT_SUFFIX.sub("", os.path.splitext(os.path.basename(path))[0])
+
+
+def guessed_owner(path: str, roots: list[str]) -> str | None:
+    """
+    The recorder a file that matches no recording came from: its file name without the start time and segment
+    number (streamer name and title), else the folders it sits in below its storage root without date folders.
+    """
+    name = TIMESTAMP.sub("", session_of(path)).strip("_")
+    if name:
+        return name.lower()
+    root = root_for(path, roots)
+    if root is None:
+        return None
+    relative = os.path.relpath(os.path.dirname(os.path.abspath(path)), os.path.abspath(root))
+    folders = [folder for folder in relative.split(os.sep) if folder not in ("", ".") and not DATE_FOLDER.match(folder)]
+    return "/".join(folders).lower() or None
+
+
+def recording_owners(recordings: list) -> list[RecordingOwner]:
+    from ..platforms.platform_handlers import get_platform_info
+
+    owners = []
+    for recording in recordings:
+        platform_key = recording.platform_key or get_platform_info(recording.url)[1]
+        owners.append((platform_key, recording.streamer_name, recording.recording_dir))
+    return owners
+
+
+@dataclass
+class IndexedFile:
+    path: str
+    size: int
+    mtime: float
+    platform: str | None = None
+    streamer: str | None = None
+
+
+@dataclass
+class RetentionRule:
+    """
+    One line of the ``retention_rules`` setting: ``<scope>: <limits>``.
+
+    The scope is ``*``, a platform key (``douyin``), ``<platform>/<streamer>`` or ``*/<streamer>``. The limits are
+    ``days=N`` (delete files older than N days), ``sessions=N`` (keep the last N recorder runs of each streamer),
+    ``max_gb=N`` (keep the newest files up to N GB in total) and ``protect`` (never deleted to free space).
+    """
+
+    platform: str | None = None
+    streamer: str | None = None
+    days: float | None = None
+    sessions: int | None = None
+    max_bytes: float | None = None
+    protect: bool = False
+    text: str = ""
+
+    @property
+    def specificity(self) -> tuple[bool, bool]:
+        return self.streamer is not None, self.platform is not None
+
+    def matches(self, entry: IndexedFile) -> bool:
+        if self.platform is not None and self.platform != (entry.platform or "").lower():
+            return False
+        return self.streamer is None or self.streamer == (entry.streamer or "").lower()
+
+
+def parse_retention_rules(text: str | None) -> list[RetentionRule]:
+    rules = []
+    for line in (text or "").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        scope, _, limits = line.rpartition(":")
+        if not scope.strip():
+            logger.warning(f"Ignoring retention rule without a scope: {line}")
+            continue
+        platform, _, streamer = scope.strip().lower().partition("/")
+        rule = RetentionRule(
+            platform=None if platform.strip() in ("", "*") else platform.strip(),
+            streamer=streamer.strip() or None,
+            text=line,
+        )
+        try:
+            for limit in limits.replace(",", " ").split():
+                key, _, value = limit.partition("=")
+                if key == "days":
+                    rule.days = float(value)
+                elif key == "sessions":
+                    rule.sessions = int(value)
+                elif key == "max_gb":
+                    rule.max_bytes = float(value) * GB
+                elif key == "protect":
+                    rule.protect = True
+                else:
+                    raise ValueError(f"unknown limit {key}")
+        except ValueError as e:
+            logger.warning(f"Ignoring retention rule {line}: {e}")
+            continue
+        rules.append(rule)
+    return rules
+
+
+@dataclass
+class DirectoryState:
+    mtime_ns: int
+    subdirs: list[str] = field(default_factory=list)
+
+
+class RecordingIndex:
+    """
+    The media files below the storage roots. A refresh only lists the directories whose modification time
+    changed (files were added, removed or renamed) and re-reads the files that were still being written, so
+    a pass over a large, mostly unchanged library costs one ``stat`` per directory.
+    """
+
+    SETTLE_SECONDS = 3600
+
+    def __init__(self):
+        self.files: dict[str, IndexedFile] = {}
+        self.dirs: dict[str, DirectoryState] = {}
+        self._unsettled: set[str] = set()
+
+    def load(self, path: str):
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            self.dirs = {key: DirectoryState(*value) for key, value in data.get("dirs", {}).items()}
+            self.files = {key: IndexedFile(key, *value) for key, value in data.get("files", {}).items()}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Rebuilding the recording index, {path} could not be read: {e}")
+            self.files, self.dirs = {}, {}
+        cutoff = time.time() - self.SETTLE_SECONDS
+        self._unsettled = {path for path, entry in self.files.items() if entry.mtime > cutoff}
+
+    def save(self, path: str):
+        data = {
+            "dirs": {key: [state.mtime_ns, state.subdirs] for key, state in self.dirs.items()},
+            "files": {
+                key: [entry.size, entry.mtime, entry.platform, entry.streamer] for key, entry in self.files.items()
+            },
+        }
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def refresh(self, roots: list[str], owners: list[RecordingOwner]) -> bool:
+        """Bring the index up to date with the file system; returns whether anything changed."""
+        changed = False
+        seen = set()
+        stack = [os.path.abspath(root) for root in roots]
+        while stack:
+            directory = stack.pop()
+            if directory in seen:
+                continue
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            seen.add(directory)
+            state = self.dirs.get(directory)
+            if state is None or state.mtime_ns != mtime_ns:
+                state = self._scan(directory, mtime_ns, owners)
+                changed = True
+            stack.extend(state.subdirs)
+
+        for directory in [directory for directory in self.dirs if directory not in seen]:
+            del self.dirs[directory]
+            changed = True
+        for path in [path for path in self.files if os.path.dirname(path) not in seen]:
+            self._forget(path)
+            changed = True
+        return self._restat_unsettled() or changed
+
+    def _scan(self, directory: str, mtime_ns: int, owners: list[RecordingOwner]) -> DirectoryState:
+        state = self.dirs[directory] = DirectoryState(mtime_ns)
+        present = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        state.subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(MEDIA_EXTENSIONS):
+                        present.add(entry.path)
+                        stat = entry.stat()
+                        self._update(entry.path, stat.st_size, stat.st_mtime, owners)
+        except OSError as e:
+            logger.warning(f"Failed to list {directory}: {e}")
+            return state
+        for path in [path for path in self.files if os.path.dirname(path) == directory and path not in present]:
+            self._forget(path)
+        return state
+
+    def _update(self, path: str, size: int, mtime: float, owners: list[RecordingOwner]):
+        entry = self.files.get(path)
+        if entry is None:
+            entry = self.files[path] = IndexedFile(path, size, mtime, *self.attribute(path, owners))
+        entry.size, entry.mtime = size, mtime
+        if mtime > time.time() - self.SETTLE_SECONDS:
+            self._unsettled.add(path)
+
+    def _restat_unsettled(self) -> bool:
+        changed = False
+        cutoff = time.time() - self.SETTLE_SECONDS
+        for path in list(self._unsettled):
+            entry = self.files.get(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if entry is None or stat is None:
+                self._forget(path)
+                changed = True
+                continue
+            if (stat.st_size, stat.st_mtime) != (entry.size, entry.mtime):
+                entry.size, entry.mtime = stat.st_size, stat.st_mtime
+                changed = True
+            if entry.mtime <= cutoff:
+                self._unsettled.discard(path)
+        return changed
+
+    def _forget(self, path: str):
+        self.files.pop(path, None)
+        self._unsettled.discard(path)
+
+    def note(self, path: str, platform: str | None, streamer: str | None):
+        """Attribute a file the recorder reported, which may not have been indexed yet."""
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        entry = self.files.get(path)
+        if entry is None:
+            entry = self.files[path] = IndexedFile(path, stat.st_size, stat.st_mtime)
+        entry.size, entry.mtime, entry.platform, entry.streamer = stat.st_size, stat.st_mtime, platform, streamer
+        self._unsettled.add(path)
+
+    def move(self, source: str, destination: str):
+        entry = self.files.pop(os.path.abspath(source), None)
+        self._unsettled.discard(os.path.abspath(source))
+        if entry is not None:
+            entry.path = os.path.abspath(destination)
+            self.files[entry.path] = entry
+
+    @staticmethod
+    def attribute(path: str, owners: list[RecordingOwner]) -> tuple[str | None, str | None]:
+        """
+        The recording a file found on disk belongs to: the one whose recording folder holds it, else the one
+        whose streamer name starts the file name or names one of its folders.
+        """
+        in_folder = [owner for owner in owners if owner[2] and is_within(path, owner[2])]
+        if in_folder:
+            platform, streamer, _ = max(in_folder, key=lambda owner: len(owner[2]))
+            return platform, streamer
+        name = os.path.basename(path)
+        folders = set(os.path.dirname(path).split(os.sep))
+        best = None
+        for platform, streamer, _ in owners:
+            cleaned = (utils.clean_name(streamer) or "").replace(" ", "_")
+            if cleaned and (name.startswith(cleaned + "_") or cleaned in folders):
+                if best is None or len(cleaned) > len(best[2]):
+                    best = (platform, streamer, cleaned)
+        return (best[0], best[1]) if best else (None, None)
+
+
+@dataclass
+class PlannedDeletion:
+    entry: IndexedFile
+    reason: str
+
+
+class RetentionEngine:
+    """
+    Deletes old recordings from the storage roots according to the retention rules, and frees space on a
+    volume before it would run low enough to disable recording: when its free space drops below the disk
+    monitor's threshold plus twice the space the guard window needs at the current write rate, the oldest
+    recordings on it (except protected ones) are deleted. Files waiting for storage tiering are left alone.
+
+    A full pass runs every ``interval`` seconds and the space check at the disk monitor's cadence. In dry-run
+    mode nothing is deleted; every pass writes what it did or would delete to ``retention_report.json``.
+    Only files that have not been written for an hour are ever deleted.
+    """
+
+    DEFAULT_INTERVAL = 1800.0
+    RECLAIM_HEADROOM = 2.0
+    RECLAIM_MARGIN = GB
+
+    def __init__(self, disk_monitor: DiskMonitor, storage_tiering: StorageTiering):
+        self.disk_monitor = disk_monitor
+        self.storage_tiering = storage_tiering
+        self.index = RecordingIndex()
+        self.enabled = False
+        self.dry_run = True
+        self.reclaim = True
+        self.interval = self.DEFAULT_INTERVAL
+        self.rules: list[RetentionRule] = []
+        self.roots: list[str] = []
+        self.index_path: str | None = None
+        self.report_path: str | None = None
+        self.owners: Callable[[], list[RecordingOwner]] = list
+        self._noted: dict[str, tuple[str | None, str | None]] = {}
+        self._moved: list[tuple[str, str]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._loaded = False
+        self._next_full_pass = 0.0
+        self._short_of_space: set[str] = set()
+
+    def configure(
+            self, enabled: bool, dry_run: bool, rules: str | None, reclaim: bool, interval: float, roots: list[str]
+    ):
+        self.enabled = enabled
+        self.dry_run = dry_run
+        self.reclaim = reclaim
+        self.interval = max(60.0, interval)
+        self.rules = parse_retention_rules(rules)
+        self.roots = list(roots)
+        # The new rules apply from the next scheduled full pass, reconfiguring never deletes anything by itself.
+        if self.index_path is not None:
+            self._ensure_worker()
+
+    def start(self, config_path: str, owners: Callable[[], list[RecordingOwner]]):
+        """Run in the process that owns the storage roots, see ``RecordingManager.start_retention``."""
+        self.index_path = os.path.join(config_path, INDEX_FILE)
+        self.report_path = os.path.join(config_path, REPORT_FILE)
+        self.owners = owners
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def on_event(self, event):
+        if isinstance(event, OutputFinalized):
+            self._noted[event.path] = (event.recording.platform_key, event.recording.streamer_name)
+        elif isinstance(event, OutputMigrated):
+            self._moved.append((event.source, event.destination))
+        elif isinstance(event, DiskSpaceChanged) and event.state != "ok":
+            self._wakeup.set()
+
+    async def _run(self):
+        logger.info(f"Retention started{' in dry-run mode' if self.dry_run else ''} with {len(self.rules)} rules")
+        while self.enabled:
+            self._wakeup.clear()
+            full_pass = time.monotonic() >= self._next_full_pass
+            try:
+                await self.run_once(full_pass)
+            except Exception as e:
+                logger.error(f"Retention pass failed: {e}")
+            if full_pass:
+                self._next_full_pass = time.monotonic() + self.interval
+            timeout = min(self.interval, self.disk_monitor.interval)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        logger.info("Retention stopped")
+
+    async def run_once(self, full_pass: bool = True) -> list[PlannedDeletion]:
+        volumes = [await self.disk_monitor.watch(root) for root in self.roots]
+        if not full_pass and not any(self.bytes_to_reclaim(volume) for volume in volumes):
+            return []
+        owners = self.owners()
+        noted, self._noted = self._noted, {}
+        moved, self._moved = self._moved, []
+        planned, indexed_bytes = await asyncio.to_thread(self._refresh_and_plan, owners, noted, moved, full_pass)
+        RETENTION_INDEXED_BYTES.set(indexed_bytes)
+        if full_pass or planned:
+            await asyncio.to_thread(self._write_report, self.report(planned, self.dry_run))
+        if not planned:
+            return planned
+
+        total = sum(item.entry.size for item in planned)
+        if self.dry_run:
+            logger.info(
+                f"Retention dry run: would delete {len(planned)} recordings ({total / GB:.2f} GB), "
+                f"see {self.report_path}"
+            )
+            return planned
+        deleted = await asyncio.to_thread(self._delete, planned)
+        deleted_bytes = sum(entry.size for entry in deleted)
+        RETENTION_DELETED_BYTES.inc(deleted_bytes)
+        logger.info(f"Retention deleted {len(deleted)} recordings ({deleted_bytes / GB:.2f} GB)")
+        for volume in {volume.disk: volume for volume in volumes}.values():
+            await self.disk_monitor.refresh(volume.path)
+        return planned
+
+    def _refresh_and_plan(
+            self, owners, noted, moved, full_pass: bool, persist: bool = True
+    ) -> tuple[list[PlannedDeletion], int]:
+        if not self._loaded and self.index_path:
+            self.index.load(self.index_path)
+            self._loaded = True
+        for source, destination in moved:
+            self.index.move(source, destination)
+        for path, (platform, streamer) in noted.items():
+            self.index.note(path, platform, streamer)
+        if self.index.refresh(self.roots, owners) or noted or moved:
+            if self.index_path and persist:
+                self.index.save(self.index_path)
+
+        planned = self.plan_rules() if full_pass else []
+        if self.reclaim:
+            planned += self.plan_reclaim(planned)
+        return planned, sum(entry.size for entry in self.index.files.values())
+
+    def _eligible(self) -> list[IndexedFile]:
+        cutoff = time.time() - RecordingIndex.SETTLE_SECONDS
+        return [entry for entry in self.index.files.values() if entry.mtime <= cutoff]
+
+    def rule_for(self, entry: IndexedFile) -> RetentionRule | None:
+        matching = [rule for rule in self.rules if rule.matches(entry)]
+        return max(matching, key=lambda rule: rule.specificity) if matching else None
+
+    def owner_of(self, entry: IndexedFile) -> tuple | None:
+        """
+        What ``sessions`` and ``max_gb`` group a file by. Files that match no recording are grouped by the name
+        their recorder gave them, and left to the ``days`` limit when even that is unknown.
+        """
+        if entry.platform is not None or entry.streamer is not None:
+            return entry.platform, entry.streamer
+        guess = guessed_owner(entry.path, self.roots)
+        return (None, guess) if guess else None
+
+    def plan_rules(self) -> list[PlannedDeletion]:
+        now = time.time()
+        covered: dict[int, list[IndexedFile]] = defaultdict(list)
+        for entry in self.index.files.values():
+            rule = self.rule_for(entry)
+            if rule is not None:
+                covered[id(rule)].append(entry)
+
+        eligible = {entry.path for entry in self._eligible()}
+        planned: dict[str, PlannedDeletion] = {}
+        for rule in self.rules:
+            entries = sorted(covered.get(id(rule), []), key=lambda entry: entry.mtime, reverse=True)
+            if rule.days is not None:
+                for entry in entries:
+                    if entry.mtime < now - rule.days * 86400:
+                        planned.setdefault(entry.path, PlannedDeletion(entry, f"older than {rule.days:g} days"))
+            if rule.sessions is not None:
+                sessions: dict[tuple, list[str]] = defaultdict(list)
+                for entry in entries:
+                    owner = self.owner_of(entry)
+                    if owner is None:
+                        continue
+                    sessions_of_streamer = sessions[owner]
+                    if session_of(entry.path) not in sessions_of_streamer:
+                        sessions_of_streamer.append(session_of(entry.path))
+                    if sessions_of_streamer.index(session_of(entry.path)) >= rule.sessions:
+                        reason = f"beyond the last {rule.sessions} sessions"
+                        planned.setdefault(entry.path, PlannedDeletion(entry, reason))
+            if rule.max_bytes is not None:
+                kept = 0
+                for entry in entries:
+                    if entry.path in planned or self.owner_of(entry) is None:
+                        continue
+                    kept += entry.size
+                    if kept > rule.max_bytes:
+                        reason = f"over {rule.max_bytes / GB:g} GB"
+                        planned[entry.path] = PlannedDeletion(entry, reason)
+        return [item for path, item in planned.items() if path in eligible]
+
+    def bytes_to_reclaim(self, volume: VolumeState) -> float:
+        if not volume.sampled_at:
+            return 0.0
+        headroom = volume.write_rate * self.disk_monitor.guard_seconds * self.RECLAIM_HEADROOM
+        return max(0.0, self.disk_monitor.threshold + headroom + self.RECLAIM_MARGIN - volume.free)
+
+    def plan_reclaim(self, already_planned: list[PlannedDeletion]) -> list[PlannedDeletion]:
+        needed = {}
+        for root in self.roots:
+            volume = self.disk_monitor.volume_for(root)
+            if volume is not None and self.bytes_to_reclaim(volume):
+                needed[volume.disk] = self.bytes_to_reclaim(volume)
+        if not needed:
+            return []
+        for item in already_planned:
+            volume = self.disk_monitor.volume_for(item.entry.path)
+            if volume is not None and volume.disk in needed:
+                needed[volume.disk] -= item.entry.size
+
+        planned = []
+        skip = {item.entry.path for item in already_planned}
+        for entry in sorted(self._eligible(), key=lambda entry: entry.mtime):
+            volume = self.disk_monitor.volume_for(entry.path)
+            if volume is None or needed.get(volume.disk, 0) <= 0 or entry.path in skip:
+                continue
+            if self._kept_for_space(entry, volume):
+                continue
+            planned.append(PlannedDeletion(entry, f"freeing space on {volume.disk}"))
+            needed[volume.disk] -= entry.size
+        unmet = {disk for disk, size in needed.items() if size > 0}
+        if unmet - self._short_of_space:
+            logger.warning(f"Retention cannot free enough space on {', '.join(unmet)}, the remaining files are kept")
+        self._short_of_space = unmet
+        return planned
+
+    def _kept_for_space(self, entry: IndexedFile, volume: VolumeState) -> bool:
+        rule = self.rule_for(entry)
+        if rule is not None and rule.protect:
+            return True
+        tiering = self.storage_tiering
+        if tiering.enabled and tiering.destination_for(entry.path) is not None:
+            # Moving it to cold storage frees the space without losing it.
+            cold_volume = self.disk_monitor.volume_for(tiering.cold_root)
+            return cold_volume is not None and cold_volume.disk != volume.disk
+        return False
+
+    def _delete(self, planned: list[PlannedDeletion]) -> list[IndexedFile]:
+        deleted = []
+        for item in planned:
+            path = item.entry.path
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Retention failed to delete {path}: {e}")
+                continue
+            logger.info(f"Retention deleted {path}: {item.reason}")
+            deleted.append(item.entry)
+            self.index.files.pop(path, None)
+            self._remove_empty_dirs(os.path.dirname(path))
+        if deleted and self.index_path:
+            self.index.save(self.index_path)
+        return deleted
+
+    def _remove_empty_dirs(self, directory: str):
+        root = root_for(directory, self.roots)
+        while root is not None and os.path.abspath(directory) != os.path.abspath(root):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+            directory = os.path.dirname(directory)
+
+    async def dry_run_report(self, config_path: str, owners: Callable[[], list[RecordingOwner]]) -> dict:
+        """
+        What a full pass would delete now, also while retention is off; see ``main.py --retention-report``.
+        Reads the saved index to skip unchanged directories but writes nothing.
+        """
+        self.index_path = os.path.join(config_path, INDEX_FILE)
+        for root in self.roots:
+            await self.disk_monitor.watch(root)
+        planned, _ = await asyncio.to_thread(self._refresh_and_plan, owners(), {}, [], True, False)
+        return self.report(planned, dry_run=True)
+
+    def _write_report(self, report: dict):
+        if not self.report_path:
+            return
+        try:
+            with open(self.report_path, "w", encoding="utf-8") as file:
+                json.dump(report, file, ensure_ascii=False, indent=4)
+        except OSError as e:
+            logger.warning(f"Failed to write the retention report: {e}")
+
+    def report(self, planned: list[PlannedDeletion], dry_run: bool) -> dict:
+        return {
+            "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "dry_run": dry_run,
+            "rules": [rule.text for rule in self.rules],
+            "indexed_files": len(self.index.files),
+            "indexed_bytes": sum(entry.size for entry in self.index.files.values()),
+            "deletions": [
+                {
+                    "path": item.entry.path,
+                    "size": item.entry.size,
+                    "modified": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(item.entry.mtime)),
+                    "platform": item.entry.platform,
+                    "streamer": item.entry.streamer,
+                    "reason": item.reason,
+                }
+                for item in planned
+            ],
+            "total_bytes": sum(item.entry.size for item in planned),
+        }
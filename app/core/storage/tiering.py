@@ -0,0 +1,363 @@
+import asyncio
+import errno
+import hashlib
+import os
+import shutil
+import threading
+import time
+
+from ...utils.logger import logger
+from ..events.event_bus import EventBus
+from ..events.events import OutputMigrated
+from ..metrics.metrics import QUEUE_DEPTH, STORAGE_MIGRATED_BYTES, STORAGE_MIGRATIONS
+from .disk_monitor import DiskMonitor
+from .output_placement import is_within, root_for
+
+MEDIA_EXTENSIONS = (".ts", ".flv", ".mkv", ".mp4", ".mov", ".nut", ".mp3", ".m4a", ".wav", ".aac", ".wma")
+PART_SUFFIX = ".part"
+
+# A kernel copy primitive that fails with one of these is not supported for this pair of files, use the next one.
+UNSUPPORTED_COPY_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    getattr(errno, "ENOTSOCK", errno.EINVAL),
+}
+
+
+class MigrationAbortedError(Exception):
+    pass
+
+
+class BandwidthThrottle:
+    """Sleeps in the copying thread so the average rate since the start stays below ``rate`` bytes per second."""
+
+    def __init__(self, rate: float, stop: threading.Event):
+        self.rate = rate
+        self.stop = stop
+        self.started = time.monotonic()
+        self.consumed = 0
+
+    def consume(self, size: int):
+        self.consumed += size
+        if self.rate > 0:
+            ahead = self.consumed / self.rate - (time.monotonic() - self.started)
+            if ahead > 0 and self.stop.wait(ahead):
+                raise MigrationAbortedError
+
+
+def _copy_chunk(method: str, src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    if method == "copy_file_range":
+        return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+    if method == "sendfile":
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+        return os.sendfile(dst_fd, src_fd, offset, count)
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    data = os.read(src_fd, count)
+    os.write(dst_fd, data)
+    return len(data)
+
+
+def copy_file(src_fd: int, dst_fd: int, size: int, chunk_size: int, throttle: BandwidthThrottle):
+    """
+    Copy ``size`` bytes in chunks, in the kernel where possible: ``copy_file_range`` (which may share extents on
+    the same file system), then ``sendfile``, then plain reads and writes.
+    """
+    methods = [method for method in ("copy_file_range", "sendfile") if hasattr(os, method)] + ["read"]
+    offset = 0
+    while offset < size:
+        if throttle.stop.is_set():
+            raise MigrationAbortedError
+        try:
+            copied = _copy_chunk(methods[0], src_fd, dst_fd, offset, min(chunk_size, size - offset))
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_COPY_ERRNOS or len(methods) == 1:
+                raise
+            methods.pop(0)
+            continue
+        if copied == 0:
+            raise OSError(f"source ended after {offset} of {size} bytes")
+        offset += copied
+        throttle.consume(copied)
+
+
+def file_digest(fd: int, chunk_size: int, throttle: BandwidthThrottle | None = None) -> str:
+    digest = hashlib.blake2b()
+    offset = 0
+    while True:
+        data = os.pread(fd, chunk_size, offset) if hasattr(os, "pread") else _read_at(fd, chunk_size, offset)
+        if not data:
+            return digest.hexdigest()
+        digest.update(data)
+        offset += len(data)
+        if throttle is not None:
+            throttle.consume(len(data))
+
+
+def _read_at(fd: int, count: int, offset: int) -> bytes:
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, count)
+
+
+class StorageTiering:
+    """
+    Moves finished recordings from the hot output roots to the cold root, keeping their path relative to the
+    root. A file is queued when the recorder reports it final (``OutputFinalized``, after the MP4 conversion)
+    and moved ``delay`` seconds later, which leaves custom scripts time to process it. Files left behind by
+    earlier runs are picked up by a sweep when the service starts.
+
+    Files are copied one at a time in a worker thread into a ``.part`` file created exclusively (so engine
+    workers sharing the roots never copy the same file twice). The copy is read back from the cold volume and
+    compared by checksum with the source before it replaces the destination and the source is removed; a
+    file that changed meanwhile is left in place and tried again later. ``bandwidth`` (bytes per second)
+    limits both the copy and the read back.
+    """
+
+    CHUNK_SIZE = 8 * 1024 ** 2
+    SWEEP_MIN_AGE = 3600
+    STALE_PART_SECONDS = 3600
+    RETRY_SECONDS = 600
+
+    def __init__(self, disk_monitor: DiskMonitor):
+        self.disk_monitor = disk_monitor
+        self.enabled = False
+        self.hot_roots: list[str] = []
+        self.cold_root: str | None = None
+        self.delay = 600.0
+        self.bandwidth = 0.0
+        self.verify = True
+        self._queue: dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+        self._stop = threading.Event()
+        self._started = False
+        self._task: asyncio.Task | None = None
+        self._cold_full = False
+
+    def configure(
+            self,
+            enabled: bool,
+            hot_roots: list[str],
+            cold_root: str | None,
+            delay_seconds: float,
+            bandwidth_mb: float,
+            verify: bool,
+    ):
+        cold_root = os.path.abspath(cold_root) if cold_root else None
+        if enabled and cold_root is None:
+            logger.warning("Storage tiering needs a cold storage path, leaving it disabled")
+        self.enabled = enabled and cold_root is not None
+        hot_roots = [os.path.abspath(root) for root in hot_roots]
+        self.hot_roots = [root for root in hot_roots if cold_root is None or not is_within(cold_root, root)]
+        if self.enabled and len(self.hot_roots) < len(hot_roots):
+            logger.warning(f"Storage tiering skips the recording paths containing the cold storage path {cold_root}")
+        self.cold_root = cold_root
+        self.delay = max(0.0, delay_seconds)
+        self.bandwidth = max(0.0, bandwidth_mb) * 1024 ** 2
+        self.verify = verify
+        self._wakeup.set()
+        if self._started:
+            self._ensure_worker()
+
+    def start(self):
+        """Start migrating in the engine process, with a first sweep of the hot roots."""
+        self._started = True
+        self._ensure_worker()
+
+    def stop(self):
+        """Abort the running copy, keeping its source; called on shutdown so a throttled copy never holds up exit."""
+        self._stop.set()
+        self._wakeup.set()
+
+    def _ensure_worker(self):
+        if self.enabled and (self._task is None or self._task.done()):
+            self._stop.clear()
+            self._task = asyncio.create_task(self._run())
+
+    def destination_for(self, path: str) -> str | None:
+        """Where ``path`` goes on the cold root, None when it is not below a hot root."""
+        if self.cold_root is None or is_within(path, self.cold_root):
+            return None
+        root = root_for(path, self.hot_roots)
+        if root is None:
+            return None
+        return os.path.join(self.cold_root, os.path.relpath(os.path.abspath(path), root))
+
+    def locate(self, path: str) -> str:
+        """The current location of a recording that may have been migrated since ``path`` was listed."""
+        if os.path.exists(path):
+            return path
+        destination = self.destination_for(path)
+        return destination if destination and os.path.exists(destination) else path
+
+    def schedule(self, path: str, delay: float | None = None):
+        if not self.enabled or self.destination_for(path) is None:
+            return
+        path = os.path.abspath(path)
+        due = time.monotonic() + (self.delay if delay is None else delay)
+        self._queue[path] = min(due, self._queue.get(path, due))
+        QUEUE_DEPTH.set(len(self._queue), queue="storage_tiering")
+        self._wakeup.set()
+
+    async def sweep(self) -> int:
+        """Queue the media files of the hot roots that have not been touched for a while."""
+        min_age = max(self.delay, self.SWEEP_MIN_AGE)
+        paths = await asyncio.to_thread(self._find_idle_files, list(self.hot_roots), min_age)
+        for path in paths:
+            self.schedule(path, 0)
+        if paths:
+            logger.info(f"Storage tiering: {len(paths)} earlier recordings queued for {self.cold_root}")
+        return len(paths)
+
+    def _find_idle_files(self, roots: list[str], min_age: float) -> list[str]:
+        cutoff = time.time() - min_age
+        paths = []
+        for root in roots:
+            for directory, dirnames, filenames in os.walk(root):
+                if self.cold_root is not None and is_within(directory, self.cold_root):
+                    dirnames.clear()
+                    continue
+                for name in filenames:
+                    if not name.lower().endswith(MEDIA_EXTENSIONS):
+                        continue
+                    path = os.path.join(directory, name)
+                    try:
+                        if os.path.getmtime(path) < cutoff:
+                            paths.append(path)
+                    except OSError:
+                        continue
+        return paths
+
+    async def _run(self):
+        logger.info(f"Storage tiering to {self.cold_root} started")
+        try:
+            await self.sweep()
+        except Exception as e:
+            logger.error(f"Storage tiering sweep failed: {e}")
+        while self.enabled and not self._stop.is_set():
+            self._wakeup.clear()
+            now = time.monotonic()
+            if not self._queue or min(self._queue.values()) > now:
+                timeout = min(self._queue.values()) - now if self._queue else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            path = min(self._queue, key=self._queue.get)
+            del self._queue[path]
+            QUEUE_DEPTH.set(len(self._queue), queue="storage_tiering")
+            try:
+                await self._process(path)
+            except Exception as e:
+                logger.error(f"Storage tiering failed on {path}: {e}")
+        logger.info("Storage tiering stopped")
+
+    async def _process(self, path: str):
+        destination = self.destination_for(path)
+        if destination is None:
+            return
+        await self.disk_monitor.watch(self.cold_root)
+        if not self.disk_monitor.has_room(self.cold_root):
+            if not self._cold_full:
+                logger.warning(f"Storage tiering paused, the cold storage {self.cold_root} is low on space")
+            self._cold_full = True
+            self.schedule(path, self.disk_monitor.interval)
+            return
+        self._cold_full = False
+
+        started = time.monotonic()
+        result, size = await asyncio.to_thread(self._migrate, path, destination)
+        STORAGE_MIGRATIONS.inc(result=result)
+        if result == "migrated":
+            self.disk_monitor.add_written(self.cold_root, size)
+            STORAGE_MIGRATED_BYTES.inc(size)
+            elapsed = time.monotonic() - started
+            logger.info(f"Migrated {path} to {destination} ({size / 1024 ** 2:.1f} MB in {elapsed:.1f}s)")
+            EventBus.get_instance().emit(OutputMigrated(path, destination, size))
+        elif result == "busy":
+            self.schedule(path, max(self.delay, 60.0))
+        elif result == "failed":
+            self.schedule(path, self.RETRY_SECONDS)
+
+    def _claim(self, part: str) -> int:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            return os.open(part, flags, 0o644)
+        except FileExistsError:
+            # Left behind by a run that stopped mid-copy; an active copy keeps touching it.
+            if time.time() - os.path.getmtime(part) < self.STALE_PART_SECONDS:
+                raise
+            os.remove(part)
+            return os.open(part, flags, 0o644)
+
+    def _migrate(self, source: str, destination: str) -> tuple[str, int]:
+        """Runs in a worker thread. Returns the result (migrated, gone, busy, conflict, failed or aborted) and size."""
+        try:
+            before = os.stat(source)
+        except FileNotFoundError:
+            return "gone", 0
+        if time.time() - before.st_mtime < self.delay:
+            return "busy", 0
+        if os.path.exists(destination):
+            logger.warning(f"Not migrating {source}, {destination} already exists")
+            return "conflict", 0
+
+        part = destination + PART_SUFFIX
+        try:
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            dst_fd = self._claim(part)
+        except FileExistsError:
+            return "busy", 0
+        except OSError as e:
+            logger.error(f"Failed to create {part}: {e}")
+            return "failed", 0
+
+        result = "failed"
+        try:
+            throttle = BandwidthThrottle(self.bandwidth, self._stop)
+            src_fd = os.open(source, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                copy_file(src_fd, dst_fd, before.st_size, self.CHUNK_SIZE, throttle)
+                os.fsync(dst_fd)
+                if self.verify:
+                    if hasattr(os, "posix_fadvise"):
+                        # Verify what reached the cold volume rather than the page cache.
+                        os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    dst_fd_read = os.open(part, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                    try:
+                        expected = file_digest(src_fd, self.CHUNK_SIZE)
+                        actual = file_digest(dst_fd_read, self.CHUNK_SIZE, throttle)
+                    finally:
+                        os.close(dst_fd_read)
+                    if actual != expected:
+                        logger.error(f"Checksum mismatch after copying {source} to {part}")
+                        return result, 0
+            finally:
+                os.close(src_fd)
+            os.close(dst_fd)
+            dst_fd = None
+
+            after = os.stat(source)
+            if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+                result = "busy"
+                return result, 0
+            # Keep the modification time, age based clean-up of the cold root relies on it.
+            shutil.copystat(source, part)
+            os.replace(part, destination)
+            result = "migrated"
+        except MigrationAbortedError:
+            result = "aborted"
+            return result, 0
+        except OSError as e:
+            logger.error(f"Failed to copy {source} to {part}: {e}")
+            return result, 0
+        finally:
+            if dst_fd is not None:
+                os.close(dst_fd)
+            if result != "migrated" and os.path.exists(part):
+                os.remove(part)
+
+        try:
+            os.remove(source)
+        except OSError as e:
+            logger.warning(f"Migrated {source} but could not remove it: {e}")
+        return result, before.st_size
@@ -0,0 +1,12 @@
+from .app import HeadlessApp, print_retention_report, run_headless
+from .page import HeadlessPage, HeadlessPubSub
+from .settings import HeadlessSettings
+
+__all__ = [
+    "HeadlessApp",
+    "HeadlessPage",
+    "HeadlessPubSub",
+    "HeadlessSettings",
+    "print_retention_report",
+    "run_headless",
+]
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import os
+import signal
+import time
+
+from .. import execute_dir
+from ..core.config.config_manager import ConfigManager
+from ..core.config.language_manager import LanguageManager
+from ..core.events.event_bus import EventBus
+from ..core.events.events import RecordingEvent, SegmentClosed
+from ..core.metrics.profiler import start_loop_profiler
+from ..core.metrics.server import start_metrics_server
+from ..core.platforms.platform_handlers import preload_platform_modules
+from ..core.recording.record_manager import RecordingManager
+from ..core.runtime.node_sidecar import apply_node_sidecar_settings
+from ..core.runtime.process_manager import AsyncProcessManager
+from ..core.storage.retention import recording_owners
+from ..models.recording.recording_model import Recording
+from ..utils import utils
+from ..utils.logger import logger
+from .page import HeadlessPage
+from .settings import HeadlessSettings
+
+
+class HeadlessSnackBar:
+    """Logs the messages the UI would show as snack bars."""
+
+    @staticmethod
+    async def show_snack_bar(message, *args, **kwargs):
+        logger.info(f"Notice: {message}")
+
+
+class HeadlessCardManager:
+    """Stands in for the recording card manager; logs status transitions instead of rendering cards."""
+
+    def __init__(self, app):
+        self.app = app
+        self.cards_obj = {}
+        self._last_status: dict[str, str] = {}
+        self.event_subscription = EventBus.get_instance().subscribe(
+            self.on_recording_event, RecordingEvent, name="headless_status",
+            coalesce=lambda event: (event.rec_id, isinstance(event, SegmentClosed))
+        )
+
+    async def on_recording_event(self, event: RecordingEvent):
+        if isinstance(event, SegmentClosed):
+            logger.info(f"Segment closed: {event.path} ({event.size} bytes)")
+            return
+        await self.update_card(event.recording)
+
+    async def update_card(self, recording: Recording):
+        status = recording.status_info
+        if status and self._last_status.get(recording.rec_id) != status:
+            self._last_status[recording.rec_id] = status
+            logger.info(f"Status: {recording.streamer_name} ({recording.url}) -> {status}")
+
+    async def remove_recording_card(self, recordings: list[Recording]):
+        for recording in recordings:
+            self._last_status.pop(recording.rec_id, None)
+
+
+class HeadlessApp:
+    """
+    Runs the monitoring and recording engine on a plain asyncio loop, without Flet.
+
+    It provides the attributes of ``App`` that the engine uses, backed by shims. Other components can
+    follow recording updates by subscribing to ``EventBus.get_instance()``.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.page = HeadlessPage(loop)
+        self.run_path = execute_dir
+        self.assets_dir = os.path.join(execute_dir, "assets")
+        self.process_manager = AsyncProcessManager()
+        self.config_manager = self.create_config_manager()
+        self.is_web_mode = False
+        self.is_mobile = False
+        self.auth_manager = None
+        self.current_username = None
+        self.current_page = None
+        self.recording_enabled = True
+        self.subprocess_start_up_info = utils.get_startup_info()
+
+        self.settings = HeadlessSettings(self)
+        self.engine_supervisor = self.create_engine_supervisor()
+        self.metrics_server = None
+        self.loop_profiler = None
+        self.language_manager = LanguageManager(self)
+        self.snack_bar = HeadlessSnackBar()
+        self.record_card_manager = HeadlessCardManager(self)
+        self.record_manager = RecordingManager(self)
+        self._stop_event = asyncio.Event()
+
+    def create_config_manager(self) -> ConfigManager:
+        return ConfigManager(self.run_path)
+
+    def create_engine_supervisor(self):
+        from ..cluster.supervisor import EngineSupervisor
+
+        return EngineSupervisor.from_config(self)
+
+    def add_ffmpeg_process(self, process):
+        self.process_manager.add_process(process)
+
+    async def start_periodic_tasks(self):
+        """Start all periodic tasks; without recording cards the first live check pass runs right away."""
+        self.metrics_server = await start_metrics_server(self)
+        self.loop_profiler = start_loop_profiler(self)
+        apply_node_sidecar_settings(self)
+        self.record_manager.start_retention()
+        if self.engine_supervisor:
+            await self.engine_supervisor.start()
+            return
+        await self.record_manager.setup_periodic_live_check(
+            int(self.record_manager.loop_time_seconds or 180), check_on_start=True
+        )
+
+    def request_shutdown(self):
+        logger.info("Shutdown requested")
+        self._stop_event.set()
+
+    def _install_signal_handlers(self):
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self.page.loop.add_signal_handler(sig, self.request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops do not support signal handlers, Ctrl+C raises KeyboardInterrupt instead.
+                pass
+
+    async def run(self):
+        from ..scripts import ffmpeg_install, node_install
+        ffmpeg_install.update_env_path()
+        node_install.update_env_path()
+        if not await ffmpeg_install.check_ffmpeg_installed():
+            logger.warning("FFmpeg was not found, recordings will fail until it is installed")
+
+        self._install_signal_handlers()
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(preload_platform_modules)
+        except ImportError as e:
+            logger.error(f"Failed to load platform modules: {e}")
+        logger.info(f"Headless engine ready in {time.perf_counter() - started:.1f}s, "
+                    f"monitoring {len(self.record_manager.recordings)} recordings")
+
+        await self.start_periodic_tasks()
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self):
+        """Stop all recorders and wait for FFmpeg to finalize the output files."""
+        self.recording_enabled = False
+        self.record_manager.storage_tiering.stop()
+        if self.engine_supervisor:
+            await self.engine_supervisor.stop()
+        active_recorders = list(self.record_manager.active_recorders.values())
+        for recorder in active_recorders:
+            recorder.request_stop()
+        if active_recorders:
+            logger.info(f"Stopping {len(active_recorders)} active recordings")
+        try:
+            await self.process_manager.cleanup()
+        except Exception as e:
+            logger.error(f"Error during cleanup: {e}")
+        await self.record_manager.persist_recordings()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        if self.loop_profiler:
+            self.loop_profiler.stop()
+        logger.info("Headless engine stopped")
+
+
+async def _serve():
+    app = HeadlessApp(asyncio.get_running_loop())
+    await app.run()
+
+
+def run_headless():
+    """Entry point of ``main.py --headless``."""
+    logger.info("Starting StreamCap in headless mode")
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        logger.info("Interrupted, exiting")
+
+
+def print_retention_report() -> bool:
+    """Entry point of ``main.py --retention-report``; prints what the retention rules would delete now as JSON."""
+
+    async def build_report() -> dict:
+        app = HeadlessApp(asyncio.get_running_loop())
+        record_manager = app.record_manager
+        return await record_manager.retention.dry_run_report(
+            app.config_manager.config_path, lambda: recording_owners(record_manager.recordings)
+        )
+
+    print(json.dumps(asyncio.run(build_report()), ensure_ascii=False, indent=2))
+    return True
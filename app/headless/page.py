@@ -0,0 +1,80 @@
+import asyncio
+import inspect
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from ..utils.logger import logger
+
+
+class HeadlessPubSub:
+    """
+    In-process replacement for Flet's page pubsub. Handlers are called as ``handler(topic, message)``;
+    coroutine handlers are scheduled on the event loop.
+    """
+
+    def __init__(self, page: "HeadlessPage"):
+        self.page = page
+        self._topic_subscribers: dict[str, list[Callable]] = defaultdict(list)
+
+    def subscribe_topic(self, topic: str, handler: Callable):
+        if handler not in self._topic_subscribers[topic]:
+            self._topic_subscribers[topic].append(handler)
+
+    def unsubscribe_topic(self, topic: str):
+        self._topic_subscribers.pop(topic, None)
+
+    def unsubscribe_all(self):
+        self._topic_subscribers.clear()
+
+    def send_all_on_topic(self, topic: str, message):
+        for handler in list(self._topic_subscribers.get(topic, ())):
+            if inspect.iscoroutinefunction(handler):
+                self.page.run_task(handler, topic, message)
+                continue
+            try:
+                handler(topic, message)
+            except Exception as e:
+                logger.error(f"Pubsub handler for topic {topic} failed: {e}")
+
+    def send_others_on_topic(self, topic: str, message):
+        # There is no sending session in headless mode, every subscriber is an "other".
+        self.send_all_on_topic(topic, message)
+
+
+class HeadlessWindow:
+    minimized = False
+    visible = True
+
+
+class HeadlessPage:
+    """
+    The subset of ``flet.Page`` the recording engine relies on, backed by a plain asyncio loop.
+    """
+
+    web = True
+    route = "/"
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.window = HeadlessWindow()
+        self.pubsub = HeadlessPubSub(self)
+
+    def run_task(self, handler: Callable, *args, **kwargs) -> Future:
+        if not inspect.iscoroutinefunction(handler):
+            raise TypeError(f"handler must be a coroutine function, got {handler!r}")
+        future = asyncio.run_coroutine_threadsafe(handler(*args, **kwargs), self.loop)
+        future.add_done_callback(self._log_task_error)
+        return future
+
+    @staticmethod
+    def _log_task_error(future: Future):
+        if not future.cancelled() and future.exception() is not None:
+            error = future.exception()
+            logger.error(f"Background task failed: {type(error).__name__}: {error}")
+
+    def launch_url(self, url: str, *args, **kwargs):
+        logger.info(f"Headless mode, not opening: {url}")
+
+    def update(self, *controls):
+        pass
@@ -0,0 +1,57 @@
+import os
+
+from ..core.storage.output_placement import parse_output_roots
+
+
+class HeadlessSettings:
+    """
+    Read-only settings provider for headless mode, exposing the same config accessors the recording engine
+    uses on ``SettingsPage``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.config_manager = app.config_manager
+        self.user_config = self.config_manager.load_user_config()
+        self.language_option = self.config_manager.load_language_config()
+        self.default_config = self.config_manager.load_default_config()
+        self.cookies_config = self.config_manager.load_cookies_config()
+        self.accounts_config = self.config_manager.load_accounts_config()
+        self.language_code = None
+        self.default_language = None
+        self.load_language()
+
+    def load_language(self):
+        self.default_language, default_language_code = list(self.language_option.items())[0]
+        select_language = self.user_config.get("language")
+        self.language_code = self.language_option.get(select_language, default_language_code)
+        self.app.language_code = self.language_code
+
+    def get_config_value(self, key, default=None):
+        return self.user_config.get(key, self.default_config.get(key, default))
+
+    def get_cookies_value(self, key, default=""):
+        return self.cookies_config.get(key, default)
+
+    def get_accounts_value(self, key, default=None):
+        k1, k2 = key.split("_", maxsplit=1)
+        return self.accounts_config.get(k1, {}).get(k2, default)
+
+    def get_video_save_path(self):
+        live_save_path = self.get_config_value("live_save_path")
+        if not live_save_path:
+            live_save_path = os.path.join(self.app.run_path, 'downloads')
+        return live_save_path
+
+    def get_output_roots(self):
+        return parse_output_roots(self.get_video_save_path(), self.get_config_value("extra_save_paths"))
+
+    def get_storage_roots(self):
+        roots = self.get_output_roots()
+        cold_save_path = self.get_config_value("cold_save_path")
+        if self.get_config_value("storage_tiering_enabled") and cold_save_path:
+            roots = parse_output_roots(roots[0], [*roots[1:], cold_save_path])
+        return roots
+
+    async def is_changed(self):
+        pass
@@ -43,6 +43,12 @@ async def handle_app_close(page: ft.Page, app, save_progress_overlay) -> None:
         await app.config_manager.save_user_config(app.settings.user_config)
         logger.info(f"Saved last route: {page.route}")
 
+        if app.loop_profiler:
+            app.loop_profiler.stop()
+        app.record_manager.storage_tiering.stop()
+        if app.engine_supervisor:
+            await app.engine_supervisor.stop()
+
         # check if there are active recordings
         active_recordings = [p for p in app.process_manager.ffmpeg_processes if p.returncode is None]
         active_recordings_count = len(active_recordings)
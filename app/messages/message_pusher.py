@@ -1,14 +1,17 @@
 import asyncio
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from ..core.metrics.metrics import NOTIFICATIONS, QUEUE_DEPTH
 from ..models.recording.recording_model import Recording
-from ..ui.views.settings_view import SettingsPage
 from ..utils.logger import logger
 from .notification_service import NotificationService
 
+if TYPE_CHECKING:
+    from ..ui.views.settings_view import SettingsPage
+
 
 class MessagePusher:
-    def __init__(self, settings: SettingsPage):
+    def __init__(self, settings: "SettingsPage"):
         self.settings = settings
         self.notifier = NotificationService()
 
@@ -36,7 +39,7 @@ class MessagePusher:
 
     @staticmethod
     def should_push_message(
-            settings: SettingsPage,
+            settings: "SettingsPage",
             recording: Recording,
             check_manually_stopped: bool = False,
             message_type: Optional[str] = None
@@ -79,6 +82,7 @@ class MessagePusher:
 
     @staticmethod
     def log_push_result(service_name: str, result: dict) -> None:
+        NOTIFICATIONS.inc(service=service_name, result="success" if result.get("success") else "error")
         if result.get("success"):
             logger.info(f"Push {service_name} message successfully: {result['success']}")
         if result.get("error") or (not result.get("success") and not result.get("error")):
@@ -94,6 +98,10 @@ class MessagePusher:
 
     async def push_messages(self, msg_title: str, push_content: str) -> None:
         """Push messages to all enabled notification services"""
+        with QUEUE_DEPTH.track_in_progress(queue="notifications"):
+            await self._push_messages(msg_title, push_content)
+
+    async def _push_messages(self, msg_title: str, push_content: str) -> None:
         if self.settings.user_config.get("dingtalk_enabled"):
             result = await self.notifier.send_to_dingtalk(
                 url=self.settings.user_config.get("dingtalk_webhook_url"),
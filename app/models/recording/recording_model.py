@@ -1,7 +1,10 @@
+from collections import defaultdict
 from datetime import timedelta
 
 
 class Recording:
+    _field_listeners: dict[str, list[callable]] = defaultdict(list)
+
     def __init__(
         self,
         rec_id,
@@ -79,10 +82,40 @@ class Recording:
         self.status_info = None
         self.live_title = None
         self.detection_time = None
+        self.last_live_at = None  # Unix time this room was last seen live, persisted to order startup checks
         self.loop_time_seconds = None
         self.use_proxy = None
         self.record_url = None
         self.preview_url = None
+        self._initialized = True
+
+    def __setattr__(self, name, value):
+        listeners = Recording._field_listeners.get(name)
+        if not listeners or not self.__dict__.get("_initialized"):
+            object.__setattr__(self, name, value)
+            return
+
+        old_value = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        if old_value != value:
+            for listener in listeners:
+                listener(self, name)
+
+    @classmethod
+    def add_change_listener(cls, listener: callable, fields: tuple[str, ...]):
+        """
+        Register a callback invoked as ``listener(recording, field)`` whenever one of the given fields
+        changes value on an initialized recording.
+        """
+        for field in fields:
+            if listener not in cls._field_listeners[field]:
+                cls._field_listeners[field].append(listener)
+
+    @classmethod
+    def remove_change_listener(cls, listener: callable):
+        for listeners in cls._field_listeners.values():
+            if listener in listeners:
+                listeners.remove(listener)
 
     def to_dict(self):
         """Convert the Recording instance to a dictionary for saving."""
@@ -103,7 +136,8 @@ class Recording:
             "platform": self.platform,
             "platform_key": self.platform_key,
             "only_notify_no_record": self.only_notify_no_record,
-            "flv_use_direct_download": self.flv_use_direct_download
+            "flv_use_direct_download": self.flv_use_direct_download,
+            "last_live_at": self.last_live_at
         }
 
     @classmethod
@@ -131,6 +165,7 @@ class Recording:
         recording.last_duration_str = data.get("last_duration")
         recording.platform = data.get("platform")
         recording.platform_key = data.get("platform_key")
+        recording.last_live_at = data.get("last_live_at")
         if recording.last_duration_str is not None:
             recording.last_duration = timedelta(seconds=float(recording.last_duration_str))
         return recording
@@ -8,6 +8,7 @@ class CardStateType(Enum):
     OFFLINE = "offline"
     STOPPED = "stopped"
     CHECKING = "checking"
+    STALE = "stale"
     UNKNOWN = "unknown"
 
 
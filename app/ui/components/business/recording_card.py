@@ -3,6 +3,8 @@ import os.path
 
 import flet as ft
 
+from ....core.events.event_bus import EventBus
+from ....core.events.events import RecordingEvent
 from ....models.recording.recording_model import Recording
 from ....models.recording.recording_status_model import RecordingStatus
 from ....utils import utils
@@ -24,6 +26,9 @@ class RecordingCardManager:
         self._ = {}
         self.load()
         self.pubsub_subscribe()
+        self.event_subscription = EventBus.get_instance().subscribe(
+            self.on_recording_event, RecordingEvent, name="recording_cards", coalesce=lambda event: event.rec_id
+        )
 
     def load(self):
         language = self.app.language_manager.language
@@ -34,6 +39,10 @@ class RecordingCardManager:
         self.app.page.pubsub.subscribe_topic("update", self.subscribe_update_card)
         self.app.page.pubsub.subscribe_topic("delete", self.subscribe_remove_cards)
 
+    def close(self):
+        """Stop following engine events, e.g. when the web session disconnects."""
+        self.event_subscription.close()
+
     async def create_card(self, recording: Recording, subscribe_add_cards: bool = False):
         """Create a card for a given recording."""
         rec_id = recording.rec_id
@@ -41,7 +50,7 @@ class RecordingCardManager:
             check_live_on_browser_refresh = self.app.settings.user_config.get("check_live_on_browser_refresh", True)
             if self.app.recording_enabled and not subscribe_add_cards:
                 if check_live_on_browser_refresh or recording.streamer_name == self._['live_room']:
-                    self.app.page.run_task(self.app.record_manager.check_if_live, recording)
+                    self.app.record_manager.schedule_live_check(recording)
             
         card_data = self._create_card_components(recording)
         self.cards_obj[rec_id] = card_data
@@ -526,5 +535,9 @@ class RecordingCardManager:
     async def subscribe_update_card(self, _, recording: Recording):
         await self.update_card(recording)
 
+    async def on_recording_event(self, event: RecordingEvent):
+        # Only the latest event per recording is queued, the card always renders the current state.
+        await self.update_card(event.recording)
+
     async def subscribe_remove_cards(self, _, recordings: list[Recording]):
         await self.remove_recording_card(recordings)
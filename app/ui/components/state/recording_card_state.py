@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import flet as ft
 
 from ....models.recording.recording_model import Recording
@@ -8,6 +10,21 @@ class RecordingCardState:
     
     ERROR_STATUSES = [RecordingStatus.RECORDING_ERROR, RecordingStatus.LIVE_STATUS_CHECK_ERROR]
     
+    @staticmethod
+    def shows_restored_status(recording: Recording) -> bool:
+        """
+        Whether the card shows the last known status restored from disk: the room has not been checked since
+        startup and was seen live before. It is display-only, ``is_live`` stays False until the first check.
+        """
+        return bool(
+            recording.status_info is None
+            and recording.last_live_at
+            and recording.monitor_status
+            and not recording.is_live
+            and not recording.is_recording
+            and not recording.is_checking
+        )
+
     @staticmethod
     def get_card_state(recording: Recording) -> CardStateType:
         if recording.is_recording:
@@ -18,6 +35,8 @@ class RecordingCardState:
             return CardStateType.CHECKING
         elif recording.is_live and recording.monitor_status and not recording.is_recording:
             return CardStateType.LIVE
+        elif RecordingCardState.shows_restored_status(recording):
+            return CardStateType.STALE
         elif (not recording.is_live and recording.monitor_status and
               recording.status_info != RecordingStatus.NOT_IN_SCHEDULED_CHECK):
             return CardStateType.OFFLINE
@@ -36,6 +55,7 @@ class RecordingCardState:
             CardStateType.OFFLINE: ft.Colors.AMBER,
             CardStateType.STOPPED: ft.Colors.GREY,
             CardStateType.CHECKING: ft.Colors.PURPLE,
+            CardStateType.STALE: ft.Colors.BLUE_GREY,
         }
         return color_map.get(state, ft.Colors.TRANSPARENT)
     
@@ -74,6 +94,11 @@ class RecordingCardState:
                 "bgcolor": ft.Colors.PURPLE,
                 "text_color": ft.Colors.WHITE,
             },
+            CardStateType.STALE: {
+                "text": language_dict.get("stale"),
+                "bgcolor": ft.Colors.BLUE_GREY,
+                "text_color": ft.Colors.WHITE,
+            },
         }
         
         return configs.get(state, {})
@@ -83,6 +108,9 @@ class RecordingCardState:
         status_prefix = ""
         if not recording.monitor_status:
             status_prefix = f"[{language_dict.get('monitor_stopped')}] "
+        if RecordingCardState.shows_restored_status(recording):
+            last_live_at = datetime.fromtimestamp(recording.last_live_at).strftime("%Y-%m-%d %H:%M")
+            return f"{recording.title} ({language_dict.get('last_live_at')} {last_live_at})"
         return f"{status_prefix}{recording.title}"
     
     @staticmethod
@@ -1,40 +1,28 @@
-from ...models.recording.recording_status_model import RecordingStatus
-from ..components.state.recording_card_state import RecordingCardState
+from ...core.recording import status_buckets
+from ...core.recording.status_buckets import RecordingStatusBuckets
 
 
 class RecordingFilters:
 
     @staticmethod
     def _is_error_status(recording) -> bool:
-        return recording.status_info in RecordingCardState.ERROR_STATUSES
+        return status_buckets.is_error_status(recording)
     
     @staticmethod
     def _is_live_status(recording) -> bool:
-        return (recording.is_live 
-                and recording.monitor_status 
-                and not recording.is_recording
-                and recording.status_info not in RecordingCardState.ERROR_STATUSES
-                and recording.status_info != RecordingStatus.NOT_IN_SCHEDULED_CHECK)
+        return status_buckets.is_live_status(recording)
     
     @staticmethod
     def _is_offline_status(recording) -> bool:
-        return (not recording.is_live
-                and recording.monitor_status
-                and recording.status_info not in RecordingCardState.ERROR_STATUSES
-                and recording.status_info != RecordingStatus.NOT_IN_SCHEDULED_CHECK)
+        return status_buckets.is_offline_status(recording)
     
     @staticmethod
     def _is_stopped_status(recording) -> bool:
-        return (not recording.monitor_status
-                or recording.status_info == RecordingStatus.NOT_IN_SCHEDULED_CHECK)
+        return status_buckets.is_stopped_status(recording)
 
     STATUS_FILTER_MAP = {
         "all": lambda rec: True,
-        "recording": lambda rec: rec.is_recording,
-        "living": lambda rec: RecordingFilters._is_live_status(rec),
-        "error": lambda rec: RecordingFilters._is_error_status(rec),
-        "offline": lambda rec: RecordingFilters._is_offline_status(rec),
-        "stopped": lambda rec: RecordingFilters._is_stopped_status(rec)
+        **RecordingStatusBuckets.BUCKETS,
     }
 
     @classmethod
@@ -51,3 +39,8 @@ class RecordingFilters:
         status_visible = cls.get_status_filter_result(recording, filter_type)
         platform_visible = cls.get_platform_filter_result(recording, platform_filter)
         return status_visible and platform_visible
+
+    @staticmethod
+    def get_visible_ids(buckets: RecordingStatusBuckets, filter_type: str, platform_filter: str) -> set[str]:
+        """Resolve a status/platform filter combination from the precomputed buckets."""
+        return buckets.matching_ids(filter_type, platform_filter)
@@ -345,8 +345,9 @@ class HomePage(PageBase):
         )
 
     def create_stats_area(self):
-        total_recordings = len(self.app.record_manager.recordings)
-        active_recordings = len([r for r in self.app.record_manager.recordings if r.is_recording])
+        status_buckets = self.app.record_manager.status_buckets
+        total_recordings = status_buckets.total
+        active_recordings = status_buckets.count("recording")
 
         stopped_recordings = total_recordings - active_recordings
 
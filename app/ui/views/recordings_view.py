@@ -27,6 +27,8 @@ class RecordingsPage(PageBase):
         self.current_filter = "all"
         self.current_platform_filter = "all"
         self.platform_buttons = {}
+        self.filter_buttons = {}
+        self.filter_counts_pending = False
         self.init()
 
     def load_language(self):
@@ -64,6 +66,7 @@ class RecordingsPage(PageBase):
         )
         self.add_recording_dialog = RecordingDialog(self.app, self.add_recording)
         self.pubsub_subscribe()
+        self.app.record_manager.status_buckets.add_listener(self.on_status_buckets_changed)
 
     async def load(self):
         """Load the recordings page content."""
@@ -93,6 +96,10 @@ class RecordingsPage(PageBase):
         self.app.page.pubsub.subscribe_topic('add', self.subscribe_add_cards)
         self.app.page.pubsub.subscribe_topic('delete_all', self.subscribe_del_all_cards)
 
+    def close(self):
+        """Stop following status bucket changes, e.g. when the web session disconnects."""
+        self.app.record_manager.status_buckets.remove_listener(self.on_status_buckets_changed)
+
     async def toggle_view_mode(self, _):
         self.is_grid_view = not self.is_grid_view
         current_content = self.recording_card_area.content
@@ -195,10 +202,10 @@ class RecordingsPage(PageBase):
     def create_filter_area(self):
         """Create the filter area"""
 
-        filter_buttons = [
-            ft.Text(self._["status_filter"] + ":" if not self.app.is_mobile else self._["filter"] + ":", size=14),
-            ft.ElevatedButton(
-                self._["filter_all"],
+        counts = self.app.record_manager.status_buckets.counts()
+        self.filter_buttons = {
+            "all": ft.ElevatedButton(
+                self.get_filter_label("all", counts),
                 on_click=self.filter_all_on_click,
                 bgcolor=ft.Colors.BLUE if self.current_filter == "all" else None,
                 color=ft.Colors.WHITE if self.current_filter == "all" else None,
@@ -206,8 +213,8 @@ class RecordingsPage(PageBase):
                     shape=ft.RoundedRectangleBorder(radius=5),
                 ),
             ),
-            ft.ElevatedButton(
-                self._["filter_recording"],
+            "recording": ft.ElevatedButton(
+                self.get_filter_label("recording", counts),
                 on_click=self.filter_recording_on_click,
                 bgcolor=ft.Colors.GREEN if self.current_filter == "recording" else None,
                 color=ft.Colors.WHITE if self.current_filter == "recording" else None,
@@ -215,8 +222,8 @@ class RecordingsPage(PageBase):
                     shape=ft.RoundedRectangleBorder(radius=5),
                 ),
             ),
-            ft.ElevatedButton(
-                self._["filter_living"],
+            "living": ft.ElevatedButton(
+                self.get_filter_label("living", counts),
                 on_click=self.filter_living_on_click,
                 bgcolor=ft.Colors.BLUE if self.current_filter == "living" else None,
                 color=ft.Colors.WHITE if self.current_filter == "living" else None,
@@ -224,8 +231,8 @@ class RecordingsPage(PageBase):
                     shape=ft.RoundedRectangleBorder(radius=5),
                 ),
             ),
-            ft.ElevatedButton(
-                self._["filter_offline"],
+            "offline": ft.ElevatedButton(
+                self.get_filter_label("offline", counts),
                 on_click=self.filter_offline_on_click,
                 bgcolor=ft.Colors.AMBER if self.current_filter == "offline" else None,
                 color=ft.Colors.WHITE if self.current_filter == "offline" else None,
@@ -233,8 +240,8 @@ class RecordingsPage(PageBase):
                     shape=ft.RoundedRectangleBorder(radius=5),
                 ),
             ),
-            ft.ElevatedButton(
-                self._["filter_error"],
+            "error": ft.ElevatedButton(
+                self.get_filter_label("error", counts),
                 on_click=self.filter_error_on_click,
                 bgcolor=ft.Colors.RED if self.current_filter == "error" else None,
                 color=ft.Colors.WHITE if self.current_filter == "error" else None,
@@ -242,8 +249,8 @@ class RecordingsPage(PageBase):
                     shape=ft.RoundedRectangleBorder(radius=5),
                 ),
             ),
-            ft.ElevatedButton(
-                self._["filter_stopped"],
+            "stopped": ft.ElevatedButton(
+                self.get_filter_label("stopped", counts),
                 on_click=self.filter_stopped_on_click,
                 bgcolor=ft.Colors.GREY if self.current_filter == "stopped" else None,
                 color=ft.Colors.WHITE if self.current_filter == "stopped" else None,
@@ -251,12 +258,13 @@ class RecordingsPage(PageBase):
                     shape=ft.RoundedRectangleBorder(radius=5),
                 ),
             ),
+        }
+        filter_buttons = [
+            ft.Text(self._["status_filter"] + ":" if not self.app.is_mobile else self._["filter"] + ":", size=14),
+            *self.filter_buttons.values(),
         ]
         
-        platforms = {}
-        for recording in self.app.record_manager.recordings:
-            if recording.platform and recording.platform_key:
-                platforms[recording.platform_key] = recording.platform
+        platforms = self.app.record_manager.status_buckets.platforms()
         
         platform_options = [
             ft.dropdown.Option(key="all", text=self._["filter_all"])
@@ -330,6 +338,27 @@ class RecordingsPage(PageBase):
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             )
     
+    def get_filter_label(self, filter_type: str, counts: dict[str, int]) -> str:
+        return f"{self._['filter_' + filter_type]} ({counts.get(filter_type, 0)})"
+
+    def on_status_buckets_changed(self):
+        """Schedule one refresh of the filter counts, however many recordings change before it runs."""
+        if self.filter_counts_pending:
+            return
+        self.filter_counts_pending = True
+        self.page.run_task(self.refresh_filter_counts)
+
+    async def refresh_filter_counts(self):
+        self.filter_counts_pending = False
+        if self.app.current_page != self:
+            return
+        counts = self.app.record_manager.status_buckets.counts()
+        for filter_type, button in self.filter_buttons.items():
+            label = self.get_filter_label(filter_type, counts)
+            if button.text != label and button.page:
+                button.text = label
+                button.update()
+
     async def filter_all_on_click(self, _):
         self.current_filter = "all"
         await self.apply_filter()
@@ -361,18 +390,14 @@ class RecordingsPage(PageBase):
             self.content_area.controls.append(self.create_filter_area())
         
         cards_obj = self.app.record_card_manager.cards_obj
-        recordings = self.app.record_manager.recordings
-        
-        for recording in recordings:
-            card_info = cards_obj.get(recording.rec_id)
-            if not card_info:
-                continue
-            
-            status_visible = RecordingFilters.get_status_filter_result(recording, self.current_filter)
-            platform_visible = RecordingFilters.get_platform_filter_result(recording, self.current_platform_filter)
-            
-            visible = status_visible and platform_visible
-            card_info["card"].visible = visible
+        visible_ids = RecordingFilters.get_visible_ids(
+            self.app.record_manager.status_buckets, self.current_filter, self.current_platform_filter
+        )
+
+        for rec_id, card_info in cards_obj.items():
+            visible = rec_id in visible_ids
+            if card_info["card"].visible != visible:
+                card_info["card"].visible = visible
         
         self.content_area.update()
         self.recording_card_area.update()
@@ -385,33 +410,26 @@ class RecordingsPage(PageBase):
                 card_info["card"].update()
 
     async def filter_recordings(self, query):
-        recordings = self.app.record_manager.recordings
         cards_obj = self.app.record_card_manager.cards_obj
 
         if not query.strip():
             await self.apply_filter()
             return {}
         else:
-            lower_query = query.strip().lower()
-            search_ids = {
-                rec.rec_id
-                for rec in recordings
-                if lower_query in str(rec.to_dict()).lower() or lower_query in rec.display_title
-            }
-            
-            filtered_ids = set()
-            
-            for rec_id in search_ids:
-                recording = self.app.record_manager.find_recording_by_id(rec_id)
-                if not recording:
-                    continue
-
-                if RecordingFilters.should_show_recording(self.current_filter, self.current_platform_filter, recording):
-                    filtered_ids.add(rec_id)
+            search_ids = self.app.record_manager.search_recordings(query.strip())
+            filtered_ids = search_ids & RecordingFilters.get_visible_ids(
+                self.app.record_manager.status_buckets, self.current_filter, self.current_platform_filter
+            )
 
+            changed = False
             for card_info in cards_obj.values():
-                card_info["card"].visible = card_info["card"].key in filtered_ids
-                card_info["card"].update()
+                visible = card_info["card"].key in filtered_ids
+                if card_info["card"].visible != visible:
+                    card_info["card"].visible = visible
+                    changed = True
+
+            if changed:
+                self.recording_card_area.update()
 
             if not filtered_ids:
                 await self.app.snack_bar.show_snack_bar(self._["not_search_result"], duration=2000)
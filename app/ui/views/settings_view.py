@@ -3,6 +3,10 @@ import os
 
 import flet as ft
 
+from ...core.metrics.profiler import apply_loop_profiler_settings
+from ...core.platforms.platform_handlers import PlatformHandler
+from ...core.runtime.node_sidecar import apply_node_sidecar_settings
+from ...core.storage.output_placement import DEFAULT_PLACEMENT_POLICY, PLACEMENT_POLICIES, parse_output_roots
 from ...models.media.audio_format_model import AudioFormat
 from ...models.media.video_format_model import VideoFormat
 from ...models.media.video_quality_model import VideoQuality
@@ -33,6 +37,9 @@ class SettingsPage(PageBase):
         self.tab_accounts = None
         self.tab_security = None
         self.has_unsaved_changes = {}
+        self.changed_credentials = set()
+        self.retention_changed = False
+        self.loop_profiler_changed = False
         self.delay_handler = DelayedTaskExecutor(self.app, self)
         self.load_language()
         self.init_unsaved_changes()
@@ -172,6 +179,39 @@ class SettingsPage(PageBase):
 
         if key == "loop_time_seconds":
             self.app.record_manager.initialize_dynamic_state()
+
+        if key in ["platform_rate_limit_per_second", "platform_rate_limit_burst"]:
+            self.app.record_manager.apply_rate_limit_settings()
+
+        if key == "startup_check_window_seconds":
+            self.app.record_manager.apply_warmup_settings()
+
+        if key == "node_sidecar":
+            apply_node_sidecar_settings(self.app)
+
+        if key in ["recording_space_threshold", "disk_full_guard_minutes", "disk_check_interval_seconds"]:
+            self.app.record_manager.apply_disk_monitor_settings()
+
+        if key == "output_placement_policy":
+            self.app.record_manager.apply_output_placement_settings()
+
+        if key in [
+            "storage_tiering_enabled", "cold_save_path", "tiering_delay_minutes", "tiering_bandwidth_limit",
+            "tiering_verify_checksum", "live_save_path", "extra_save_paths"
+        ]:
+            self.app.record_manager.apply_storage_tiering_settings()
+
+        if key in [
+            "retention_enabled", "retention_dry_run", "retention_rules", "retention_reclaim_space",
+            "retention_interval_minutes", "storage_tiering_enabled", "cold_save_path", "live_save_path",
+            "extra_save_paths"
+        ]:
+            # Applied once the edit settles, a half-typed rule must never drive a deletion pass.
+            self.retention_changed = True
+
+        if key in ["loop_profiler", "loop_profiler_threshold_ms"]:
+            self.loop_profiler_changed = True
+
         self.page.run_task(self.delay_handler.start_task_timer, self.save_user_config_after_delay, None)
         self.has_unsaved_changes['user_config'] = True
 
@@ -179,6 +219,7 @@ class SettingsPage(PageBase):
         """Handle changes in any input field and trigger auto-save."""
         key = e.control.data
         self.cookies_config[key] = e.data
+        self.changed_credentials.add(key)
         self.page.run_task(self.delay_handler.start_task_timer, self.save_cookies_after_delay, None)
         self.has_unsaved_changes['cookies_config'] = True
 
@@ -190,6 +231,7 @@ class SettingsPage(PageBase):
             self.accounts_config[k1] = {}
 
         self.accounts_config[k1][k2] = e.data
+        self.changed_credentials.add(k1)
         self.page.run_task(self.delay_handler.start_task_timer, self.save_accounts_after_delay, None)
         self.has_unsaved_changes['accounts_config'] = True
 
@@ -197,16 +239,36 @@ class SettingsPage(PageBase):
         await asyncio.sleep(delay)
         if self.has_unsaved_changes['user_config']:
             await self.config_manager.save_user_config(self.user_config)
+        self.apply_changed_retention_settings()
+        self.apply_changed_loop_profiler_settings()
 
     async def save_cookies_after_delay(self, delay):
         await asyncio.sleep(delay)
         if self.has_unsaved_changes['cookies_config']:
             await self.config_manager.save_cookies_config(self.cookies_config)
+            self.invalidate_changed_credentials()
 
     async def save_accounts_after_delay(self, delay):
         await asyncio.sleep(delay)
         if self.has_unsaved_changes['accounts_config']:
             await self.config_manager.save_accounts_config(self.accounts_config)
+            self.invalidate_changed_credentials()
+
+    def apply_changed_retention_settings(self):
+        if self.retention_changed:
+            self.retention_changed = False
+            self.app.record_manager.apply_retention_settings()
+
+    def apply_changed_loop_profiler_settings(self):
+        if self.loop_profiler_changed:
+            self.loop_profiler_changed = False
+            apply_loop_profiler_settings(self.app)
+
+    def invalidate_changed_credentials(self):
+        """Drop the cached handlers of the platforms whose cookies or account were edited, once saved."""
+        platform_keys, self.changed_credentials = self.changed_credentials, set()
+        for platform_key in platform_keys:
+            PlatformHandler.invalidate_instances(platform_key)
 
     def get_video_save_path(self):
         live_save_path = self.get_config_value("live_save_path")
@@ -214,6 +276,17 @@ class SettingsPage(PageBase):
             live_save_path = os.path.join(self.app.run_path, 'downloads')
         return live_save_path
 
+    def get_output_roots(self):
+        return parse_output_roots(self.get_video_save_path(), self.get_config_value("extra_save_paths"))
+
+    def get_storage_roots(self):
+        """The output roots followed by the cold storage root when storage tiering is on."""
+        roots = self.get_output_roots()
+        cold_save_path = self.get_config_value("cold_save_path")
+        if self.get_config_value("storage_tiering_enabled") and cold_save_path:
+            roots = parse_output_roots(roots[0], [*roots[1:], cold_save_path])
+        return roots
+
     @staticmethod
     def get_supported_record_format() -> list:
         return VideoFormat.get_formats() + AudioFormat.get_formats()
@@ -277,6 +350,123 @@ class SettingsPage(PageBase):
                                 data="live_save_path",
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["extra_save_paths"],
+                            ft.TextField(
+                                value=self.get_config_value("extra_save_paths"),
+                                width=300,
+                                multiline=True,
+                                min_lines=1,
+                                max_lines=4,
+                                on_change=self.on_change,
+                                data="extra_save_paths",
+                                hint_text=self._["extra_save_paths_hint"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["output_placement_policy"],
+                            ft.Dropdown(
+                                options=[ft.dropdown.Option(i, text=self._[i]) for i in PLACEMENT_POLICIES],
+                                value=self.get_config_value("output_placement_policy", DEFAULT_PLACEMENT_POLICY),
+                                width=200,
+                                data="output_placement_policy",
+                                on_change=self.on_change,
+                                tooltip=self._["output_placement_policy_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["storage_tiering"],
+                            ft.Switch(
+                                value=self.get_config_value("storage_tiering_enabled"),
+                                data="storage_tiering_enabled",
+                                on_change=self.on_change,
+                                tooltip=self._["storage_tiering_tip"],
+                            ),
+                        ),
+                        self.pick_folder(
+                            self._["cold_save_path"],
+                            ft.TextField(
+                                value=self.get_config_value("cold_save_path"),
+                                width=300,
+                                on_change=self.on_change,
+                                data="cold_save_path",
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["tiering_delay_minutes"],
+                            ft.TextField(
+                                value=self.get_config_value("tiering_delay_minutes"),
+                                width=100,
+                                data="tiering_delay_minutes",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["tiering_bandwidth_limit"],
+                            ft.TextField(
+                                value=self.get_config_value("tiering_bandwidth_limit"),
+                                width=100,
+                                data="tiering_bandwidth_limit",
+                                on_change=self.on_change,
+                                tooltip=self._["tiering_bandwidth_limit_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["tiering_verify_checksum"],
+                            ft.Switch(
+                                value=self.get_config_value("tiering_verify_checksum"),
+                                data="tiering_verify_checksum",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["retention_enabled"],
+                            ft.Switch(
+                                value=self.get_config_value("retention_enabled"),
+                                data="retention_enabled",
+                                on_change=self.on_change,
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["retention_dry_run"],
+                            ft.Switch(
+                                value=self.get_config_value("retention_dry_run"),
+                                data="retention_dry_run",
+                                on_change=self.on_change,
+                                tooltip=self._["retention_dry_run_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["retention_rules"],
+                            ft.TextField(
+                                value=self.get_config_value("retention_rules"),
+                                width=300,
+                                multiline=True,
+                                min_lines=1,
+                                max_lines=6,
+                                on_change=self.on_change,
+                                data="retention_rules",
+                                hint_text=self._["retention_rules_hint"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["retention_reclaim_space"],
+                            ft.Switch(
+                                value=self.get_config_value("retention_reclaim_space"),
+                                data="retention_reclaim_space",
+                                on_change=self.on_change,
+                                tooltip=self._["retention_reclaim_space_tip"],
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["retention_interval_minutes"],
+                            ft.TextField(
+                                value=self.get_config_value("retention_interval_minutes"),
+                                width=100,
+                                data="retention_interval_minutes",
+                                on_change=self.on_change,
+                            ),
+                        ),
                         self.create_setting_row(
                             self._["remove_emojis"],
                             ft.Switch(
@@ -470,6 +660,64 @@ class SettingsPage(PageBase):
                                 hint_text=self._["platform_max_concurrent_requests_tip"]
                             ),
                         ),
+                        self.create_setting_row(
+                            self._["platform_rate_limit_per_second"],
+                            ft.TextField(
+                                value=str(self.get_config_value("platform_rate_limit_per_second", 2)),
+                                width=100,
+                                data="platform_rate_limit_per_second",
+                                on_change=self.on_change,
+                                hint_text=self._["platform_rate_limit_per_second_tip"]
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["platform_rate_limit_burst"],
+                            ft.TextField(
+                                value=str(self.get_config_value("platform_rate_limit_burst", 10)),
+                                width=100,
+                                data="platform_rate_limit_burst",
+                                on_change=self.on_change,
+                                hint_text=self._["platform_rate_limit_burst_tip"]
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["startup_check_window_seconds"],
+                            ft.TextField(
+                                value=str(self.get_config_value("startup_check_window_seconds", 60)),
+                                width=100,
+                                data="startup_check_window_seconds",
+                                on_change=self.on_change,
+                                hint_text=self._["startup_check_window_seconds_tip"]
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["node_sidecar"],
+                            ft.Switch(
+                                value=self.get_config_value("node_sidecar", True),
+                                data="node_sidecar",
+                                on_change=self.on_change,
+                                tooltip=self._["node_sidecar_tip"]
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["loop_profiler"],
+                            ft.Switch(
+                                value=self.get_config_value("loop_profiler", False),
+                                data="loop_profiler",
+                                on_change=self.on_change,
+                                tooltip=self._["loop_profiler_tip"]
+                            ),
+                        ),
+                        self.create_setting_row(
+                            self._["loop_profiler_threshold_ms"],
+                            ft.TextField(
+                                value=str(self.get_config_value("loop_profiler_threshold_ms", 100)),
+                                width=100,
+                                data="loop_profiler_threshold_ms",
+                                on_change=self.on_change,
+                                hint_text=self._["loop_profiler_threshold_ms_tip"]
+                            ),
+                        ),
                         self.create_setting_row(
                             self._["check_live_on_browser_refresh"],
                             ft.Switch(
@@ -1307,6 +1555,9 @@ class SettingsPage(PageBase):
                 await save_method(config_value)
                 self.has_unsaved_changes[config_key] = False
                 show_snack_bar = True
+        self.invalidate_changed_credentials()
+        self.apply_changed_retention_settings()
+        self.apply_changed_loop_profiler_settings()
 
         if show_snack_bar:
             await self.app.snack_bar.show_snack_bar(
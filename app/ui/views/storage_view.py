@@ -5,6 +5,7 @@ from concurrent.futures import ThreadPoolExecutor
 import flet as ft
 from dotenv import find_dotenv, load_dotenv
 
+from ...core.storage.output_placement import root_for
 from ...utils.logger import logger
 from ..base_page import PageBase as BasePage
 
@@ -17,6 +18,7 @@ class StoragePage(BasePage):
     def __init__(self, app):
         super().__init__(app)
         self.page_name = "storage"
+        self.roots = []
         self.root_path = None
         self.current_path = None
         self.path_display = None
@@ -28,14 +30,19 @@ class StoragePage(BasePage):
         self.app.language_manager.add_observer(self)
 
     async def load(self):
-        self.root_path = self.app.settings.get_video_save_path()
+        self.roots = self.app.settings.get_storage_roots()
+        # With several recording paths (or a cold storage path) the top level (None) lists them like folders.
+        self.root_path = self.roots[0] if len(self.roots) == 1 else None
         self.current_path = self.root_path
         self.setup_ui()
         await self.update_file_list()
 
+    def get_display_path(self) -> str:
+        return self.current_path if self.current_path is not None else " | ".join(self.roots)
+
     def setup_ui(self):
         self.path_display = ft.Text(
-            self._["storage_path"] + ": " + self.current_path,
+            self._["storage_path"] + ": " + self.get_display_path(),
             size=14,
             color=ft.Colors.GREY_600,
             selectable=True,
@@ -52,7 +59,7 @@ class StoragePage(BasePage):
 
     async def update_file_list(self):
         try:
-            self.path_display.value = self._["current_path"] + ":" + self.current_path
+            self.path_display.value = self._["current_path"] + ":" + self.get_display_path()
             self.file_list.controls.clear()
 
             if self.current_path != self.root_path:
@@ -71,13 +78,18 @@ class StoragePage(BasePage):
                 else:
                     self.file_list.controls.append(back_button)
 
+            if self.current_path is None:
+                self.create_file_buttons([(root, True, root) for root in self.roots])
+                return
+
             exists, is_empty = await self.check_directory()
             if not exists or is_empty:
                 self.show_empty_folder_message()
                 self.file_list.update()
                 return
 
-            await self.create_file_buttons()
+            items = await asyncio.get_event_loop().run_in_executor(self.executor, self.list_directory)
+            self.create_file_buttons(items)
             
         except Exception as e:
             logger.error(f"Error updating file list: {e}")
@@ -97,20 +109,18 @@ class StoragePage(BasePage):
 
         return await asyncio.get_event_loop().run_in_executor(self.executor, _check)
 
-    async def create_file_buttons(self):
-        def _get_items():
-            try:
-                _items = []
-                with os.scandir(self.current_path) as it:
-                    for entry in it:
-                        _items.append((entry.name, entry.is_dir(), entry.path))
-                return sorted(_items, key=lambda x: (-x[1], x[0].lower()))
-            except Exception as e:
-                logger.error(f"Error listing directory: {e}")
-                return []
-
-        items = await asyncio.get_event_loop().run_in_executor(self.executor, _get_items)
-        
+    def list_directory(self):
+        try:
+            items = []
+            with os.scandir(self.current_path) as it:
+                for entry in it:
+                    items.append((entry.name, entry.is_dir(), entry.path))
+            return sorted(items, key=lambda x: (-x[1], x[0].lower()))
+        except Exception as e:
+            logger.error(f"Error listing directory: {e}")
+            return []
+
+    def create_file_buttons(self, items):
         buttons = []
         is_mobile = self.app.is_mobile
         for name, is_dir, full_path in items:
@@ -161,13 +171,16 @@ class StoragePage(BasePage):
 
     async def navigate_to(self, path):
         self.current_path = path
-        self.path_display.value = self._["current_path"] + ":" + self.current_path
+        self.path_display.value = self._["current_path"] + ":" + self.get_display_path()
         await self.update_file_list()
         self.content.update()
 
     async def navigate_to_parent(self):
-        self.current_path = os.path.dirname(self.current_path)
-        self.path_display.value = self._["current_path"] + ":" + self.current_path
+        if self.root_path is None and self.current_path in self.roots:
+            self.current_path = None
+        else:
+            self.current_path = os.path.dirname(self.current_path)
+        self.path_display.value = self._["current_path"] + ":" + self.get_display_path()
         await self.update_file_list()
         self.content.update()
 
@@ -184,10 +197,18 @@ class StoragePage(BasePage):
                 await self.app.snack_bar.show_snack_bar(self._["video_api_server_not_set"])
                 return
 
-            relative_path = os.path.relpath(file_path, self.root_path)
+            # The file may have moved to cold storage since the folder was listed.
+            file_path = self.app.record_manager.storage_tiering.locate(file_path)
+            roots = self.app.settings.get_storage_roots()
+            root = root_for(file_path, roots) or roots[0]
+            relative_path = os.path.relpath(file_path, root)
             filename = urllib.parse.quote(os.path.basename(file_path))
             subfolder = urllib.parse.quote(os.path.dirname(relative_path).replace("\\", "/"))
             api_url = f"{VIDEO_API_EXTERNAL_URL}/api/videos?filename={filename}&subfolder={subfolder}"
+            if roots.index(root):
+                # The video API serves the additional and cold storage paths it finds in the same settings.
+                api_url += f"&root={urllib.parse.quote(root)}"
             await video_player.preview_video(api_url, is_file_path=False, room_url=room_url)
         else:
+            file_path = self.app.record_manager.storage_tiering.locate(file_path)
             await video_player.preview_video(file_path, is_file_path=True, room_url=room_url)
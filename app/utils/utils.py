@@ -1,3 +1,4 @@
+import contextvars
 import functools
 import hashlib
 import json
@@ -21,6 +22,10 @@ from .logger import logger
 OptionalStr = str | None
 OptionalDict = dict | None
 
+# The error the innermost trace_error_decorator call of the current task swallowed, None after a success.
+# A context variable, so concurrent live checks sharing a cached handler never see each other's errors.
+last_error: contextvars.ContextVar[BaseException | None] = contextvars.ContextVar("last_error", default=None)
+
 
 class Color:
     RED = "\033[31m"
@@ -41,10 +46,14 @@ def trace_error_decorator(func: callable) -> callable:
     @functools.wraps(func)
     async def wrapper(*args: list, **kwargs: dict) -> Any:
         try:
-            return await func(*args, **kwargs)
-        except execjs.ProgramError:
+            result = await func(*args, **kwargs)
+            last_error.set(None)
+            return result
+        except execjs.ProgramError as e:
+            last_error.set(e)
             logger.warning("Failed to execute JS code. Please check if the Node.js environment")
         except Exception as e:
+            last_error.set(e)
             error_line = traceback.extract_tb(e.__traceback__)[-1].lineno
             error_info = f"Type: {type(e).__name__}, {e} in function {func.__name__} at line: {error_line}"
             logger.error(error_info)
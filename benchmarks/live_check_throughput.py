@@ -0,0 +1,327 @@
+"""
+Live check throughput benchmark.
+
+Registers a fake platform handler through ``PlatformHandler.register`` whose latency, CPU cost, error rate and
+share of live rooms are tunable, loads synthetic recordings into ``RecordingManager`` on a headless engine
+and runs the real periodic check loop (warm-up, semaphores, rate limiter, stream info cache) for a while.
+The JSON report lists completed checks per second, how late checks started compared with their interval,
+check latency percentiles and event loop lag; use it to compare scheduler changes.
+
+    python benchmarks/live_check_throughput.py --recordings 2000 --interval 30 --duration 120
+    python benchmarks/live_check_throughput.py --latency 0.5 --error-rate 0.1 --cpu-ms 5 --output checks.json
+
+Settings and recordings live in a scratch directory; the user configuration is not read or modified.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from app.core.config.config_manager import ConfigManager
+from app.core.metrics.server import LoopLagMonitor
+from app.core.platforms.platform_handlers import PlatformHandler
+from app.core.platforms.stream_info_cache import StreamInfoCache
+from app.headless.app import HeadlessApp
+from app.utils.logger import logger
+from app.utils.utils import trace_error_decorator
+
+BENCHMARK_HOST = "live.streamcap-benchmark.invalid"
+
+
+@dataclass
+class FakeStreamData:
+    """The StreamData fields the live check reads."""
+
+    anchor_name: str
+    is_live: bool
+    title: str = ""
+    platform: str = "Benchmark"
+    record_url: str | None = None
+    flv_url: str | None = None
+    m3u8_url: str | None = None
+
+
+class FakePlatformHandler(PlatformHandler):
+    """Answers live checks after a configurable delay instead of calling a platform API."""
+
+    platform = "benchmark"
+    latency = 0.2
+    jitter = 0.5
+    cpu_seconds = 0.0
+    error_rate = 0.0
+    live_ratio = 0.0
+    calls = 0
+    errors = 0
+
+    def __init__(
+            self,
+            proxy: str | None = None,
+            cookies: str | None = None,
+            record_quality: str | None = None,
+            platform: str | None = None,
+    ) -> None:
+        super().__init__(proxy, cookies, record_quality, platform)
+
+    @trace_error_decorator
+    async def get_stream_info(self, live_url: str) -> FakeStreamData:
+        cls = type(self)
+        cls.calls += 1
+        await asyncio.sleep(max(0.0, random.uniform(cls.latency * (1 - cls.jitter), cls.latency * (1 + cls.jitter))))
+        if cls.cpu_seconds:
+            # Stands in for synchronous work such as JS signing or parsing a large payload.
+            deadline = time.perf_counter() + cls.cpu_seconds
+            while time.perf_counter() < deadline:
+                pass
+        if random.random() < cls.error_rate:
+            cls.errors += 1
+            raise ConnectionError("injected platform error")
+        room = live_url.rsplit("/", 1)[-1]
+        is_live = random.random() < cls.live_ratio
+        return FakeStreamData(anchor_name=f"bench-{room}", is_live=is_live, title="benchmark" if is_live else "")
+
+
+class BenchmarkConfigManager(ConfigManager):
+    """Default settings plus benchmark overrides in a scratch directory; recordings are never saved."""
+
+    def __init__(self, run_path: str, recordings: list[dict], overrides: dict):
+        config_dir = os.path.join(run_path, "config")
+        os.makedirs(config_dir, exist_ok=True)
+        for name in ("default_settings.json", "language.json"):
+            shutil.copy(os.path.join(ROOT_DIR, "config", name), config_dir)
+        with open(os.path.join(ROOT_DIR, "config", "default_settings.json"), encoding="utf-8") as file:
+            user_config = {**json.load(file), **overrides}
+        with open(os.path.join(config_dir, "user_settings.json"), "w", encoding="utf-8") as file:
+            json.dump(user_config, file)
+        self.recordings = recordings
+        super().__init__(run_path)
+
+    def load_recordings_config(self):
+        return self.recordings
+
+    async def save_recordings_config(self, config):
+        pass
+
+
+class BenchmarkApp(HeadlessApp):
+    def __init__(self, loop: asyncio.AbstractEventLoop, work_dir: str, recordings: list[dict], overrides: dict):
+        self.work_dir = work_dir
+        self.recordings_data = recordings
+        self.overrides = overrides
+        super().__init__(loop)
+
+    def create_config_manager(self) -> ConfigManager:
+        # Locales come from the repository, settings and recordings from the scratch directory.
+        self.run_path = ROOT_DIR
+        return BenchmarkConfigManager(self.work_dir, self.recordings_data, self.overrides)
+
+    def create_engine_supervisor(self):
+        return None
+
+
+class CheckTimer:
+    """Wraps the dispatch and the live check of a record manager to time every check."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.dispatched: dict[str, float] = {}
+        self.last_start: dict[str, float] = {}
+        self.first_check: list[float] = []
+        self.queue_wait: list[float] = []
+        self.latency: list[float] = []
+        self.scheduling_lag: list[float] = []
+        self.completed = 0
+
+    def instrument(self, record_manager):
+        dispatch_live_check = record_manager._dispatch_live_check
+        check_if_live = record_manager.check_if_live
+
+        def timed_dispatch(recording):
+            self.dispatched[recording.rec_id] = time.perf_counter()
+            dispatch_live_check(recording)
+
+        async def timed_check(recording):
+            started = time.perf_counter()
+            dispatched = self.dispatched.pop(recording.rec_id, None)
+            if dispatched is not None:
+                self.queue_wait.append(started - dispatched)
+            previous = self.last_start.get(recording.rec_id)
+            if previous is None:
+                self.first_check.append(started - self.started)
+            else:
+                self.scheduling_lag.append(max(0.0, started - previous - recording.loop_time_seconds))
+            self.last_start[recording.rec_id] = started
+            try:
+                await check_if_live(recording)
+            finally:
+                self.latency.append(time.perf_counter() - started)
+                self.completed += 1
+
+        record_manager._dispatch_live_check = timed_dispatch
+        record_manager.check_if_live = timed_check
+
+
+def percentiles(values: list[float], scale: float = 1000.0, digits: int = 1) -> dict | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def pick(quantile: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * quantile))] * scale, digits)
+
+    return {
+        "count": len(ordered),
+        "p50": pick(0.5),
+        "p90": pick(0.9),
+        "p99": pick(0.99),
+        "max": round(ordered[-1] * scale, digits),
+        "mean": round(statistics.fmean(ordered) * scale, digits),
+    }
+
+
+def synthetic_recordings(count: int) -> list[dict]:
+    return [
+        {
+            "rec_id": f"bench{index:06d}",
+            "url": f"https://{BENCHMARK_HOST}/room/{index}",
+            "streamer_name": f"bench-{index}",
+            "record_format": "ts",
+            "quality": "OD",
+            "segment_record": False,
+            "segment_time": "1800",
+            "monitor_status": True,
+            "scheduled_recording": False,
+            "scheduled_start_time": "",
+            "monitor_hours": "",
+            "recording_dir": "",
+            "enabled_message_push": False,
+            # Live rooms only update their status, no recorder is started.
+            "only_notify_no_record": True,
+            "flv_use_direct_download": False,
+        }
+        for index in range(count)
+    ]
+
+
+async def run_benchmark(args) -> dict:
+    FakePlatformHandler.latency = args.latency
+    FakePlatformHandler.jitter = args.jitter
+    FakePlatformHandler.cpu_seconds = args.cpu_ms / 1000
+    FakePlatformHandler.error_rate = args.error_rate
+    FakePlatformHandler.live_ratio = args.live_ratio
+    FakePlatformHandler.register(BENCHMARK_HOST.replace(".", r"\."))
+
+    work_dir = tempfile.mkdtemp(prefix="streamcap-live-check-")
+    overrides = {
+        "loop_time_seconds": str(args.interval),
+        "platform_max_concurrent_requests": args.concurrency,
+        "platform_rate_limit_per_second": str(args.rate_limit),
+        "platform_rate_limit_burst": str(args.rate_burst),
+        "startup_check_window_seconds": str(args.warmup_window),
+        "resolver_pool_mode": args.resolver_pool,
+        "live_save_path": os.path.join(work_dir, "downloads"),
+        "engine_worker_processes": "0",
+        "metrics_port": "0",
+        "loop_profiler": False,
+    }
+    try:
+        app = BenchmarkApp(asyncio.get_running_loop(), work_dir, synthetic_recordings(args.recordings), overrides)
+        timer = CheckTimer()
+        timer.instrument(app.record_manager)
+        loop_monitor = LoopLagMonitor(0.1, histogram=None, history=1_000_000)
+        loop_monitor.start()
+        cpu_started = time.process_time()
+
+        await app.start_periodic_tasks()
+        await asyncio.sleep(args.duration)
+
+        elapsed = time.perf_counter() - timer.started
+        cpu_seconds = time.process_time() - cpu_started
+        loop_monitor.stop()
+        app.recording_enabled = False
+        checked = len(timer.last_start)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "settings": {
+            "recordings": args.recordings,
+            "interval_s": args.interval,
+            "duration_s": args.duration,
+            "handler_latency_s": args.latency,
+            "handler_jitter": args.jitter,
+            "handler_cpu_ms": args.cpu_ms,
+            "error_rate": args.error_rate,
+            "live_ratio": args.live_ratio,
+            "platform_concurrency": args.concurrency,
+            "rate_limit_per_second": args.rate_limit,
+            "rate_limit_burst": args.rate_burst,
+            "warmup_window_s": args.warmup_window,
+            "resolver_pool": args.resolver_pool,
+        },
+        "checks_completed": timer.completed,
+        "checks_per_second": round(timer.completed / elapsed, 2),
+        "handler_calls": FakePlatformHandler.calls,
+        "handler_errors": FakePlatformHandler.errors,
+        "stream_info_cache": StreamInfoCache.get_instance().stats(),
+        "recordings_checked": checked,
+        "recordings_never_checked": args.recordings - checked,
+        "first_check_s": percentiles(timer.first_check, scale=1),
+        "queue_wait_ms": percentiles(timer.queue_wait),
+        "check_latency_ms": percentiles(timer.latency),
+        "scheduling_lag_s": percentiles(timer.scheduling_lag, scale=1, digits=2),
+        "event_loop_lag_ms": percentiles(list(loop_monitor.history)),
+        "cpu_percent": round(cpu_seconds / elapsed * 100, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure live check throughput with a fake platform handler")
+    parser.add_argument("--recordings", type=int, default=1000, help="synthetic monitored recordings")
+    parser.add_argument("--interval", type=int, default=30, help="loop_time_seconds of every recording")
+    parser.add_argument("--duration", type=float, default=90.0, help="seconds to run the check loop")
+    parser.add_argument("--latency", type=float, default=0.2, help="mean handler latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.5, help="latency spread as a share of the mean")
+    parser.add_argument("--cpu-ms", type=float, default=0.0, help="blocking CPU time per handler call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of handler calls that fail")
+    parser.add_argument("--live-ratio", type=float, default=0.0, help="share of checks that find the room live")
+    parser.add_argument("--concurrency", type=int, default=3, help="platform_max_concurrent_requests")
+    parser.add_argument("--rate-limit", type=float, default=1000.0, help="platform_rate_limit_per_second")
+    parser.add_argument("--rate-burst", type=int, default=1000, help="platform_rate_limit_burst")
+    parser.add_argument("--warmup-window", type=float, default=0.0, help="startup_check_window_seconds")
+    parser.add_argument("--resolver-pool", choices=("inline", "thread"), default="inline",
+                        help="resolver_pool_mode; the process pool cannot load the fake handler")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for latency, errors and live rooms")
+    parser.add_argument("--log-level", default="CRITICAL", help="engine log level printed to stderr")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level.upper())
+
+    report = asyncio.run(run_benchmark(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
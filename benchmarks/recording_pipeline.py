@@ -0,0 +1,442 @@
+"""
+Recording pipeline benchmark.
+
+Starts ``stream_fixture_server.py`` in a separate process and records its streams with the same code paths
+StreamCap uses: the FFmpeg command built by ``ffmpeg_builders`` and ``DirectStreamDownloader``. Like a room
+that stays live, a recorder that ends is restarted after ``--restart-delay`` seconds. For every scenario the
+JSON report lists the output throughput per stream against the source bitrate, CPU and RSS per stream, how
+long each stream produced no output, and the gap between the last write of a recorder and the first write
+of its replacement.
+
+    python benchmarks/recording_pipeline.py --mode both --streams 4 --duration 60 --output pipeline.json
+    python benchmarks/recording_pipeline.py --mode direct --drop-after 15 --fail-rate 0.1
+    python benchmarks/recording_pipeline.py --mode ffmpeg --format flv --ramp --max-streams 64
+
+``--ramp`` doubles the number of concurrent streams until one of them falls below ``--min-ratio`` of the
+throughput of a single stream, and reports the largest count that kept up. FFmpeg scenarios need ffmpeg
+with libx264 on PATH to encode the fixture; CPU and RSS come from psutil when installed, otherwise /proc.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+import httpx
+from stream_fixture_server import add_server_arguments
+
+from app.core.media import ffmpeg_builders
+from app.core.media.direct_downloader import DirectStreamDownloader
+from app.utils.logger import logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+SAMPLE_INTERVAL = 1.0
+FIRST_BYTE_POLL = 0.02
+STOP_TIMEOUT = 10
+
+
+def process_usage(pid: int) -> tuple[float, int] | None:
+    """CPU seconds and resident memory in bytes of a process."""
+    if psutil:
+        try:
+            process = psutil.Process(pid)
+            cpu = process.cpu_times()
+            return cpu.user + cpu.system, process.memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as file:
+            fields = file.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm", encoding="utf-8") as file:
+            rss_pages = int(file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK"), rss_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def summarize(values: list[float], digits: int = 1) -> dict | None:
+    if not values:
+        return None
+    return {
+        "min": round(min(values), digits),
+        "median": round(statistics.median(values), digits),
+        "mean": round(statistics.fmean(values), digits),
+        "max": round(max(values), digits),
+    }
+
+
+class BenchmarkRecorder:
+    """Records one stream into numbered parts, starting a new part whenever the recorder ends."""
+
+    extension = "ts"
+
+    def __init__(self, name: str, url: str, output_dir: str, restart_delay: float):
+        self.name = name
+        self.url = url
+        self.output_dir = output_dir
+        self.restart_delay = restart_delay
+        self.parts: list[str] = []
+        self.restarts = 0
+        self.gaps: list[float] = []
+        self.errors: list[str] = []
+        self.cpu_by_pid: dict[int, float] = {}
+        self.rss_samples: list[int] = []
+        self.stopping = False
+
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(self.cpu_by_pid.values())
+
+    def output_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in self.parts if os.path.exists(path))
+
+    def sample(self):
+        pass
+
+    async def record(self, path: str):
+        raise NotImplementedError
+
+    async def stop(self):
+        self.stopping = True
+
+    async def _first_byte_at(self, path: str, task: asyncio.Task) -> float | None:
+        while not task.done() and not self.stopping:
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                return time.time()
+            await asyncio.sleep(FIRST_BYTE_POLL)
+        return None
+
+    async def run(self):
+        last_write = None
+        while not self.stopping:
+            path = os.path.join(self.output_dir, f"{self.name}_{len(self.parts):03d}.{self.extension}")
+            self.parts.append(path)
+            task = asyncio.create_task(self.record(path))
+            first_byte = await self._first_byte_at(path, task)
+            if first_byte is not None and last_write is not None:
+                self.gaps.append(first_byte - last_write)
+            try:
+                await task
+            except Exception as e:
+                self.errors.append(f"{type(e).__name__}: {e}")
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                last_write = os.stat(path).st_mtime
+            if self.stopping:
+                break
+            self.restarts += 1
+            await asyncio.sleep(self.restart_delay)
+
+
+class FFmpegRecorder(BenchmarkRecorder):
+    extension = "ts"
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.process: asyncio.subprocess.Process | None = None
+
+    async def record(self, path: str):
+        command = ffmpeg_builders.create_builder("ts", record_url=self.url, full_path=path).build_command()
+        self.process = await asyncio.create_subprocess_exec(
+            *command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        stderr = await self.process.stderr.read()
+        return_code = await self.process.wait()
+        if return_code and not self.stopping:
+            lines = stderr.decode("utf-8", "replace").strip().splitlines()
+            self.errors.append(lines[-1] if lines else f"ffmpeg exited with code {return_code}")
+
+    def sample(self):
+        if self.process and self.process.returncode is None:
+            usage = process_usage(self.process.pid)
+            if usage:
+                self.cpu_by_pid[self.process.pid] = usage[0]
+                self.rss_samples.append(usage[1])
+
+    async def stop(self):
+        await super().stop()
+        process = self.process
+        if not process or process.returncode is not None:
+            return
+        # Same as StreamCap: ask ffmpeg to quit so it finalizes the output, kill it if it does not.
+        try:
+            process.stdin.write(b"q")
+            await process.stdin.drain()
+            await asyncio.wait_for(process.wait(), timeout=STOP_TIMEOUT)
+        except (ConnectionError, asyncio.TimeoutError):
+            process.kill()
+            await process.wait()
+
+
+class DirectRecorder(BenchmarkRecorder):
+    extension = "flv"
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.downloader: DirectStreamDownloader | None = None
+
+    async def record(self, path: str):
+        self.downloader = DirectStreamDownloader(self.url, path)
+        await self.downloader.start_download()
+        await self.downloader.download_task
+
+    async def stop(self):
+        await super().stop()
+        if self.downloader:
+            await self.downloader.stop_download()
+
+
+RECORDERS = {"ffmpeg": FFmpegRecorder, "direct": DirectRecorder}
+
+
+class FixtureServerProcess:
+    """Runs the fixture server in its own process so its CPU time does not count as recording cost."""
+
+    def __init__(self, args):
+        self.args = args
+        self.process: asyncio.subprocess.Process | None = None
+        self.info: dict = {}
+
+    async def start(self):
+        args = self.args
+        command = [
+            sys.executable, os.path.join(BENCHMARKS_DIR, "stream_fixture_server.py"), "--port", "0",
+            "--bitrate", str(args.bitrate), "--segment-duration", str(args.segment_duration),
+            "--fixture-length", str(args.fixture_length), "--window", str(args.window),
+            "--fail-rate", str(args.fail_rate), "--stall-after", str(args.stall_after),
+            "--stall-duration", str(args.stall_duration), "--drop-after", str(args.drop_after),
+        ]
+        if args.synthetic:
+            command.append("--synthetic")
+        self.process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE)
+        while line := await self.process.stdout.readline():
+            try:
+                self.info = json.loads(line)
+                return
+            except ValueError:
+                print(line.decode().rstrip(), file=sys.stderr)
+        raise RuntimeError("The fixture server exited before it was ready")
+
+    def url(self, name: str, stream_format: str) -> str:
+        return f"http://{self.info['host']}:{self.info['port']}/live/{name}.{stream_format}"
+
+    async def stats(self) -> dict:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"http://{self.info['host']}:{self.info['port']}/stats")
+            return response.json()
+
+    async def stop(self):
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+            await self.process.wait()
+
+
+async def run_scenario(server: FixtureServerProcess, mode: str, stream_format: str, streams: int, args) -> dict:
+    source_kbps = server.info["flv_kbps" if stream_format == "flv" else "hls_kbps"]
+    extension = "flv" if stream_format == "flv" else "m3u8"
+    output_dir = tempfile.mkdtemp(prefix=f"streamcap-{mode}-", dir=args.output_dir)
+    run_id = f"{mode}-{stream_format}-{streams}-{int(time.time() * 1000)}"
+    recorders = [
+        RECORDERS[mode](f"{run_id}-{index}", server.url(f"{run_id}-{index}", extension), output_dir, args.restart_delay)
+        for index in range(streams)
+    ]
+
+    own_usage = process_usage(os.getpid())
+    tasks = [asyncio.create_task(recorder.run()) for recorder in recorders]
+    started = time.monotonic()
+    warm = None
+    previous = [0] * streams
+    idle_seconds = [0.0] * streams
+    while (elapsed := time.monotonic() - started) < args.duration:
+        await asyncio.sleep(SAMPLE_INTERVAL)
+        current = []
+        for index, recorder in enumerate(recorders):
+            recorder.sample()
+            current.append(recorder.output_bytes())
+            if warm and current[index] == previous[index]:
+                idle_seconds[index] += SAMPLE_INTERVAL
+        previous = current
+        if warm is None and elapsed >= args.warmup:
+            warm = {
+                "at": time.monotonic(),
+                "bytes": current,
+                "process_cpu": time.process_time(),
+                "cpu": [recorder.cpu_seconds for recorder in recorders],
+            }
+
+    final_bytes = [recorder.output_bytes() for recorder in recorders]
+    for recorder in recorders:
+        recorder.sample()
+    final_usage = process_usage(os.getpid())
+    steady = time.monotonic() - warm["at"]
+    process_cpu = time.process_time() - warm["process_cpu"]
+
+    await asyncio.gather(*(recorder.stop() for recorder in recorders))
+    await asyncio.gather(*tasks, return_exceptions=True)
+    served = [state for name, state in (await server.stats()).items() if name.startswith(run_id)]
+    if not args.keep_output:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    throughput = [(final - start) * 8 / steady / 1000 for final, start in zip(final_bytes, warm["bytes"])]
+    if mode == "ffmpeg":
+        cpu_seconds = sum(recorder.cpu_seconds - cpu for recorder, cpu in zip(recorders, warm["cpu"]))
+        rss = [statistics.fmean(recorder.rss_samples) for recorder in recorders if recorder.rss_samples]
+        rss_per_stream = statistics.fmean(rss) if rss else None
+    else:
+        # Downloaders share this process; the sampling loop itself is part of the measured overhead.
+        cpu_seconds = process_cpu
+        rss_delta = final_usage[1] - own_usage[1] if own_usage and final_usage else None
+        rss_per_stream = rss_delta / streams if rss_delta is not None else None
+
+    errors = [error for recorder in recorders for error in recorder.errors]
+    return {
+        "mode": mode,
+        "format": stream_format,
+        "streams": streams,
+        "duration_s": args.duration,
+        "steady_s": round(steady, 1),
+        "source_kbps": source_kbps,
+        "throughput_kbps": summarize(throughput),
+        "total_throughput_kbps": round(sum(throughput), 1),
+        "throughput_ratio": summarize([value / source_kbps for value in throughput], 3),
+        "idle_seconds": summarize(idle_seconds),
+        "cpu_percent_per_stream": round(cpu_seconds / steady / streams * 100, 2),
+        "rss_mb_per_stream": round(rss_per_stream / 1024 / 1024, 1) if rss_per_stream is not None else None,
+        "restarts": sum(recorder.restarts for recorder in recorders),
+        "restart_gap_ms": summarize([gap * 1000 for recorder in recorders for gap in recorder.gaps]),
+        "errors": {"count": len(errors), "samples": sorted(set(errors))[:5]},
+        "server": {
+            key: sum(state[key] for state in served) for key in ("bytes_sent", "requests", "failures", "connections")
+        },
+    }
+
+
+async def find_max_concurrent(server: FixtureServerProcess, mode: str, stream_format: str, args) -> dict:
+    steps = []
+    baseline = None
+    max_sustained = 0
+    streams = 1
+    while streams <= args.max_streams:
+        result = await run_scenario(server, mode, stream_format, streams, args)
+        worst = result["throughput_ratio"]["min"] if result["throughput_ratio"] else 0
+        baseline = baseline or worst or None
+        relative = worst / baseline if baseline else 0
+        sustained = relative >= args.min_ratio
+        steps.append({
+            "streams": streams,
+            "worst_relative_throughput": round(relative, 3),
+            "cpu_percent_per_stream": result["cpu_percent_per_stream"],
+            "rss_mb_per_stream": result["rss_mb_per_stream"],
+            "sustained": sustained,
+        })
+        print(f"{mode}/{stream_format}: {streams} streams, worst stream at {relative:.0%}", file=sys.stderr)
+        if not sustained:
+            break
+        max_sustained = streams
+        streams *= 2
+    return {"mode": mode, "format": stream_format, "max_sustained_streams": max_sustained, "steps": steps}
+
+
+def ffmpeg_version() -> str | None:
+    if not shutil.which("ffmpeg"):
+        return None
+    result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, check=False)
+    return result.stdout.splitlines()[0] if result.stdout else None
+
+
+def scenario_matrix(args, server_info: dict) -> tuple[list[tuple[str, str]], list[dict]]:
+    modes = ["ffmpeg", "direct"] if args.mode == "both" else [args.mode]
+    formats = ["flv", "hls"] if args.format == "both" else [args.format]
+    scenarios, skipped = [], []
+    for mode in modes:
+        for stream_format in formats:
+            if mode == "direct" and stream_format == "hls":
+                skipped.append({"mode": mode, "format": stream_format, "reason": "the direct downloader is FLV only"})
+            elif mode == "ffmpeg" and server_info["fixture"] != "ffmpeg":
+                skipped.append({"mode": mode, "format": stream_format, "reason": "no ffmpeg-encoded fixture"})
+            else:
+                scenarios.append((mode, stream_format))
+    return scenarios, skipped
+
+
+async def run_benchmark(args) -> dict:
+    server = FixtureServerProcess(args)
+    await server.start()
+    try:
+        scenarios, skipped = scenario_matrix(args, server.info)
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "ffmpeg": ffmpeg_version(),
+            "server": server.info,
+            "settings": {
+                "streams": args.streams,
+                "duration_s": args.duration,
+                "warmup_s": args.warmup,
+                "restart_delay_s": args.restart_delay,
+            },
+            "scenarios": [],
+            "skipped": skipped,
+        }
+        for mode, stream_format in scenarios:
+            print(f"Running {mode}/{stream_format} with {args.streams} streams", file=sys.stderr)
+            report["scenarios"].append(await run_scenario(server, mode, stream_format, args.streams, args))
+        if args.ramp:
+            report["max_concurrent"] = [
+                await find_max_concurrent(server, mode, stream_format, args) for mode, stream_format in scenarios
+            ]
+        return report
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the recording pipeline against local fixture streams")
+    parser.add_argument("--mode", choices=("ffmpeg", "direct", "both"), default="both", help="recorder to measure")
+    parser.add_argument("--format", choices=("flv", "hls", "both"), default="both", help="stream format")
+    parser.add_argument("--streams", type=int, default=4, help="concurrent streams per scenario (default: 4)")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds per scenario (default: 60)")
+    parser.add_argument("--warmup", type=float, default=10.0, help="seconds excluded from throughput and CPU")
+    parser.add_argument("--restart-delay", type=float, default=0.5, help="seconds before restarting a recorder")
+    parser.add_argument("--ramp", action="store_true", help="also search the maximum concurrent recordings")
+    parser.add_argument("--max-streams", type=int, default=64, help="upper bound of the --ramp search")
+    parser.add_argument("--min-ratio", type=float, default=0.9,
+                        help="throughput relative to one stream that still counts as keeping up (default: 0.9)")
+    parser.add_argument("--output-dir", help="directory for the recorded files (default: system temp)")
+    parser.add_argument("--keep-output", action="store_true", help="keep the recorded files")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    if args.warmup >= args.duration:
+        parser.error("--warmup must be shorter than --duration")
+
+    # Recorder logs would drown the progress output; keep warnings and errors only.
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    report = asyncio.run(run_benchmark(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Cold start import-time benchmark.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and reports the cumulative import
+time of the target module, the wall time of the whole process and the slowest imports, as JSON.
+
+    python benchmarks/startup_importtime.py --module app.app_manager --runs 5 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$")
+
+
+def parse_import_time(stderr: str) -> list[dict]:
+    """Parse ``-X importtime`` lines into records of self/cumulative microseconds per module."""
+    records = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append({
+                "module": module.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": len(indent) // 2,
+            })
+    return records
+
+
+def run_once(module: str, python: str) -> dict:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit code {result.returncode}"
+        raise RuntimeError(f"Importing {module} failed: {error}")
+
+    records = parse_import_time(result.stderr)
+    target = next((record for record in reversed(records) if record["module"] == module), None)
+    return {
+        "wall_ms": wall_ms,
+        "import_ms": (target["cumulative_us"] if target else sum(r["self_us"] for r in records)) / 1000,
+        "module_count": len(records),
+        "records": records,
+    }
+
+
+def summarize(values: list[float]) -> dict:
+    return {
+        "min": round(min(values), 2),
+        "median": round(statistics.median(values), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start import time with python -X importtime")
+    parser.add_argument("--module", default="app.app_manager", help="module to import (default: app.app_manager)")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreter runs")
+    parser.add_argument("--top", type=int, default=20, help="number of slowest modules to report")
+    parser.add_argument("--python", default=sys.executable, help="interpreter to benchmark")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    runs = [run_once(args.module, args.python) for _ in range(max(1, args.runs))]
+
+    # Slowest modules by median self time across runs.
+    self_times: dict[str, list[int]] = {}
+    cumulative_times: dict[str, list[int]] = {}
+    for run in runs:
+        for record in run["records"]:
+            self_times.setdefault(record["module"], []).append(record["self_us"])
+            cumulative_times.setdefault(record["module"], []).append(record["cumulative_us"])
+    slowest = sorted(self_times, key=lambda name: statistics.median(self_times[name]), reverse=True)[:args.top]
+
+    report = {
+        "module": args.module,
+        "python": sys.version.split()[0],
+        "runs": len(runs),
+        "import_ms": summarize([run["import_ms"] for run in runs]),
+        "wall_ms": summarize([run["wall_ms"] for run in runs]),
+        "module_count": runs[-1]["module_count"],
+        "slowest_modules": [
+            {
+                "module": name,
+                "self_ms": round(statistics.median(self_times[name]) / 1000, 2),
+                "cumulative_ms": round(statistics.median(cumulative_times[name]) / 1000, 2),
+            }
+            for name in slowest
+        ],
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
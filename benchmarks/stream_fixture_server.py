@@ -0,0 +1,404 @@
+"""
+Local live stream server for the recording benchmarks.
+
+Serves endless FLV streams and sliding-window HLS playlists for any stream name, paced in real time:
+
+    /live/<name>.flv          continuous FLV over one HTTP response
+    /live/<name>.m3u8         live playlist, the last ``--window`` segments
+    /live/<name>/<seq>.ts     segment ``seq`` of the playlist
+    /stats                    JSON counters per stream
+
+With ffmpeg on PATH the media is an H.264/AAC test pattern encoded at ``--bitrate``, so ffmpeg can remux it
+exactly like a real room. Without ffmpeg the server falls back to synthetic FLV tags and MPEG-TS null packets
+of the same bitrate, which only the direct downloader can consume.
+
+Failures can be injected to exercise restarts: ``--fail-rate`` answers that share of requests with 503,
+``--stall-after``/``--stall-duration`` pause a stream once, and ``--drop-after`` ends every FLV connection
+(or HLS session, through ``#EXT-X-ENDLIST``) after that many seconds.
+
+    python benchmarks/stream_fixture_server.py --port 8900 --bitrate 2500 --segment-duration 2
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import shutil
+import struct
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+FLV_TAG_HEADER_SIZE = 11
+FLV_SCRIPT_TAG = 18
+TS_PACKET = b"\x47\x1f\xff\x10" + b"\xff" * 184
+# Initial burst a CDN sends from its GOP cache before pacing the stream in real time.
+FLV_BURST_SECONDS = 1.0
+FRAME_RATE = 25
+
+
+@dataclass
+class FlvTag:
+    timestamp: int
+    data: bytes
+    is_header: bool = False
+
+
+@dataclass
+class MediaFixture:
+    flv_header: bytes
+    flv_tags: list[FlvTag]
+    flv_duration_ms: int
+    segments: list[bytes]
+    segment_durations: list[float]
+    source: str
+
+    @property
+    def flv_kbps(self) -> float:
+        return sum(len(tag.data) for tag in self.flv_tags) * 8 / self.flv_duration_ms
+
+    @property
+    def hls_kbps(self) -> float:
+        return sum(len(segment) for segment in self.segments) * 8 / sum(self.segment_durations) / 1000
+
+
+@dataclass
+class StreamState:
+    bytes_sent: int = 0
+    requests: int = 0
+    failures: int = 0
+    connections: int = 0
+    hls_session_start: float | None = None
+    hls_sessions: int = 0
+
+
+def parse_flv(payload: bytes) -> tuple[bytes, list[FlvTag]]:
+    header_size = struct.unpack(">I", payload[5:9])[0]
+    header = payload[:header_size + 4]
+    tags, offset = [], header_size + 4
+    while offset + FLV_TAG_HEADER_SIZE <= len(payload):
+        tag_type = payload[offset] & 0x1F
+        size = int.from_bytes(payload[offset + 1:offset + 4], "big")
+        timestamp = int.from_bytes(payload[offset + 4:offset + 7], "big") | (payload[offset + 7] << 24)
+        end = offset + FLV_TAG_HEADER_SIZE + size + 4
+        if end > len(payload):
+            break
+        data = payload[offset:end]
+        body = data[FLV_TAG_HEADER_SIZE:FLV_TAG_HEADER_SIZE + 2]
+        # Script data and the AVC/AAC sequence headers are sent once per connection, not on every loop.
+        is_header = tag_type == FLV_SCRIPT_TAG or (
+            len(body) == 2 and body[1] == 0 and (
+                (tag_type == 9 and body[0] & 0x0F == 7) or (tag_type == 8 and body[0] >> 4 == 10)
+            )
+        )
+        tags.append(FlvTag(timestamp, data, is_header))
+        offset = end
+    return header, tags
+
+
+def with_timestamp(tag: bytes, timestamp: int) -> bytes:
+    return tag[:4] + (timestamp & 0xFFFFFF).to_bytes(3, "big") + bytes([(timestamp >> 24) & 0xFF]) + tag[8:]
+
+
+def synthetic_fixture(bitrate_kbps: int, segment_duration: float, length: float) -> MediaFixture:
+    frame_size = max(16, int(bitrate_kbps * 1000 / 8 / FRAME_RATE))
+    noise = os.urandom(frame_size)
+    tags = []
+    for index in range(int(length * FRAME_RATE)):
+        frame_type = 0x17 if index % (FRAME_RATE * 2) == 0 else 0x27
+        body = bytes([frame_type, 1, 0, 0, 0]) + noise[:frame_size - 5]
+        timestamp = index * 1000 // FRAME_RATE
+        tag = bytes([9]) + len(body).to_bytes(3, "big") + b"\x00" * 7 + body
+        tag += len(tag).to_bytes(4, "big")
+        tags.append(FlvTag(timestamp, with_timestamp(tag, timestamp)))
+
+    segment_packets = max(1, int(bitrate_kbps * 1000 / 8 * segment_duration / len(TS_PACKET)))
+    segment_count = max(1, int(length / segment_duration))
+    return MediaFixture(
+        flv_header=b"FLV\x01\x01\x00\x00\x00\x09\x00\x00\x00\x00",
+        flv_tags=tags,
+        flv_duration_ms=int(length * 1000),
+        segments=[TS_PACKET * segment_packets] * segment_count,
+        segment_durations=[segment_duration] * segment_count,
+        source="synthetic",
+    )
+
+
+def encoded_fixture(bitrate_kbps: int, segment_duration: float, length: float) -> MediaFixture:
+    """Encode a test pattern with ffmpeg; keyframes are aligned with the HLS segments."""
+    audio_kbps = 64
+    video_kbps = max(100, bitrate_kbps - audio_kbps)
+    gop = int(FRAME_RATE * segment_duration)
+    with tempfile.TemporaryDirectory(prefix="streamcap-fixture-") as work_dir:
+        flv_path = os.path.join(work_dir, "source.flv")
+        subprocess.run([
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc2=size=1280x720:rate={FRAME_RATE}",
+            "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100",
+            "-t", str(length),
+            "-c:v", "libx264", "-preset", "ultrafast", "-tune", "zerolatency", "-pix_fmt", "yuv420p",
+            "-b:v", f"{video_kbps}k", "-maxrate", f"{video_kbps}k", "-bufsize", f"{video_kbps * 2}k",
+            "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",
+            "-c:a", "aac", "-b:a", f"{audio_kbps}k",
+            "-f", "flv", flv_path,
+        ], check=True)
+        subprocess.run([
+            "ffmpeg", "-y", "-v", "error", "-i", flv_path, "-c", "copy",
+            "-f", "hls", "-hls_time", str(segment_duration), "-hls_list_size", "0",
+            "-hls_segment_filename", os.path.join(work_dir, "segment%04d.ts"),
+            os.path.join(work_dir, "index.m3u8"),
+        ], check=True)
+
+        with open(flv_path, "rb") as file:
+            header, tags = parse_flv(file.read())
+        with open(os.path.join(work_dir, "index.m3u8"), encoding="utf-8") as file:
+            playlist = file.read()
+        durations = [float(value) for value in re.findall(r"#EXTINF:([\d.]+)", playlist)]
+        segments = []
+        for name in re.findall(r"^(segment\d+\.ts)$", playlist, re.MULTILINE):
+            with open(os.path.join(work_dir, name), "rb") as file:
+                segments.append(file.read())
+
+    last = tags[-1].timestamp if tags else 0
+    return MediaFixture(header, tags, last + 1000 // FRAME_RATE, segments, durations, "ffmpeg")
+
+
+def load_fixture(bitrate_kbps: int, segment_duration: float, length: float, synthetic: bool = False) -> MediaFixture:
+    if not synthetic and shutil.which("ffmpeg"):
+        try:
+            return encoded_fixture(bitrate_kbps, segment_duration, length)
+        except (subprocess.CalledProcessError, OSError) as e:
+            print(f"Encoding the fixture with ffmpeg failed ({e}), using synthetic streams")
+    return synthetic_fixture(bitrate_kbps, segment_duration, length)
+
+
+class FixtureStreamServer:
+    def __init__(
+            self,
+            fixture: MediaFixture,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            window: int = 3,
+            fail_rate: float = 0.0,
+            stall_after: float = 0.0,
+            stall_duration: float = 0.0,
+            drop_after: float = 0.0,
+    ):
+        self.fixture = fixture
+        self.host = host
+        self.port = port
+        self.window = window
+        self.fail_rate = fail_rate
+        self.stall_after = stall_after
+        self.stall_duration = stall_duration
+        self.drop_after = drop_after
+        self.streams: dict[str, StreamState] = defaultdict(StreamState)
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def info(self) -> dict:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "fixture": self.fixture.source,
+            "flv_kbps": round(self.fixture.flv_kbps, 1),
+            "hls_kbps": round(self.fixture.hls_kbps, 1),
+            "segment_duration": round(sum(self.fixture.segment_durations) / len(self.fixture.segment_durations), 3),
+            "fail_rate": self.fail_rate,
+            "stall_after": self.stall_after,
+            "stall_duration": self.stall_duration,
+            "drop_after": self.drop_after,
+        }
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "bytes_sent": state.bytes_sent,
+                "requests": state.requests,
+                "failures": state.failures,
+                "connections": state.connections,
+                "hls_sessions": state.hls_sessions,
+            }
+            for name, state in self.streams.items()
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=10)
+            while (line := await asyncio.wait_for(reader.readline(), timeout=10)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET":
+                await self._respond(writer, 405, b"")
+                return
+            path = parts[1].split("?", 1)[0]
+            if path == "/stats":
+                await self._respond(writer, 200, json.dumps(self.stats()).encode(), "application/json")
+            elif match := re.fullmatch(r"/live/([\w.-]+)\.flv", path):
+                await self._serve_flv(match.group(1), writer)
+            elif match := re.fullmatch(r"/live/([\w.-]+)\.m3u8", path):
+                await self._serve_playlist(match.group(1), writer)
+            elif match := re.fullmatch(r"/live/([\w.-]+)/(\d+)\.ts", path):
+                await self._serve_segment(match.group(1), int(match.group(2)), writer)
+            else:
+                await self._respond(writer, 404, b"Not Found\n")
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str = "text/plain"):
+        reasons = {200: "OK", 404: "Not Found", 405: "Method Not Allowed", 503: "Service Unavailable"}
+        writer.write(
+            f"HTTP/1.1 {status} {reasons[status]}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+    def _should_fail(self, state: StreamState) -> bool:
+        state.requests += 1
+        if self.fail_rate and random.random() < self.fail_rate:
+            state.failures += 1
+            return True
+        return False
+
+    async def _serve_flv(self, name: str, writer: asyncio.StreamWriter):
+        state = self.streams[name]
+        if self._should_fail(state):
+            await self._respond(writer, 503, b"")
+            return
+        state.connections += 1
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: video/x-flv\r\nConnection: close\r\n\r\n")
+        writer.write(self.fixture.flv_header)
+
+        started = time.monotonic()
+        stalled = False
+        loop_index = 0
+        while True:
+            offset = loop_index * self.fixture.flv_duration_ms
+            for tag in self.fixture.flv_tags:
+                if tag.is_header and loop_index:
+                    continue
+                media_time = (offset + tag.timestamp) / 1000
+                elapsed = time.monotonic() - started
+                if self.drop_after and elapsed >= self.drop_after:
+                    return
+                if self.stall_after and not stalled and elapsed >= self.stall_after:
+                    stalled = True
+                    await asyncio.sleep(self.stall_duration)
+                    started += self.stall_duration
+                    elapsed = time.monotonic() - started
+                if media_time - FLV_BURST_SECONDS > elapsed:
+                    await asyncio.sleep(media_time - FLV_BURST_SECONDS - elapsed)
+                data = with_timestamp(tag.data, offset + tag.timestamp)
+                writer.write(data)
+                await writer.drain()
+                state.bytes_sent += len(data)
+            loop_index += 1
+
+    def _media_time(self, state: StreamState) -> float:
+        """Seconds of the current HLS session, frozen while the stream is stalled."""
+        elapsed = time.monotonic() - state.hls_session_start
+        if self.stall_after and elapsed > self.stall_after:
+            elapsed = max(self.stall_after, elapsed - self.stall_duration)
+        return elapsed
+
+    async def _serve_playlist(self, name: str, writer: asyncio.StreamWriter):
+        state = self.streams[name]
+        if self._should_fail(state):
+            await self._respond(writer, 503, b"")
+            return
+        if state.hls_session_start is None:
+            # Start with a full window so a player can begin right away, like a room that is already live.
+            state.hls_session_start = time.monotonic() - self.window * self.fixture.segment_durations[0]
+            state.hls_sessions += 1
+
+        durations = self.fixture.segment_durations
+        nominal = sum(durations) / len(durations)
+        media_time = self._media_time(state)
+        ended = bool(self.drop_after and media_time >= self.drop_after + self.window * nominal)
+        available = int(media_time / nominal)
+        first = max(0, available - self.window)
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{math.ceil(max(durations))}",
+            f"#EXT-X-MEDIA-SEQUENCE:{first}",
+            f"#EXT-X-DISCONTINUITY-SEQUENCE:{(first - 1) // len(durations) if first else 0}",
+        ]
+        for sequence in range(first, available):
+            if sequence and sequence % len(durations) == 0:
+                lines.append("#EXT-X-DISCONTINUITY")
+            lines += [f"#EXTINF:{durations[sequence % len(durations)]:.3f},", f"/live/{name}/{sequence}.ts"]
+        if ended:
+            lines.append("#EXT-X-ENDLIST")
+            state.hls_session_start = None
+        await self._respond(writer, 200, ("\n".join(lines) + "\n").encode(), "application/vnd.apple.mpegurl")
+
+    async def _serve_segment(self, name: str, sequence: int, writer: asyncio.StreamWriter):
+        state = self.streams[name]
+        if self._should_fail(state):
+            await self._respond(writer, 503, b"")
+            return
+        segment = self.fixture.segments[sequence % len(self.fixture.segments)]
+        await self._respond(writer, 200, segment, "video/mp2t")
+        state.bytes_sent += len(segment)
+
+
+async def serve(args):
+    fixture = await asyncio.to_thread(
+        load_fixture, args.bitrate, args.segment_duration, args.fixture_length, args.synthetic
+    )
+    server = FixtureStreamServer(
+        fixture, args.host, args.port, args.window, args.fail_rate, args.stall_after, args.stall_duration,
+        args.drop_after,
+    )
+    await server.start()
+    # The first line of output tells a parent process where to connect.
+    print(json.dumps(server.info()), flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--bitrate", type=int, default=2500, help="stream bitrate in kbps (default: 2500)")
+    parser.add_argument("--segment-duration", type=float, default=2.0, help="HLS segment duration in seconds")
+    parser.add_argument("--fixture-length", type=float, default=20.0, help="seconds of media looped by every stream")
+    parser.add_argument("--window", type=int, default=3, help="segments listed in the live playlist")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--stall-after", type=float, default=0.0, help="pause each stream once after N seconds")
+    parser.add_argument("--stall-duration", type=float, default=0.0, help="length of the pause in seconds")
+    parser.add_argument("--drop-after", type=float, default=0.0, help="end each connection after N seconds")
+    parser.add_argument("--synthetic", action="store_true", help="do not encode a real fixture with ffmpeg")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic FLV and HLS live streams for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1", help="listen address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8900, help="listen port, 0 picks a free one (default: 8900)")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Recordings page rendering benchmark.
+
+Builds the real ``RecordingsPage`` and ``RecordingCardManager`` on a Flet ``Page`` whose connection is a stub:
+it acknowledges updates the way the Flet server does, so control diffs are computed and encoded as in a
+session, but nothing is rendered. For every library size it reports the time, memory and update traffic of
+``add_record_cards``, ``apply_filter`` per status filter, ``filter_recordings`` and batches of
+``update_card``. Each size runs in fresh processes, once for timings and once under tracemalloc.
+
+    python benchmarks/ui_render.py
+    python benchmarks/ui_render.py --sizes 1000 5000 --batches 1 50 500 --output ui_render.json
+
+Settings and recordings live in a scratch directory; the user configuration is not read or modified.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+import flet as ft
+from flet.core.connection import Connection
+from flet.core.page import Page
+from flet.core.protocol import PageCommandResponsePayload, PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+from live_check_throughput import BenchmarkApp
+
+from app.core.recording.record_manager import RecordingManager
+from app.models.recording.recording_status_model import RecordingStatus
+from app.ui.components.business.recording_card import RecordingCardManager
+from app.ui.views.recordings_view import RecordingsPage
+from app.utils.logger import logger
+
+SESSION_ID = "benchmark"
+PLATFORMS = (
+    ("Douyin", "douyin", "https://live.douyin.com/{}"),
+    ("Bilibili", "bilibili", "https://live.bilibili.com/{}"),
+    ("Huya", "huya", "https://www.huya.com/{}"),
+    ("Twitch", "twitch", "https://www.twitch.tv/bench{}"),
+)
+FILTERS = ("all", "recording", "living", "error", "offline", "stopped")
+
+
+class StubConnection(Connection):
+    """Answers page commands like the Flet server, counting the batches and their JSON size."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor):
+        super().__init__()
+        self.pubsubhub = PubSubHub(loop=loop, executor=executor)
+        self.next_id = 1
+        self.batches = 0
+        self.commands = 0
+        self.payload_bytes = 0
+
+    def _count(self, commands: list):
+        self.batches += 1
+        self.commands += len(commands)
+        self.payload_bytes += len(json.dumps(commands, default=vars, separators=(",", ":")))
+
+    def send_command(self, session_id: str, command):
+        self._count([command])
+        return PageCommandResponsePayload(result="", error="")
+
+    def send_commands(self, session_id: str, commands: list):
+        self._count(commands)
+        # The server replies to every "add" with the ids it assigned to the added controls.
+        results = []
+        for command in commands:
+            if command.name == "add":
+                ids = [f"_{self.next_id + offset}" for offset in range(len(command.commands))]
+                self.next_id += len(ids)
+                results.append(" ".join(ids))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    async def send_command_async(self, session_id: str, command):
+        return self.send_command(session_id, command)
+
+    async def send_commands_async(self, session_id: str, commands: list):
+        return self.send_commands(session_id, commands)
+
+    def traffic(self) -> tuple[int, int, int]:
+        return self.batches, self.commands, self.payload_bytes
+
+
+class RenderBenchmarkApp(BenchmarkApp):
+    """The engine of the headless app with the real recordings page and cards on a stub Flet page."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, page: Page, work_dir: str, recordings: list[dict]):
+        super().__init__(loop, work_dir, recordings, {"engine_worker_processes": "0", "metrics_port": "0"})
+        self.page = page
+        # Cards must not start live checks against the real platforms.
+        self.recording_enabled = False
+        RecordingManager.set_periodic_task_running(True)
+        self.content_area = ft.Column(
+            controls=[],
+            expand=True,
+            alignment=ft.MainAxisAlignment.START,
+            horizontal_alignment=ft.CrossAxisAlignment.START,
+        )
+        page.add(self.content_area)
+        self.record_card_manager.event_subscription.close()
+        self.record_card_manager = RecordingCardManager(self)
+        self.recordings_page = RecordingsPage(self)
+
+
+def synthetic_recordings(count: int) -> list[dict]:
+    recordings = []
+    for index in range(count):
+        platform_name, platform_key, url = PLATFORMS[index % len(PLATFORMS)]
+        recordings.append({
+            "rec_id": f"bench{index:06d}",
+            "url": url.format(index),
+            "streamer_name": f"Streamer {index}",
+            "record_format": "ts",
+            "quality": "OD",
+            "segment_record": False,
+            "segment_time": "1800",
+            "monitor_status": index % 10 != 0,
+            "scheduled_recording": False,
+            "scheduled_start_time": "",
+            "monitor_hours": "",
+            "recording_dir": "",
+            "enabled_message_push": False,
+            "only_notify_no_record": False,
+            "flv_use_direct_download": False,
+            "platform": platform_name,
+            "platform_key": platform_key,
+        })
+    return recordings
+
+
+def assign_states(recordings: list, rng: random.Random):
+    """Spread the recordings over the status buckets, roughly like a large library in the evening."""
+    for recording in recordings:
+        if not recording.monitor_status:
+            recording.status_info = RecordingStatus.STOPPED_MONITORING
+            continue
+        roll = rng.random()
+        if roll < 0.02:
+            recording.is_live = True
+            recording.is_recording = True
+            recording.status_info = RecordingStatus.RECORDING
+        elif roll < 0.12:
+            recording.is_live = True
+            recording.status_info = RecordingStatus.LIVE_BROADCASTING
+        elif roll < 0.15:
+            recording.status_info = RecordingStatus.LIVE_STATUS_CHECK_ERROR
+        else:
+            recording.status_info = RecordingStatus.MONITORING
+
+
+class Recorder:
+    """Collects the time, update traffic and, under tracemalloc, the memory of each measured step."""
+
+    def __init__(self, connection: StubConnection, trace_memory: bool):
+        self.connection = connection
+        self.trace_memory = trace_memory
+        self.results: dict[str, dict] = {}
+
+    async def measure(self, name: str, action, items: int | None = None):
+        batches, commands, payload_bytes = self.connection.traffic()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        await action()
+        elapsed = time.perf_counter() - started
+
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.results[name] = {
+                "retained_kb": round((current - memory_before) / 1024, 1),
+                "peak_kb": round((peak - memory_before) / 1024, 1),
+            }
+            return
+        after = self.connection.traffic()
+        self.results[name] = {
+            "ms": round(elapsed * 1000, 2),
+            "update_batches": after[0] - batches,
+            "commands": after[1] - commands,
+            "payload_kb": round((after[2] - payload_bytes) / 1024, 1),
+        }
+        if items:
+            self.results[name]["ms_per_item"] = round(elapsed * 1000 / items, 3)
+
+
+async def run_size(args) -> dict:
+    loop = asyncio.get_running_loop()
+    rng = random.Random(args.seed)
+    executor = ThreadPoolExecutor(max_workers=4)
+    connection = StubConnection(loop, executor)
+    page = Page(connection, SESSION_ID, executor=executor, loop=loop)
+    page._set_attr("width", args.width)
+    recorder = Recorder(connection, args.trace_memory)
+    work_dir = tempfile.mkdtemp(prefix="streamcap-ui-render-")
+    if args.trace_memory:
+        tracemalloc.start()
+
+    try:
+        app = None
+
+        async def build_app():
+            nonlocal app
+            app = RenderBenchmarkApp(loop, page, work_dir, synthetic_recordings(args.size))
+
+        await recorder.measure("app_init", build_app, args.size)
+        assign_states(app.record_manager.recordings, rng)
+        recordings_page = app.recordings_page
+        # The first part of RecordingsPage.load, without the card creation measured below.
+        app.content_area.controls.extend([
+            recordings_page.create_recordings_title_area(),
+            recordings_page.create_filter_area(),
+            recordings_page.create_recordings_content_area(),
+        ])
+        app.content_area.update()
+
+        await recorder.measure("add_record_cards", recordings_page.add_record_cards, args.size)
+
+        for status_filter in FILTERS:
+            recordings_page.current_filter = status_filter
+            await recorder.measure(f"apply_filter[{status_filter}]", recordings_page.apply_filter)
+        recordings_page.current_filter = "all"
+        await recordings_page.apply_filter()
+
+        queries = {
+            "one_streamer": f"streamer {args.size - 1}",
+            "one_platform": "platform:huya",
+            "no_match": "zzz-no-such-streamer",
+        }
+        for label, query in queries.items():
+            await recorder.measure(f"filter_recordings[{label}]", lambda q=query: recordings_page.filter_recordings(q))
+            await recordings_page.apply_filter()
+
+        manager = app.record_card_manager
+        recordings = app.record_manager.recordings
+        for batch_size in sorted({min(size, args.size) for size in args.batches}):
+            batch = rng.sample(recordings, batch_size)
+            for recording in batch:
+                recording.is_live = not recording.is_live
+                recording.speed = f"{rng.randint(100, 9000)} KB/s"
+
+            async def update_batch(_batch=batch):
+                await asyncio.gather(*(manager.update_card(recording) for recording in _batch))
+
+            await recorder.measure(f"update_card[batch={batch_size}]", update_batch, batch_size)
+
+        result = {"size": args.size, "steps": recorder.results}
+        if args.trace_memory:
+            result["traced_total_kb"] = round(tracemalloc.get_traced_memory()[0] / 1024, 1)
+        else:
+            result["cards"] = len(manager.cards_obj)
+        return result
+    finally:
+        if args.trace_memory:
+            tracemalloc.stop()
+        executor.shutdown(wait=False, cancel_futures=True)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def run_child(args, size: int, trace_memory: bool) -> dict:
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child-size", str(size),
+        "--batches", *map(str, args.batches), "--width", str(args.width), "--seed", str(args.seed),
+    ]
+    if trace_memory:
+        command.append("--trace-memory")
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=ROOT_DIR, check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark for {size} recordings failed:\n{completed.stderr}")
+    return json.loads(completed.stdout)
+
+
+def merge(timings: dict, memory: dict) -> dict:
+    steps = {name: {**values, **memory["steps"].get(name, {})} for name, values in timings["steps"].items()}
+    return {**timings, "steps": steps, "traced_total_kb": memory.get("traced_total_kb")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure recordings page rendering on a stub Flet page")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="recording counts")
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 10, 100],
+                        help="update_card batch sizes, capped at the recording count")
+    parser.add_argument("--width", type=int, default=1600, help="page width used for the grid layout")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for statuses and update batches")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--child-size", dest="size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--trace-memory", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logger.remove()
+    if args.size:
+        print(json.dumps(asyncio.run(run_size(args))))
+        return
+
+    results = []
+    for size in args.sizes:
+        timings = run_child(args, size, trace_memory=False)
+        results.append(timings if args.no_memory else merge(timings, run_child(args, size, trace_memory=True)))
+
+    report = {
+        "python": sys.version.split()[0],
+        "flet": metadata.version("flet"),
+        "platform": platform.platform(),
+        "page_width": args.width,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,88 @@
 import argparse
 import multiprocessing
 import os
+import sys
 
-import flet as ft
 from dotenv import load_dotenv
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 6006
+ENGINE_ONLY_FLAGS = (
+    "--headless", "--cluster-coordinator", "--cluster-worker", "--cluster-status", "--retention-report"
+)
+
+
+def parse_args() -> argparse.Namespace:
+    from app.cluster.protocol import DEFAULT_CLUSTER_HOST, DEFAULT_CLUSTER_PORT
+
+    default_host = os.getenv("HOST", DEFAULT_HOST)
+    default_port = int(os.getenv("PORT", DEFAULT_PORT))
+    cluster_host = os.getenv("CLUSTER_HOST", DEFAULT_CLUSTER_HOST)
+    cluster_port = int(os.getenv("CLUSTER_PORT", DEFAULT_CLUSTER_PORT))
+
+    parser = argparse.ArgumentParser(description="Run the Flet app with optional web mode.")
+    parser.add_argument("--web", action="store_true", help="Run the app in web mode")
+    parser.add_argument("--headless", action="store_true", help="Run only the recording engine, without any UI")
+    parser.add_argument("--host", type=str, default=default_host, help=f"Host address (default: {default_host})")
+    parser.add_argument("--port", type=int, default=default_port, help=f"Port number (default: {default_port})")
+    parser.add_argument("--retention-report", action="store_true",
+                        help="Print the recordings the retention rules would delete now, without deleting them")
+
+    cluster = parser.add_argument_group("cluster mode")
+    cluster.add_argument("--cluster-coordinator", action="store_true",
+                         help="Assign the recordings in config/recordings.json to cluster workers")
+    cluster.add_argument("--cluster-worker", action="store_true",
+                         help="Run a headless engine that records the rooms assigned by the coordinator")
+    cluster.add_argument("--cluster-status", action="store_true", help="Print the state of a running cluster")
+    cluster.add_argument("--cluster-host", type=str, default=cluster_host,
+                         help=f"Coordinator address (default: {cluster_host})")
+    cluster.add_argument("--cluster-port", type=int, default=cluster_port,
+                         help=f"Coordinator port (default: {cluster_port})")
+    cluster.add_argument("--cluster-token", type=str, default=os.getenv("CLUSTER_TOKEN"),
+                         help="Shared secret the coordinator requires from workers (default: $CLUSTER_TOKEN)")
+    cluster.add_argument("--node-id", type=str, default=os.getenv("NODE_ID"),
+                         help="Stable worker id, so a restarted worker gets its rooms back (default: host-pid)")
+    cluster.add_argument("--node-capacity", type=int, default=1,
+                         help="Relative share of rooms this worker takes (default: 1)")
+    cluster.add_argument("--exit-with-coordinator", action="store_true",
+                         help="Stop the worker once its coordinator connection is lost, used for local workers")
+    return parser.parse_args()
+
+
+def run_engine_only(args: argparse.Namespace) -> int:
+    # Dispatched before the UI imports below, so these modes never load Flet.
+    if args.cluster_status:
+        from app.cluster import print_cluster_status
+
+        return 0 if print_cluster_status(args.cluster_host, args.cluster_port, args.cluster_token) else 1
+    if args.retention_report:
+        from app.headless import print_retention_report
+
+        return 0 if print_retention_report() else 1
+    if args.cluster_coordinator:
+        from app.cluster import run_coordinator
+
+        run_coordinator(args.cluster_host, args.cluster_port, args.cluster_token)
+    elif args.cluster_worker:
+        from app.cluster import run_worker
+
+        run_worker(
+            args.cluster_host, args.cluster_port, args.node_id, args.node_capacity, args.cluster_token,
+            args.exit_with_coordinator
+        )
+    else:
+        from app.headless import run_headless
+
+        run_headless()
+    return 0
+
+
+if __name__ == "__main__" and any(flag in sys.argv[1:] for flag in ENGINE_ONLY_FLAGS):
+    load_dotenv()
+    multiprocessing.freeze_support()
+    sys.exit(run_engine_only(parse_args()))
+
+import flet as ft
 from screeninfo import get_monitors
 
 from app.app_manager import App, execute_dir
@@ -15,8 +94,6 @@ from app.ui.layout.responsive_layout import setup_responsive_layout
 from app.ui.views.login_view import LoginPage
 from app.utils.logger import logger
 
-DEFAULT_HOST = "127.0.0.1"
-DEFAULT_PORT = 6006
 WINDOW_SCALE = 0.65
 MIN_WIDTH = 950
 ASSETS_DIR = "assets"
@@ -97,6 +174,10 @@ def handle_disconnect(page: ft.Page, app: App) -> callable:
 
     async def disconnect(_: ft.ControlEvent) -> None:
         page.pubsub.unsubscribe_all()
+        app.record_card_manager.close()
+        app.record_manager.close()
+        if recordings_page := app.pages.get("recordings"):
+            recordings_page.close()
         app.settings.user_config["last_route"] = page.route
         await app.config_manager.save_user_config(app.settings.user_config)
         logger.info(f"Saved last route: {page.route}")
@@ -216,14 +297,7 @@ async def main(page: ft.Page) -> None:
 if __name__ == "__main__":
     load_dotenv()
     platform = os.getenv("PLATFORM")
-    default_host = os.getenv("HOST", DEFAULT_HOST)
-    default_port = int(os.getenv("PORT", DEFAULT_PORT))
-
-    parser = argparse.ArgumentParser(description="Run the Flet app with optional web mode.")
-    parser.add_argument("--web", action="store_true", help="Run the app in web mode")
-    parser.add_argument("--host", type=str, default=default_host, help=f"Host address (default: {default_host})")
-    parser.add_argument("--port", type=int, default=default_port, help=f"Port number (default: {default_port})")
-    args = parser.parse_args()
+    args = parse_args()
 
     multiprocessing.freeze_support()
     if args.web or platform == "web":
@@ -0,0 +1,133 @@
+import re
+import unittest
+
+from app.core.platforms.platform_handlers import get_platform_info
+from app.core.platforms.platform_handlers.base import PlatformHandler
+from app.core.platforms.platform_handlers.router import PLATFORM_INFO_TABLE
+
+# (url, handler class, platform, platform key), one or more URLs per supported platform.
+PLATFORM_CASES = [
+    ("https://live.douyin.com/745964462470", "DouyinHandler", "抖音直播", "douyin"),
+    ("https://v.douyin.com/iQFeBnt/", "DouyinHandler", "抖音直播", "douyin"),
+    ("https://www.douyin.com/root/live/745964462470", "DouyinHandler", "抖音直播", "douyin"),
+    ("https://www.tiktok.com/@pearlgaga88/live", "TikTokHandler", "TikTok直播", "tiktok"),
+    ("https://live.kuaishou.com/u/yall1102", "KuaishouHandler", "快手直播", "kuaishou"),
+    ("https://www.huya.com/116", "HuyaHandler", "虎牙直播", "huya"),
+    ("https://m.huya.com/116", "HuyaHandler", None, None),
+    ("https://www.douyu.com/topic/wzDBLS6?rid=4921614", "DouyuHandler", "斗鱼直播", "douyu"),
+    ("https://www.yy.com/22490906/22490906", "YYHandler", "YY直播", "yy"),
+    ("https://live.bilibili.com/320", "BilibiliHandler", "B站直播", "bilibili"),
+    ("https://www.xiaohongshu.com/user/profile/6330049c0000", "RedNoteHandler", "小红书直播", "xiaohongshu"),
+    ("http://xhslink.com/xpJpfM", "RedNoteHandler", "小红书直播", "xhs"),
+    ("https://www.bigo.tv/cameron_ohh", "BigoHandler", "Bigo直播", "bigo"),
+    ("https://slink.bigovideo.tv/uPvCVq", "BigoHandler", None, None),
+    ("https://app.blued.cn/live?id=Mp6G2R", "BluedHandler", "Blued直播", "blued"),
+    ("https://play.sooplive.co.kr/sw7love", "SoopHandler", "SOOP", "sooplive"),
+    ("https://www.sooplive.com/sw7love", "SoopHandler", "SOOP", "sooplive"),
+    ("https://cc.163.com/583946984", "NeteaseHandler", "网易CC直播", "netease"),
+    ("https://qiandurebo.com/web/video.php?roomnumber=33333", "QiandureboHandler", "千度热播", "qiandurebo"),
+    ("https://www.pandalive.co.kr/live/play/bara0109", "PamdaTVHandler", "PandaTV", "pandalive"),
+    ("https://fm.missevan.com/live/868895007", "MaoerFMHandler", "猫耳FM直播", "maoerfm"),
+    ("https://www.winktv.co.kr/live/play/anjer1004", "WinkTVHandler", "WinkTV", "winktv"),
+    ("https://www.flextv.co.kr/channels/593127/live", "FlexTVHandler", "FlexTV", "flextv"),
+    ("https://www.ttinglive.com/channels/52406/live", "FlexTVHandler", "FlexTV", "flextv"),
+    ("https://look.163.com/live?id=65108820&position=3", "LookHandler", "Look直播", "look"),
+    ("https://www.popkontv.com/live/view?castId=wjfal007", "PopkonTVHandler", "PopkonTV", "popkontv"),
+    ("https://twitcasting.tv/c:uonq", "TwitcastingHandler", "TwitCasting", "twitcasting"),
+    ("https://live.baidu.com/m/media/pclive/pchome/live.html?room_id=9175", "BaiduHandler", "百度直播", "baidu"),
+    ("https://weibo.com/l/wblive/p/show/1022:2321325026370190442592", "WeiboHandler", "微博直播", "weibo"),
+    ("https://fanxing2.kugou.com/50428671?refer=2177&sourceFrom=", "KugouHandler", "酷狗直播", "kugou"),
+    ("https://www.twitch.tv/gamerbee", "TwitchHandler", "TwitchTV", "twitch"),
+    ("https://www.liveme.com/zh/v/17141543493018047815/index.html", "LivemeHandler", "LiveMe", "liveme"),
+    ("https://www.huajiao.com/l/345096174", "HuajiaoHandler", "花椒直播", "huajiao"),
+    ("https://www.showroom-live.com/r/TPS0728", "ShowRoomHandlerHandler", "ShowRoom", "showroom"),
+    ("https://live.acfun.cn/live/17912421", "AcfunHandler", "Acfun", "acfun"),
+    ("https://www.inke.cn/liveroom/index.html?uid=22954469", "InkeHandler", "映客直播", "inke"),
+    ("https://live.ybw1666.com/800002949", "YinboHandler", "音播直播", "yingbo"),
+    ("https://www.tlclw.com/801044397", "ChangliaoHandler", "畅聊直播", "changliao"),
+    ("https://www.zhihu.com/people/ac3a467005c5d20381a82230101308e9", "ZhihuHandler", "知乎直播", "zhihu"),
+    ("https://chzzk.naver.com/live/458f6ec20b034f49e0fc6d03921646d2", "ChzzkHandler", "CHZZK", "chzzk"),
+    ("https://www.haixiutv.com/6095106", "HaixiuHandler", "嗨秀直播", "haixiu"),
+    ("https://h5webcdn-pro.vvxqiu.com//activity/videoShare.html?roomId=LP1159", "VVXQHandler", "VV星球", "vvxq"),
+    ("https://17.live/en/live/6302408", "YiqiLiveHandler", "17Live", "17live"),
+    ("https://www.lang.live/en-US/room/3349463", "LangLiveHandler", "浪Live", "lang"),
+    ("https://m.pp.weimipopo.com/live/preview.html?anchorUid=91625862", "PiaopiaoHandler", "漂漂直播", "piaopiao"),
+    ("https://v.6.cn/634435", "SixRoomHandler", "六间房直播", "6room"),
+    ("https://www.7u66.com/100960", None, "流星直播", "liuxing"),
+    ("https://www.lehaitv.com/8059096", "LehaiHandler", "乐嗨直播", "lehai"),
+    ("https://h.catshow168.com/live/preview.html?anchorUid=18895331", "HuamaoHandler", "花猫直播", "catshow"),
+    ("https://sg.shp.ee/GmpXeuf?uid=1006401066&session=802458", "ShopeeHandler", "shopee", "shopee"),
+    ("https://www.youtube.com/watch?v=cS6zS5hi1w0", "YoutubeHandler", "Youtube", "youtube"),
+    ("https://m.tb.cn/h.TWp0HTd", "TaobaoHandler", "淘宝直播", "taobao"),
+    ("https://tbzb.taobao.com/live?liveId=532359023188", "TaobaoHandler", "淘宝直播", "taobao"),
+    ("https://3.cn/28MLBy-E", "JDHandler", "京东直播", "jd"),
+    ("https://www.faceit.com/zh/players/Compl1/stream", "FaceitHandler", "faceit", "faceit"),
+    ("https://www.lailianjie.com/17621520", "LianJieHandler", "连接直播", "lianjie"),
+    ("https://www.miguvideo.com/p/live/120000541321", "MiguHandler", "咪咕直播", "migu"),
+    ("https://www.imkktv.com/h5/share/video.html?roomId=1710496", "LaixiuHandler", "来秀直播", "laixiu"),
+    ("https://www.picarto.tv/cuteavalanche", "PicartoHandler", "Picarto", "picarto"),
+    ("https://example.com/live/stream.m3u8?token=abc", "CustomHandler", "自定义录制直播", "custom"),
+    ("http://example.com/live/stream.flv", "CustomHandler", "自定义录制直播", "custom"),
+    ("https://live.shopee.co.id/share?from=live&session=802458", None, "shopee", "shopee"),
+]
+
+# Subdomains, hosts that only contain a platform's name, URLs quoted in the path or query, missing schemes.
+TRICKY_CASES = [
+    ("https://notdouyin.com/", None, "抖音直播", "douyin"),
+    ("https://douyin.com.evil.example/", None, None, None),
+    ("https://www.example.com/?u=https://live.bilibili.com/1", "BilibiliHandler", "B站直播", "bilibili"),
+    ("https://www.example.com/twitch.tv/x", None, "TwitchTV", "twitch"),
+    ("https://m.live.kuaishou.com/u/abc", None, None, None),
+    ("https://live.douyin.com/123?x=.flv", "CustomHandler", "抖音直播", "douyin"),
+    ("https://LIVE.BILIBILI.COM/1", None, None, None),
+    ("live.bilibili.com/320", None, None, None),
+    ("https://sub.3.cn/abc", "JDHandler", "京东直播", "jd"),
+    ("https://www.163.com/cc.163.com/x", "NeteaseHandler", "网易CC直播", "netease"),
+    ("https://v.6.cn.example.com/1", None, None, None),
+    ("https://x.tb.cn/", "TaobaoHandler", "淘宝直播", "taobao"),
+    ("https://example.com/video.m3u8", "CustomHandler", "自定义录制直播", "custom"),
+    ("https://cc.163.com/?from=douyin.com/x", "NeteaseHandler", "抖音直播", "douyin"),
+]
+
+
+def legacy_handler_class(url: str):
+    """The lookup the router replaced: the first registered pattern found anywhere in the URL."""
+    for pattern, handler_class in PlatformHandler.get_registered_patterns().items():
+        if re.search(pattern, url):
+            return handler_class
+    return None
+
+
+def legacy_platform_info(url: str) -> tuple:
+    """The lookup the router replaced: the first table key that is a substring of the URL."""
+    for key, platform, platform_key in PLATFORM_INFO_TABLE:
+        if key in url:
+            return platform, platform_key
+    return None, None
+
+
+class PlatformRouterTest(unittest.TestCase):
+    def assert_routes(self, cases):
+        for url, handler_name, platform, platform_key in cases:
+            with self.subTest(url=url):
+                route = PlatformHandler.resolve_route(url)
+                handler_class = route.handler_class
+                assert (handler_class.__name__ if handler_class else None) == handler_name
+                assert (route.platform, route.platform_key) == (platform, platform_key)
+                assert get_platform_info(url) == (platform, platform_key)
+                assert handler_class is legacy_handler_class(url)
+                assert (platform, platform_key) == legacy_platform_info(url)
+
+    def test_every_platform(self):
+        self.assert_routes(PLATFORM_CASES)
+
+    def test_tricky_urls(self):
+        self.assert_routes(TRICKY_CASES)
+
+    def test_every_platform_info_entry_is_covered(self):
+        covered = {platform_key for _, _, _, platform_key in PLATFORM_CASES}
+        assert {platform_key for _, _, platform_key in PLATFORM_INFO_TABLE} - covered == set()
+
+
+if __name__ == "__main__":
+    unittest.main()
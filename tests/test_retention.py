@@ -0,0 +1,229 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from app.core.storage.disk_monitor import GB, DiskMonitor, VolumeState
+from app.core.storage.retention import INDEX_FILE, RetentionEngine, guessed_owner
+from app.core.storage.tiering import StorageTiering
+
+DAY = 86400
+
+
+def write(root: str, relative: str, age: float, size: int = 4) -> str:
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def make_engine(roots: list[str], rules: str, owners=(), reclaim: bool = False) -> RetentionEngine:
+    disk_monitor = DiskMonitor()
+    engine = RetentionEngine(disk_monitor, StorageTiering(disk_monitor))
+    engine.configure(True, True, rules, reclaim, 1800, roots)
+    engine.index.refresh(roots, list(owners))
+    return engine
+
+
+def planned_names(planned) -> set[str]:
+    return {os.path.basename(item.entry.path) for item in planned}
+
+
+def watch(engine: RetentionEngine, path: str, disk: str, free: int = 0) -> VolumeState:
+    volume = VolumeState(disk, path, total=100 * GB, free=free, sampled_at=time.time())
+    engine.disk_monitor._roots[os.path.abspath(path)] = volume
+    return volume
+
+
+class RetentionTestCase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.tmp_path = temp_dir.name
+        self.root = os.path.join(self.tmp_path, "downloads")
+        os.makedirs(self.root)
+
+
+class RetentionRulesTest(RetentionTestCase):
+    def test_most_specific_rule_wins(self):
+        owners = [("douyin", "alice", None), ("douyin", "bob", None), ("kuaishou", "carol", None)]
+        write(self.root, "alice_2024-01-01_10-00-00.ts", 10 * DAY)
+        write(self.root, "bob_2024-01-01_10-00-00.ts", 10 * DAY)
+        write(self.root, "carol_2024-01-01_10-00-00.ts", 10 * DAY)
+        rules = "*: days=1\ndouyin: days=100\ndouyin/alice: days=5"
+        engine = make_engine([self.root], rules, owners)
+
+        assert planned_names(engine.plan_rules()) == {"alice_2024-01-01_10-00-00.ts", "carol_2024-01-01_10-00-00.ts"}
+
+    def test_sessions_keep_whole_runs_per_streamer(self):
+        owners = [("douyin", "alice", None), ("douyin", "bob", None)]
+        write(self.root, "alice_2024-01-01_10-00-00_000.ts", 5 * DAY)
+        write(self.root, "alice_2024-01-01_10-00-00_001.ts", 5 * DAY - 60)
+        write(self.root, "alice_2024-01-02_10-00-00_000.ts", 4 * DAY)
+        write(self.root, "alice_2024-01-02_10-00-00_001.ts", 4 * DAY - 60)
+        write(self.root, "bob_2024-01-01_10-00-00.ts", 5 * DAY)
+        engine = make_engine([self.root], "*: sessions=1", owners)
+
+        assert planned_names(engine.plan_rules()) == {
+            "alice_2024-01-01_10-00-00_000.ts", "alice_2024-01-01_10-00-00_001.ts"
+        }
+
+    def test_sessions_group_unattributed_files_by_their_name(self):
+        write(self.root, "carol_2024-01-01_10-00-00.ts", 5 * DAY)
+        write(self.root, "dave_2024-01-01_10-00-00.ts", 4 * DAY)
+        write(self.root, "erin_2024-01-01_10-00-00.ts", 3 * DAY)
+        write(self.root, "erin_2024-01-02_10-00-00.ts", 2 * DAY)
+        engine = make_engine([self.root], "*: sessions=1")
+
+        assert planned_names(engine.plan_rules()) == {"erin_2024-01-01_10-00-00.ts"}
+
+    def test_files_without_an_owner_only_follow_days(self):
+        write(self.root, "2024-01-01_10-00-00.ts", 5 * DAY)
+        write(self.root, "2024-01-02_10-00-00.ts", 4 * DAY)
+        assert guessed_owner(os.path.join(self.root, "2024-01-01_10-00-00.ts"), [self.root]) is None
+
+        engine = make_engine([self.root], "*: sessions=1 max_gb=0.000000001")
+        assert engine.plan_rules() == []
+
+        engine = make_engine([self.root], "*: days=4.5 sessions=1")
+        assert planned_names(engine.plan_rules()) == {"2024-01-01_10-00-00.ts"}
+
+    def test_unattributed_files_are_grouped_by_folder_without_a_name(self):
+        write(self.root, "frank/2024-01-01/2024-01-01_10-00-00.ts", 5 * DAY)
+        write(self.root, "frank/2024-01-02/2024-01-02_10-00-00.ts", 4 * DAY)
+        write(self.root, "gina/2024-01-01/2024-01-01_10-00-00.ts", 3 * DAY)
+        engine = make_engine([self.root], "*: sessions=1")
+
+        planned = engine.plan_rules()
+        assert [os.path.relpath(item.entry.path, self.root) for item in planned] == [
+            os.path.join("frank", "2024-01-01", "2024-01-01_10-00-00.ts")
+        ]
+
+    def test_files_in_a_recording_folder_belong_to_it(self):
+        folder = os.path.join(self.root, "douyin", "alice")
+        owners = [("douyin", "alice", folder)]
+        write(self.root, "douyin/alice/live_2024-01-01_10-00-00.ts", 5 * DAY)
+        engine = make_engine([self.root], "douyin/alice: days=1", owners)
+
+        [item] = engine.plan_rules()
+        assert (item.entry.platform, item.entry.streamer) == ("douyin", "alice")
+
+    def test_max_gb_keeps_the_newest_files(self):
+        owners = [("douyin", "alice", None)]
+        for day in range(4):
+            write(self.root, f"alice_2024-01-0{day + 1}_10-00-00.ts", (5 - day) * DAY, size=4)
+        # 10 bytes: the two newest files (8 bytes) fit, the third would not.
+        engine = make_engine([self.root], f"douyin: max_gb={10 / GB!r}", owners)
+
+        assert planned_names(engine.plan_rules()) == {"alice_2024-01-01_10-00-00.ts", "alice_2024-01-02_10-00-00.ts"}
+
+    def test_recently_written_files_are_never_deleted(self):
+        owners = [("douyin", "alice", None)]
+        write(self.root, "alice_2024-01-01_10-00-00.ts", 1800)
+        write(self.root, "alice_2024-01-02_10-00-00.ts", 600)
+        write(self.root, "alice_2024-01-03_10-00-00.ts", 60)
+        engine = make_engine([self.root], "*: sessions=1 days=0", owners)
+
+        assert engine.plan_rules() == []
+
+
+class RetentionReclaimTest(RetentionTestCase):
+    def test_reclaim_deletes_the_oldest_unprotected_files(self):
+        owners = [("douyin", "alice", None), ("douyin", "bob", None)]
+        write(self.root, "alice_2024-01-01_10-00-00.ts", 6 * DAY)
+        write(self.root, "bob_2024-01-01_10-00-00.ts", 5 * DAY)
+        write(self.root, "bob_2024-01-02_10-00-00.ts", 4 * DAY)
+        write(self.root, "bob_2024-01-03_10-00-00.ts", 3 * DAY)
+        engine = make_engine([self.root], "douyin/alice: protect", owners, reclaim=True)
+        # Short of 5 bytes: two 4 byte files have to go.
+        watch(engine, self.root, "disk-a", free=int(engine.RECLAIM_MARGIN) - 5)
+
+        assert [os.path.basename(item.entry.path) for item in engine.plan_reclaim([])] == [
+            "bob_2024-01-01_10-00-00.ts", "bob_2024-01-02_10-00-00.ts"
+        ]
+
+    def test_reclaim_skips_files_waiting_for_tiering(self):
+        cold_root = os.path.join(self.tmp_path, "cold")
+        os.makedirs(cold_root)
+        write(self.root, "alice_2024-01-01_10-00-00.ts", 5 * DAY)
+        engine = make_engine([self.root], "", [("douyin", "alice", None)], reclaim=True)
+        engine.storage_tiering.configure(True, [self.root], cold_root, 600, 0, True)
+        watch(engine, self.root, "disk-a")
+        watch(engine, cold_root, "disk-b", free=100 * GB)
+        assert engine.plan_reclaim([]) == []
+
+        # On the same volume moving it frees nothing.
+        watch(engine, cold_root, "disk-a")
+        assert len(engine.plan_reclaim([])) == 1
+
+
+class RetentionReportTest(RetentionTestCase):
+    def test_dry_run_report_writes_nothing(self):
+        config_path = os.path.join(self.tmp_path, "config")
+        os.makedirs(config_path)
+        write(self.root, "alice_2024-01-01_10-00-00.ts", 5 * DAY)
+        disk_monitor = DiskMonitor()
+        engine = RetentionEngine(disk_monitor, StorageTiering(disk_monitor))
+        engine.configure(False, True, "*: days=1", False, 1800, [self.root])
+
+        async def build_report():
+            report = await engine.dry_run_report(config_path, list)
+            for volume in disk_monitor._volumes.values():
+                volume.task.cancel()
+            return report
+
+        report = asyncio.run(build_report())
+        assert [os.path.basename(item["path"]) for item in report["deletions"]] == ["alice_2024-01-01_10-00-00.ts"]
+        assert not os.path.exists(os.path.join(config_path, INDEX_FILE))
+        assert os.path.exists(os.path.join(self.root, "alice_2024-01-01_10-00-00.ts"))
+
+
+
+class RetentionReconfigureTest(RetentionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.recording = write(self.root, "alice_2024-01-01_10-00-00.ts", 10 * DAY)
+        disk_monitor = DiskMonitor()
+        self.engine = RetentionEngine(disk_monitor, StorageTiering(disk_monitor))
+        self.engine.configure(True, False, "*: days=30", False, 1800, [self.root])
+
+    async def stop(self):
+        if self.engine._task is not None:
+            self.engine._task.cancel()
+        for volume in self.engine.disk_monitor._volumes.values():
+            volume.task.cancel()
+
+    def test_configure_then_partial_pass_does_not_apply_the_rules(self):
+        async def reconfigure():
+            self.engine.configure(True, False, "*: days=3", False, 1800, [self.root])
+            planned = await self.engine.run_once(full_pass=False)
+            await self.stop()
+            return planned
+
+        assert asyncio.run(reconfigure()) == []
+        assert os.path.exists(self.recording)
+
+    def test_reconfiguring_alone_deletes_nothing(self):
+        config_path = os.path.join(self.tmp_path, "config")
+        os.makedirs(config_path)
+
+        async def edit_rules():
+            self.engine.start(config_path, list)
+            while not os.path.exists(self.engine.report_path):
+                await asyncio.sleep(0.01)
+            # What typing "*: days=30" into "*: days=3" would apply keystroke by keystroke.
+            for rules in ("*: days=3", "*: days=", "*: days=30"):
+                self.engine.configure(True, False, rules, False, 1800, [self.root])
+                await asyncio.sleep(0.05)
+            await self.stop()
+
+        asyncio.run(edit_rules())
+        assert os.path.exists(self.recording)
+
+
+if __name__ == "__main__":
+    unittest.main()
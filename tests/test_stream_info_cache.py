@@ -0,0 +1,137 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from app.core.platforms.stream_info_cache import StreamInfoCache
+
+URL = "https://live.douyin.com/745964462470"
+
+
+def stream_info(is_live: bool = True, anchor_name: str = "anchor") -> SimpleNamespace:
+    return SimpleNamespace(anchor_name=anchor_name, is_live=is_live)
+
+
+class CountingFetcher:
+    """A fetcher that counts its calls and only returns once ``release`` is set."""
+
+    def __init__(self, result=None, error: Exception | None = None):
+        self.result = result if result is not None else stream_info()
+        self.error = error
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class StreamInfoCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = StreamInfoCache(live_ttl=0.1, offline_ttl=0.5)
+        self.key = StreamInfoCache.make_key(URL, "OD")
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        fetcher = CountingFetcher()
+        callers = [asyncio.create_task(self.cache.get_or_fetch(self.key, fetcher)) for _ in range(5)]
+        await fetcher.started.wait()
+        fetcher.release.set()
+
+        results = await asyncio.gather(*callers)
+        assert fetcher.calls == 1
+        assert all(result.anchor_name == "anchor" for result in results)
+        assert self.cache.stats()["coalesced"] == 4
+
+    async def test_waiters_fetch_again_when_the_leader_is_cancelled(self):
+        first = CountingFetcher()
+        leader = asyncio.create_task(self.cache.get_or_fetch(self.key, first))
+        await first.started.wait()
+        second = CountingFetcher()
+        waiters = [asyncio.create_task(self.cache.get_or_fetch(self.key, second)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await second.started.wait()
+        second.release.set()
+
+        results = await asyncio.gather(*waiters)
+        assert leader.cancelled()
+        assert second.calls == 1
+        assert all(result.anchor_name == "anchor" for result in results)
+
+    async def test_errors_reach_every_waiter_and_are_not_cached(self):
+        fetcher = CountingFetcher(error=ValueError("resolve failed"))
+        callers = [asyncio.create_task(self.cache.get_or_fetch(self.key, fetcher)) for _ in range(3)]
+        await fetcher.started.wait()
+        fetcher.release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert fetcher.calls == 1
+
+        retry = CountingFetcher()
+        retry.release.set()
+        await self.cache.get_or_fetch(self.key, retry)
+        assert retry.calls == 1
+
+    async def test_failed_lookups_are_not_cached(self):
+        empty = CountingFetcher(result=stream_info(anchor_name=""))
+        empty.release.set()
+        await self.cache.get_or_fetch(self.key, empty)
+        await self.cache.get_or_fetch(self.key, empty)
+        assert empty.calls == 2
+        assert self.cache.stats()["size"] == 0
+
+    async def test_live_results_expire_before_offline_results(self):
+        live_key = StreamInfoCache.make_key(URL, "OD")
+        offline_key = StreamInfoCache.make_key("https://live.bilibili.com/320", "OD")
+        live = CountingFetcher(result=stream_info(is_live=True))
+        offline = CountingFetcher(result=stream_info(is_live=False))
+        live.release.set()
+        offline.release.set()
+
+        await self.cache.get_or_fetch(live_key, live)
+        await self.cache.get_or_fetch(offline_key, offline)
+        await self.cache.get_or_fetch(live_key, live)
+        await self.cache.get_or_fetch(offline_key, offline)
+        assert (live.calls, offline.calls) == (1, 1)
+
+        await asyncio.sleep(0.2)
+        await self.cache.get_or_fetch(live_key, live)
+        await self.cache.get_or_fetch(offline_key, offline)
+        assert (live.calls, offline.calls) == (2, 1)
+
+        await asyncio.sleep(0.4)
+        await self.cache.get_or_fetch(offline_key, offline)
+        assert offline.calls == 2
+
+    async def test_proxy_and_credentials_do_not_share_entries(self):
+        keys = [
+            StreamInfoCache.make_key(URL, "OD"),
+            StreamInfoCache.make_key(URL, "OD", "http://127.0.0.1:7890"),
+            StreamInfoCache.make_key(URL, "OD", None, "sessionid=account-a"),
+            StreamInfoCache.make_key(URL, "OD", None, "sessionid=account-b"),
+            StreamInfoCache.make_key(URL, "OD", None, None, {"username": "a", "password": "secret"}),
+        ]
+        assert len(set(keys)) == len(keys)
+        assert all("account-a" not in repr(key) and "secret" not in repr(key) for key in keys)
+        assert StreamInfoCache.make_key(f" {URL} ", "OD", None, "sessionid=account-a") == keys[2]
+
+        fetchers = []
+        for index, key in enumerate(keys):
+            fetcher = CountingFetcher(result=stream_info(anchor_name=f"anchor-{index}"))
+            fetcher.release.set()
+            fetchers.append(fetcher)
+            assert (await self.cache.get_or_fetch(key, fetcher)).anchor_name == f"anchor-{index}"
+        assert all(fetcher.calls == 1 for fetcher in fetchers)
+
+        self.cache.invalidate(URL)
+        assert self.cache.stats()["size"] == 0
+
+
+if __name__ == "__main__":
+    unittest.main()